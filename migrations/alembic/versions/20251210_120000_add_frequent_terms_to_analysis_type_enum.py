@@ -28,7 +28,7 @@ def downgrade() -> None:
     Note: PostgreSQL does not support removing enum values directly.
     This would require recreating the enum type, which is complex and
     may require data migration. For now, we'll leave it as a no-op.
-    
+    """
     # PostgreSQL doesn't support removing enum values easily
     # This would require recreating the enum and migrating data
     pass
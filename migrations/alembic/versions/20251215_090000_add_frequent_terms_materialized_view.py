@@ -0,0 +1,44 @@
+"""add frequent terms materialized view
+
+Revision ID: add_frequent_terms_view
+Revises: make_scraping_result_id_nullable
+Create Date: 2025-12-15 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_frequent_terms_view'
+down_revision = 'make_scraping_result_id_nullable'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the frequent_terms materialized view and its unique index.
+
+    The unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY.
+    """
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS frequent_terms AS
+        SELECT keyword,
+               analysis_type,
+               SUM(frequency)::bigint AS total_frequency,
+               COUNT(*)::bigint AS document_count
+        FROM analysis_results
+        WHERE keyword IS NOT NULL
+        GROUP BY keyword, analysis_type
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_frequent_terms_keyword_type "
+        "ON frequent_terms (keyword, analysis_type)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the frequent_terms materialized view (drops its index too)."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS frequent_terms")
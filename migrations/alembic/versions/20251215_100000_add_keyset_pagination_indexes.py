@@ -0,0 +1,34 @@
+"""add keyset pagination indexes
+
+Revision ID: add_keyset_pagination_indexes
+Revises: add_frequent_terms_view
+Create Date: 2025-12-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_keyset_pagination_indexes'
+down_revision = 'add_frequent_terms_view'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add (timestamp DESC, id DESC) indexes used by keyset pagination."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_analysis_results_created_at_id "
+        "ON analysis_results (created_at DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_scraping_results_scraped_at_id "
+        "ON scraping_results (scraped_at DESC, id DESC)"
+    )
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes."""
+    op.execute("DROP INDEX IF EXISTS ix_scraping_results_scraped_at_id")
+    op.execute("DROP INDEX IF EXISTS ix_analysis_results_created_at_id")
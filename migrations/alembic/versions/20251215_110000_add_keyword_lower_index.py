@@ -0,0 +1,29 @@
+"""add lower(keyword) index
+
+Revision ID: add_keyword_lower_index
+Revises: add_keyset_pagination_indexes
+Create Date: 2025-12-15 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_keyword_lower_index'
+down_revision = 'add_keyset_pagination_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index lower(keyword) so case-insensitive keyword filters can seek."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_analysis_keyword_lower "
+        "ON analysis_results (lower(keyword))"
+    )
+
+
+def downgrade() -> None:
+    """Drop lower(keyword) index."""
+    op.execute("DROP INDEX IF EXISTS ix_analysis_keyword_lower")
@@ -0,0 +1,29 @@
+"""add frequent terms rank index
+
+Revision ID: add_frequent_terms_rank_index
+Revises: add_keyword_lower_index
+Create Date: 2025-12-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_frequent_terms_rank_index'
+down_revision = 'add_keyword_lower_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index frequent_terms for per-type top-k reads ordered by frequency."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_frequent_terms_type_total "
+        "ON frequent_terms (analysis_type, total_frequency DESC)"
+    )
+
+
+def downgrade() -> None:
+    """Drop frequent_terms rank index."""
+    op.execute("DROP INDEX IF EXISTS ix_frequent_terms_type_total")
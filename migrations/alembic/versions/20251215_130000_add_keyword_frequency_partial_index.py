@@ -0,0 +1,35 @@
+"""add keyword frequency partial index
+
+Revision ID: add_keyword_frequency_index
+Revises: add_frequent_terms_rank_index
+Create Date: 2025-12-15 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_keyword_frequency_index'
+down_revision = 'add_frequent_terms_rank_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a covering partial index for keyword frequency aggregation.
+
+    Covers (keyword, analysis_type) plus frequency for rows with a keyword,
+    so the frequent terms aggregation can run as an index-only scan.
+    """
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_analysis_kw_freq "
+        "ON analysis_results (keyword, analysis_type) INCLUDE (frequency) "
+        "WHERE keyword IS NOT NULL"
+    )
+    op.execute("ANALYZE analysis_results")
+
+
+def downgrade() -> None:
+    """Drop keyword frequency partial index."""
+    op.execute("DROP INDEX IF EXISTS ix_analysis_kw_freq")
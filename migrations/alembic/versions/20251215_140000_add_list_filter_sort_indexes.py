@@ -0,0 +1,40 @@
+"""add list filter/sort indexes
+
+Revision ID: add_list_filter_sort_indexes
+Revises: add_keyword_frequency_index
+Create Date: 2025-12-15 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_list_filter_sort_indexes'
+down_revision = 'add_keyword_frequency_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add composite indexes matching the filtered, newest-first list queries.
+
+    Filtering on the leading columns then reading in (created_at, id) or
+    (scraped_at, id) order removes the sort step from paginated lists.
+    """
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_analysis_filter_sort "
+        "ON analysis_results (analysis_type, scraping_result_id, created_at DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_scraping_source_sort "
+        "ON scraping_results (source_type, scraped_at DESC, id DESC)"
+    )
+    op.execute("ANALYZE analysis_results")
+    op.execute("ANALYZE scraping_results")
+
+
+def downgrade() -> None:
+    """Drop list filter/sort indexes."""
+    op.execute("DROP INDEX IF EXISTS ix_scraping_source_sort")
+    op.execute("DROP INDEX IF EXISTS ix_analysis_filter_sort")
@@ -0,0 +1,42 @@
+"""scope external_id uniqueness to source_type
+
+Revision ID: scope_external_id_to_source
+Revises: add_list_filter_sort_indexes
+Create Date: 2025-12-15 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'scope_external_id_to_source'
+down_revision = 'add_list_filter_sort_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Make (external_id, source_type) the deduplication key.
+
+    External IDs are only unique within their source. The composite unique
+    index is the ON CONFLICT target for bulk inserts and also serves the
+    external_id lookups the old single-column index covered.
+    """
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_scraping_results_external_id_source_type "
+        "ON scraping_results (external_id, source_type)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_scraping_results_external_id")
+
+
+def downgrade() -> None:
+    """Restore global external_id uniqueness.
+
+    Fails if the same external_id has since been stored for two sources.
+    """
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_scraping_results_external_id "
+        "ON scraping_results (external_id)"
+    )
+    op.execute("DROP INDEX IF EXISTS uq_scraping_results_external_id_source_type")
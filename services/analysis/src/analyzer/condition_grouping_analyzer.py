@@ -1,6 +1,5 @@
 """Condition grouping analyzer implementation."""
 
-import uuid
 from datetime import datetime, timezone
 from typing import List, Set
 
@@ -10,6 +9,7 @@ from services.analysis.src.errors.analysis_errors import AnalysisError
 from services.scraper.src.models.scraping_result_dto import ScrapingResultDTO
 from shared.logging.logger_interface import LoggerInterface
 from shared.types.enums import AnalysisType, SourceType
+from shared.utils.ids import uuid7
 
 
 class ConditionGroupingAnalyzer(AnalyzerInterface):
@@ -46,7 +46,7 @@ class ConditionGroupingAnalyzer(AnalyzerInterface):
             AnalysisError: If analysis fails
         """
         try:
-            await self._logger.debug(
+            self._logger.debug(
                 f"Starting condition grouping analysis for: {scraping_result.id}"
             )
 
@@ -62,12 +62,13 @@ class ConditionGroupingAnalyzer(AnalyzerInterface):
                     scraping_result
                 )
 
-            # Create analysis results
+            # Create analysis results, stamped once for the whole set
             results: List[AnalysisResultDTO] = []
+            created_at = datetime.now(timezone.utc)
 
             for condition in found_conditions:
                 result = AnalysisResultDTO(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     scraping_result_id=scraping_result.id,
                     analysis_type=AnalysisType.CONDITION_GROUPING,
                     keyword=condition,
@@ -77,11 +78,11 @@ class ConditionGroupingAnalyzer(AnalyzerInterface):
                         "title": scraping_result.title,
                         "grouped_by": "condition",
                     },
-                    created_at=datetime.now(timezone.utc),
+                    created_at=created_at,
                 )
                 results.append(result)
 
-            await self._logger.debug(
+            self._logger.debug(
                 f"Condition grouping completed: {len(results)} conditions found"
             )
 
@@ -89,7 +90,7 @@ class ConditionGroupingAnalyzer(AnalyzerInterface):
 
         except Exception as e:
             error_msg = f"Condition grouping analysis failed: {str(e)}"
-            await self._logger.error(error_msg, extra={"error": str(e)})
+            self._logger.error(error_msg, extra={"error": str(e)})
             raise AnalysisError(
                 message=error_msg,
                 error_code="CONDITION_GROUPING_FAILED",
@@ -1,6 +1,5 @@
 """Frequency analyzer implementation."""
 
-import uuid
 from datetime import datetime, timezone
 from typing import List, Dict
 from collections import Counter
@@ -12,6 +11,7 @@ from services.scraper.src.models.scraping_result_dto import ScrapingResultDTO
 from shared.constants import Limits
 from shared.logging.logger_interface import LoggerInterface
 from shared.types.enums import AnalysisType
+from shared.utils.ids import uuid7
 
 
 class FrequencyAnalyzer(AnalyzerInterface):
@@ -44,7 +44,7 @@ class FrequencyAnalyzer(AnalyzerInterface):
             FrequencyAnalysisError: If analysis fails
         """
         try:
-            await self._logger.debug(
+            self._logger.debug(
                 f"Starting frequency analysis for scraping result: {scraping_result.id}"
             )
 
@@ -54,15 +54,16 @@ class FrequencyAnalyzer(AnalyzerInterface):
             # Count frequencies
             term_counts = Counter(terms)
 
-            # Create analysis results
+            # Create analysis results, stamped once for the whole set
             results: List[AnalysisResultDTO] = []
+            created_at = datetime.now(timezone.utc)
 
             # Get top terms
             top_terms = term_counts.most_common(Limits.ANALYSIS_BATCH_SIZE)
 
             for term, frequency in top_terms:
                 result = AnalysisResultDTO(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     scraping_result_id=scraping_result.id,
                     analysis_type=AnalysisType.KEYWORD_FREQUENCY,  # Using same type
                     keyword=term,
@@ -71,11 +72,11 @@ class FrequencyAnalyzer(AnalyzerInterface):
                         "source_type": scraping_result.source_type.value,
                         "title": scraping_result.title,
                     },
-                    created_at=datetime.now(timezone.utc),
+                    created_at=created_at,
                 )
                 results.append(result)
 
-            await self._logger.debug(
+            self._logger.debug(
                 f"Frequency analysis completed: {len(results)} terms found"
             )
 
@@ -83,7 +84,7 @@ class FrequencyAnalyzer(AnalyzerInterface):
 
         except Exception as e:
             error_msg = f"Frequency analysis failed: {str(e)}"
-            await self._logger.error(error_msg, extra={"error": str(e)})
+            self._logger.error(error_msg, extra={"error": str(e)})
             raise FrequencyAnalysisError(
                 message=error_msg,
                 error_code="FREQUENCY_ANALYSIS_FAILED",
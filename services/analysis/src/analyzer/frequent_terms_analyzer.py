@@ -5,7 +5,6 @@ to identify the globally most frequent terms and stores them as FREQUENT_TERMS
 analysis results.
 """
 
-import uuid
 from datetime import datetime, timezone
 from typing import List
 
@@ -18,6 +17,7 @@ from services.analysis.src.repository.analysis_repository_interface import (
 from shared.logging.logger_interface import LoggerInterface
 from shared.types.enums import AnalysisType
 from shared.constants import Limits
+from shared.utils.ids import uuid7
 
 
 class FrequentTermsAnalyzer(AnalyzerInterface):
@@ -63,19 +63,20 @@ class FrequentTermsAnalyzer(AnalyzerInterface):
             AnalysisError: If analysis fails
         """
         try:
-            await self._logger.debug("Starting frequent terms analysis (global aggregation)")
+            self._logger.debug("Starting frequent terms analysis (global aggregation)")
 
             # Get aggregated most frequent terms from KEYWORD_FREQUENCY records
             aggregated_terms = await self._analysis_repo.get_most_frequent_terms(
                 limit=self._limit, analysis_type=AnalysisType.KEYWORD_FREQUENCY
             )
 
-            # Create analysis results
+            # Create analysis results, stamped once for the whole set
             results: List[AnalysisResultDTO] = []
+            created_at = datetime.now(timezone.utc)
 
             for term_data in aggregated_terms:
                 result = AnalysisResultDTO(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     scraping_result_id=None,  # Global aggregation, not tied to a specific document
                     analysis_type=AnalysisType.FREQUENT_TERMS,
                     keyword=term_data["keyword"],
@@ -85,11 +86,11 @@ class FrequentTermsAnalyzer(AnalyzerInterface):
                         "aggregated_from": AnalysisType.KEYWORD_FREQUENCY.value,
                         "rank": len(results) + 1,
                     },
-                    created_at=datetime.now(timezone.utc),
+                    created_at=created_at,
                 )
                 results.append(result)
 
-            await self._logger.debug(
+            self._logger.debug(
                 f"Frequent terms analysis completed: {len(results)} terms identified"
             )
 
@@ -97,7 +98,7 @@ class FrequentTermsAnalyzer(AnalyzerInterface):
 
         except Exception as e:
             error_msg = f"Frequent terms analysis failed: {str(e)}"
-            await self._logger.error(error_msg, extra={"error": str(e)})
+            self._logger.error(error_msg, extra={"error": str(e)})
             raise AnalysisError(
                 message=error_msg,
                 error_code="FREQUENT_TERMS_FAILED",
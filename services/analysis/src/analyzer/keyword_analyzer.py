@@ -1,7 +1,6 @@
 """Keyword analyzer implementation."""
 
 import re
-import uuid
 from datetime import datetime, timezone
 from typing import List, Dict
 from collections import Counter
@@ -14,7 +13,8 @@ from shared.constants import Limits
 from shared.logging.logger_interface import LoggerInterface
 from shared.types.enums import AnalysisType
 from shared.utils.stop_words import get_stop_words
-from shared.utils.text_extractor import extract_all_text
+from shared.utils.text_extractor import extract_text_parts
+from shared.utils.ids import uuid7
 
 
 class KeywordAnalyzer(AnalyzerInterface):
@@ -52,7 +52,7 @@ class KeywordAnalyzer(AnalyzerInterface):
             KeywordAnalysisError: If analysis fails
         """
         try:
-            await self._logger.debug(
+            self._logger.debug(
                 f"Starting keyword analysis for scraping result: {scraping_result.id}"
             )
 
@@ -61,18 +61,21 @@ class KeywordAnalyzer(AnalyzerInterface):
             if scraping_result.title:
                 text_parts.append(scraping_result.title)
             if scraping_result.data:
-                text_parts.append(extract_all_text(scraping_result.data))
+                # Single join over all parts; joining the data text first and
+                # then again with the title would copy the document twice
+                text_parts.extend(extract_text_parts(scraping_result.data))
             text = " ".join(text_parts)
 
             # Extract keywords and count frequencies
             keyword_counts = self._extract_keyword_frequencies(text)
 
-            # Create analysis results
+            # Create analysis results, stamped once for the whole set
             results: List[AnalysisResultDTO] = []
+            created_at = datetime.now(timezone.utc)
 
             for keyword, frequency in keyword_counts.items():
                 result = AnalysisResultDTO(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     scraping_result_id=scraping_result.id,
                     analysis_type=AnalysisType.KEYWORD_FREQUENCY,
                     keyword=keyword,
@@ -81,11 +84,11 @@ class KeywordAnalyzer(AnalyzerInterface):
                         "source_type": scraping_result.source_type.value,
                         "title": scraping_result.title,
                     },
-                    created_at=datetime.now(timezone.utc),
+                    created_at=created_at,
                 )
                 results.append(result)
 
-            await self._logger.debug(
+            self._logger.debug(
                 f"Keyword analysis completed: {len(results)} keywords found"
             )
 
@@ -93,7 +96,7 @@ class KeywordAnalyzer(AnalyzerInterface):
 
         except Exception as e:
             error_msg = f"Keyword analysis failed: {str(e)}"
-            await self._logger.error(error_msg, extra={"error": str(e)})
+            self._logger.error(error_msg, extra={"error": str(e)})
             raise KeywordAnalysisError(
                 message=error_msg,
                 error_code="KEYWORD_ANALYSIS_FAILED",
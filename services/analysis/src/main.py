@@ -2,7 +2,6 @@
 
 import asyncio
 import signal
-import uuid
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -23,6 +22,7 @@ from shared.database.engine_factory import create_database_engine
 from shared.logging.logger_factory import LoggerFactory
 from shared.logging.logger_interface import LoggerInterface
 from shared.types.enums import AnalysisType
+from shared.utils.ids import uuid7
 
 
 class AnalysisService:
@@ -47,7 +47,7 @@ class AnalysisService:
 
     async def run_analysis_task(self) -> None:
         """Execute the analysis task for all analysis types."""
-        await self._logger.info("Starting analysis task")
+        self._logger.info("Starting analysis task")
 
         # Per-document analysis types
         per_document_analysis_types = [
@@ -61,7 +61,7 @@ class AnalysisService:
             try:
                 await self._analyze_unprocessed(analysis_type)
             except Exception as e:
-                await self._logger.error(
+                self._logger.error(
                     f"Failed to analyze with {analysis_type.value}: {str(e)}",
                     extra={"analysis_type": analysis_type.value, "error": str(e)},
                 )
@@ -71,12 +71,22 @@ class AnalysisService:
         try:
             await self._analyze_frequent_terms()
         except Exception as e:
-            await self._logger.error(
+            self._logger.error(
                 f"Failed to analyze FREQUENT_TERMS: {str(e)}",
                 extra={"analysis_type": "FREQUENT_TERMS", "error": str(e)},
             )
 
-        await self._logger.info("Analysis task completed")
+        # Publish this run's results to the API's aggregate view right away
+        # instead of waiting for its periodic refresh
+        try:
+            await self._refresh_frequent_terms_view()
+        except Exception as e:
+            self._logger.error(
+                f"Failed to refresh frequent terms view: {str(e)}",
+                extra={"error": str(e)},
+            )
+
+        self._logger.info("Analysis task completed")
 
     async def _analyze_unprocessed(self, analysis_type: AnalysisType) -> None:
         """Analyze unprocessed scraping results for a specific analysis type.
@@ -84,7 +94,7 @@ class AnalysisService:
         Args:
             analysis_type: Type of analysis to perform
         """
-        await self._logger.info(f"Starting {analysis_type.value} analysis")
+        self._logger.info(f"Starting {analysis_type.value} analysis")
 
         async with self._session_factory() as session:
             analysis_repo = AnalysisRepository(session)
@@ -96,26 +106,28 @@ class AnalysisService:
             )
 
             if not unprocessed_ids:
-                await self._logger.info(f"No unprocessed results for {analysis_type.value}")
+                self._logger.info(f"No unprocessed results for {analysis_type.value}")
                 return
 
-            await self._logger.info(
+            self._logger.info(
                 f"Found {len(unprocessed_ids)} unprocessed results for {analysis_type.value}"
             )
 
             # Get analyzer based on analysis type
             analyzer = self._get_analyzer(analysis_type)
 
+            # Load the whole batch in one query instead of one per ID
+            scraping_results = await scraping_repo.get_by_ids(unprocessed_ids)
+
             analyzed_count = 0
             error_count = 0
 
             for scraping_id in unprocessed_ids:
                 try:
-                    # Get scraping result
-                    scraping_result = await scraping_repo.get_by_id(scraping_id)
+                    scraping_result = scraping_results.get(scraping_id)
 
                     if not scraping_result:
-                        await self._logger.warning(
+                        self._logger.warning(
                             f"Scraping result not found: {scraping_id}"
                         )
                         continue
@@ -155,19 +167,20 @@ class AnalysisService:
 
                         await analysis_repo.create_batch(repo_results)
                         analyzed_count += 1
-                        await self._logger.debug(
-                            f"Saved {len(repo_results)} {analysis_type.value} results for scraping result {scraping_id}",
-                            extra={
-                                "scraping_id": str(scraping_id),
-                                "result_count": len(repo_results),
-                                "analysis_type": analysis_type.value,
-                            },
-                        )
+                        if self._logger.is_debug_enabled:
+                            self._logger.debug(
+                                f"Saved {len(repo_results)} {analysis_type.value} results for scraping result {scraping_id}",
+                                extra={
+                                    "scraping_id": str(scraping_id),
+                                    "result_count": len(repo_results),
+                                    "analysis_type": analysis_type.value,
+                                },
+                            )
                     else:
                         # Mark as processed even if no results found (e.g., FDA records may not have required fields)
                         # This prevents records from blocking processing indefinitely
                         marker_result = AnalysisResultDTO(
-                            id=uuid.uuid4(),
+                            id=uuid7(),
                             scraping_result_id=scraping_result.id,
                             analysis_type=analysis_type,
                             keyword=None,  # None indicates "processed but no results"
@@ -182,18 +195,19 @@ class AnalysisService:
                         )
 
                         await analysis_repo.create_batch([marker_result])
-                        await self._logger.debug(
-                            f"Marked scraping result {scraping_id} as processed for {analysis_type.value} (no results found)",
-                            extra={
-                                "scraping_id": str(scraping_id),
-                                "source_type": scraping_result.source_type.value,
-                                "analysis_type": analysis_type.value,
-                            },
-                        )
+                        if self._logger.is_debug_enabled:
+                            self._logger.debug(
+                                f"Marked scraping result {scraping_id} as processed for {analysis_type.value} (no results found)",
+                                extra={
+                                    "scraping_id": str(scraping_id),
+                                    "source_type": scraping_result.source_type.value,
+                                    "analysis_type": analysis_type.value,
+                                },
+                            )
 
                 except Exception as e:
                     error_count += 1
-                    await self._logger.error(
+                    self._logger.error(
                         f"Failed to analyze scraping result {scraping_id}: {str(e)}",
                         extra={"scraping_id": str(scraping_id), "error": str(e)},
                     )
@@ -201,7 +215,7 @@ class AnalysisService:
 
             await session.commit()
 
-            await self._logger.info(
+            self._logger.info(
                 f"Completed {analysis_type.value} analysis: "
                 f"{analyzed_count} analyzed, {error_count} errors"
             )
@@ -212,7 +226,7 @@ class AnalysisService:
         This is a special analysis type that aggregates across all documents,
         not a per-document analysis.
         """
-        await self._logger.info("Starting FREQUENT_TERMS analysis (global aggregation)")
+        self._logger.info("Starting FREQUENT_TERMS analysis (global aggregation)")
 
         async with self._session_factory() as session:
             analysis_repo = AnalysisRepository(session)
@@ -228,15 +242,14 @@ class AnalysisService:
             
             if analysis_results:
                 # Delete old FREQUENT_TERMS results (replace with new aggregation)
-                existing_results = await analysis_repo.get_by_analysis_type(
+                # in one statement rather than a fetch plus one DELETE per row
+                deleted_count = await analysis_repo.delete_by_analysis_type(
                     AnalysisType.FREQUENT_TERMS
                 )
-                if existing_results:
-                    await self._logger.debug(
-                        f"Deleting {len(existing_results)} existing FREQUENT_TERMS results"
+                if deleted_count:
+                    self._logger.debug(
+                        f"Deleted {deleted_count} existing FREQUENT_TERMS results"
                     )
-                    for old_result in existing_results:
-                        await analysis_repo.delete(old_result.id)
                 
                 # Save new results
                 repo_results = [
@@ -253,16 +266,27 @@ class AnalysisService:
                 ]
                 
                 await analysis_repo.create_batch(repo_results)
-                await self._logger.info(
+                self._logger.info(
                     f"FREQUENT_TERMS analysis completed: {len(repo_results)} terms stored"
                 )
             else:
-                await self._logger.warning(
+                self._logger.warning(
                     "FREQUENT_TERMS analysis returned no results"
                 )
             
             await session.commit()
 
+    async def _refresh_frequent_terms_view(self) -> None:
+        """Refresh the frequent terms materialized view after new results."""
+        async with self._session_factory() as session:
+            refreshed = await AnalysisRepository(session).refresh_frequent_terms_view()
+            await session.commit()
+
+        if refreshed:
+            self._logger.info("Frequent terms view refreshed")
+        else:
+            self._logger.debug("Frequent terms view refresh already in progress elsewhere")
+
     def _get_analyzer(self, analysis_type: AnalysisType):
         """Get analyzer instance for analysis type.
 
@@ -289,10 +313,10 @@ class AnalysisService:
     async def start(self) -> None:
         """Start the analysis service."""
         if not ANALYSIS_ENABLED:
-            await self._logger.warning("Analysis service is disabled")
+            self._logger.warning("Analysis service is disabled")
             return
 
-        await self._logger.info("Starting analysis service")
+        self._logger.info("Starting analysis service")
 
         self._running = True
 
@@ -307,18 +331,18 @@ class AnalysisService:
             while self._running:
                 await asyncio.sleep(60)
         except KeyboardInterrupt:
-            await self._logger.info("Received shutdown signal")
+            self._logger.info("Received shutdown signal")
 
     async def stop(self) -> None:
         """Stop the analysis service."""
-        await self._logger.info("Stopping analysis service")
+        self._logger.info("Stopping analysis service")
         self._running = False
 
         if self._scheduler:
             await self._scheduler.stop()
 
         await self._engine.dispose()
-        await self._logger.info("Analysis service stopped")
+        self._logger.info("Analysis service stopped")
 
 
 async def main() -> None:
@@ -335,7 +359,7 @@ async def main() -> None:
     try:
         await service.start()
     except Exception as e:
-        await service._logger.error(f"Service failed: {str(e)}", extra={"error": str(e)})
+        service._logger.error(f"Service failed: {str(e)}", extra={"error": str(e)})
         raise
     finally:
         await service.stop()
@@ -3,22 +3,23 @@
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, not_, func
+from sqlalchemy import select, delete, and_, not_, func, lambda_stmt
 from sqlalchemy.orm import selectinload
 
 from services.api.src.database.models import (
     AnalysisResultModel,
     ScrapingResultModel,
 )
+from services.api.src.database.views import REFRESH_FREQUENT_TERMS_VIEW
 from services.analysis.src.repository.analysis_repository_interface import (
-    AnalysisRepositoryInterface,
     AnalysisResultDTO,
 )
-from shared.errors import DatabaseError
+from shared.constants import AdvisoryLocks
+from shared.errors import db_errors
 from shared.types.enums import AnalysisType
 
 
-class AnalysisRepository(AnalysisRepositoryInterface):
+class AnalysisRepository:
     """SQLAlchemy implementation of analysis repository."""
 
     def __init__(self, session: AsyncSession) -> None:
@@ -29,10 +30,32 @@ class AnalysisRepository(AnalysisRepositoryInterface):
         """
         self._session = session
 
+    @db_errors("Failed to create analysis result", "ANALYSIS_RESULT_CREATE_ERROR")
     async def create(self, result: AnalysisResultDTO) -> UUID:
         """Create a new analysis result."""
-        try:
-            model = AnalysisResultModel(
+        model = AnalysisResultModel(
+            id=result.id,
+            scraping_result_id=result.scraping_result_id,
+            analysis_type=result.analysis_type,
+            keyword=result.keyword,
+            frequency=result.frequency,
+            meta_data=result.metadata,
+            created_at=result.created_at,
+        )
+
+        self._session.add(model)
+        await self._session.flush()
+        return model.id
+
+    @db_errors(
+        "Failed to create analysis results in batch",
+        "ANALYSIS_RESULT_BATCH_CREATE_ERROR",
+        "results",
+    )
+    async def create_batch(self, results: List[AnalysisResultDTO]) -> List[UUID]:
+        """Create multiple analysis results in batch."""
+        models = [
+            AnalysisResultModel(
                 id=result.id,
                 scraping_result_id=result.scraping_result_id,
                 analysis_type=result.analysis_type,
@@ -41,59 +64,61 @@ class AnalysisRepository(AnalysisRepositoryInterface):
                 meta_data=result.metadata,
                 created_at=result.created_at,
             )
+            for result in results
+        ]
 
-            self._session.add(model)
-            await self._session.flush()
-            return model.id
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to create analysis result",
-                error_code="ANALYSIS_RESULT_CREATE_ERROR",
-                details={"error": str(e)},
-            ) from e
-
-    async def create_batch(self, results: List[AnalysisResultDTO]) -> List[UUID]:
-        """Create multiple analysis results in batch."""
-        try:
-            models = [
-                AnalysisResultModel(
-                    id=result.id,
-                    scraping_result_id=result.scraping_result_id,
-                    analysis_type=result.analysis_type,
-                    keyword=result.keyword,
-                    frequency=result.frequency,
-                    meta_data=result.metadata,
-                    created_at=result.created_at,
-                )
-                for result in results
-            ]
+        self._session.add_all(models)
+        await self._session.flush()
 
-            self._session.add_all(models)
-            await self._session.flush()
-
-            return [model.id for model in models]
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to create analysis results in batch",
-                error_code="ANALYSIS_RESULT_BATCH_CREATE_ERROR",
-                details={"error": str(e), "count": len(results)},
-            ) from e
+        return [model.id for model in models]
 
+    @db_errors(
+        "Failed to get analysis result by ID",
+        "ANALYSIS_RESULT_GET_ERROR",
+        "result_id",
+    )
     async def get_by_id(self, result_id: UUID) -> Optional[AnalysisResultDTO]:
         """Get analysis result by ID."""
-        try:
-            stmt = select(AnalysisResultModel).where(
+        stmt = lambda_stmt(
+            lambda: select(AnalysisResultModel).where(
                 AnalysisResultModel.id == result_id
             )
-            result = await self._session.execute(stmt)
-            model = result.scalar_one_or_none()
-
-            if not model:
-                return None
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one_or_none()
+
+        if not model:
+            return None
+
+        return AnalysisResultDTO(
+            id=model.id,
+            scraping_result_id=model.scraping_result_id,
+            analysis_type=model.analysis_type,
+            keyword=model.keyword,
+            frequency=model.frequency,
+            metadata=model.meta_data,
+            created_at=model.created_at,
+        )
+
+    @db_errors(
+        "Failed to get analysis results by scraping result ID",
+        "ANALYSIS_RESULT_GET_BY_SCRAPING_ID_ERROR",
+        "scraping_result_id",
+    )
+    async def get_by_scraping_result_id(
+        self, scraping_result_id: UUID
+    ) -> List[AnalysisResultDTO]:
+        """Get all analysis results for a scraping result."""
+        stmt = lambda_stmt(
+            lambda: select(AnalysisResultModel).where(
+                AnalysisResultModel.scraping_result_id == scraping_result_id
+            )
+        )
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
 
-            return AnalysisResultDTO(
+        return [
+            AnalysisResultDTO(
                 id=model.id,
                 scraping_result_id=model.scraping_result_id,
                 analysis_type=model.analysis_type,
@@ -102,182 +127,149 @@ class AnalysisRepository(AnalysisRepositoryInterface):
                 metadata=model.meta_data,
                 created_at=model.created_at,
             )
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get analysis result by ID",
-                error_code="ANALYSIS_RESULT_GET_ERROR",
-                details={"error": str(e), "result_id": str(result_id)},
-            ) from e
-
-    async def get_by_scraping_result_id(
-        self, scraping_result_id: UUID
-    ) -> List[AnalysisResultDTO]:
-        """Get all analysis results for a scraping result."""
-        try:
-            stmt = select(AnalysisResultModel).where(
-                AnalysisResultModel.scraping_result_id == scraping_result_id
-            )
-            result = await self._session.execute(stmt)
-            models = result.scalars().all()
-
-            return [
-                AnalysisResultDTO(
-                    id=model.id,
-                    scraping_result_id=model.scraping_result_id,
-                    analysis_type=model.analysis_type,
-                    keyword=model.keyword,
-                    frequency=model.frequency,
-                    metadata=model.meta_data,
-                    created_at=model.created_at,
-                )
-                for model in models
-            ]
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get analysis results by scraping result ID",
-                error_code="ANALYSIS_RESULT_GET_BY_SCRAPING_ID_ERROR",
-                details={
-                    "error": str(e),
-                    "scraping_result_id": str(scraping_result_id),
-                },
-            ) from e
-
+            for model in models
+        ]
+
+    @db_errors(
+        "Failed to get unprocessed scraping IDs",
+        "ANALYSIS_GET_UNPROCESSED_ERROR",
+        "limit",
+        "analysis_type",
+    )
     async def get_unprocessed_scraping_ids(
         self, limit: int, analysis_type: AnalysisType
     ) -> List[UUID]:
         """Get IDs of unprocessed scraping results."""
-        try:
-            # Subquery to find scraping IDs that already have this analysis type
-            processed_ids_subquery = (
-                select(AnalysisResultModel.scraping_result_id)
-                .where(AnalysisResultModel.analysis_type == analysis_type)
-                .distinct()
-            )
-
-            # Get scraping IDs that are not in the processed list
-            # Use ~ (NOT) operator with .in_()
-            stmt = (
-                select(ScrapingResultModel.id)
-                .where(
-                    ~ScrapingResultModel.id.in_(
-                        processed_ids_subquery
-                    )
+        # Subquery to find scraping IDs that already have this analysis type
+        processed_ids_subquery = (
+            select(AnalysisResultModel.scraping_result_id)
+            .where(AnalysisResultModel.analysis_type == analysis_type)
+            .distinct()
+        )
+
+        # Get scraping IDs that are not in the processed list
+        # Use ~ (NOT) operator with .in_()
+        stmt = (
+            select(ScrapingResultModel.id)
+            .where(
+                ~ScrapingResultModel.id.in_(
+                    processed_ids_subquery
                 )
-                .limit(limit)
             )
+            .limit(limit)
+        )
 
-            result = await self._session.execute(stmt)
-            ids = result.scalars().all()
+        result = await self._session.execute(stmt)
+        ids = result.scalars().all()
 
-            return list(ids)
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get unprocessed scraping IDs",
-                error_code="ANALYSIS_GET_UNPROCESSED_ERROR",
-                details={
-                    "error": str(e),
-                    "limit": limit,
-                    "analysis_type": analysis_type.value,
-                },
-            ) from e
+        return list(ids)
 
+    @db_errors(
+        "Failed to get most frequent terms",
+        "ANALYSIS_GET_MOST_FREQUENT_ERROR",
+        "limit",
+    )
     async def get_most_frequent_terms(
         self, limit: int, analysis_type: Optional[AnalysisType] = None
     ) -> List[Dict[str, Any]]:
         """Get most frequent terms across all analysis results."""
-        try:
-            conditions = [
-                AnalysisResultModel.keyword.isnot(None),
-            ]
-
-            if analysis_type:
-                conditions.append(AnalysisResultModel.analysis_type == analysis_type)
-
-            stmt = (
-                select(
-                    AnalysisResultModel.keyword,
-                    func.sum(AnalysisResultModel.frequency).label("total_frequency"),
-                    func.count(AnalysisResultModel.id).label("document_count"),
-                )
-                .where(and_(*conditions))
-                .group_by(AnalysisResultModel.keyword)
-                .order_by(func.sum(AnalysisResultModel.frequency).desc())
-                .limit(limit)
+        conditions = [
+            AnalysisResultModel.keyword.isnot(None),
+        ]
+
+        if analysis_type:
+            conditions.append(AnalysisResultModel.analysis_type == analysis_type)
+
+        stmt = (
+            select(
+                AnalysisResultModel.keyword,
+                func.sum(AnalysisResultModel.frequency).label("total_frequency"),
+                func.count(AnalysisResultModel.id).label("document_count"),
             )
-
-            result = await self._session.execute(stmt)
-            rows = result.all()
-
-            return [
-                {
-                    "keyword": row.keyword,
-                    "total_frequency": int(row.total_frequency),
-                    "document_count": int(row.document_count),
-                }
-                for row in rows
-            ]
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get most frequent terms",
-                error_code="ANALYSIS_GET_MOST_FREQUENT_ERROR",
-                details={"error": str(e), "limit": limit},
-            ) from e
-
+            .where(and_(*conditions))
+            .group_by(AnalysisResultModel.keyword)
+            .order_by(func.sum(AnalysisResultModel.frequency).desc())
+            .limit(limit)
+        )
+
+        result = await self._session.execute(stmt)
+        rows = result.all()
+
+        return [
+            {
+                "keyword": row.keyword,
+                "total_frequency": int(row.total_frequency),
+                "document_count": int(row.document_count),
+            }
+            for row in rows
+        ]
+
+    @db_errors(
+        "Failed to get analysis results by analysis type",
+        "ANALYSIS_RESULT_GET_BY_TYPE_ERROR",
+        "analysis_type",
+    )
     async def get_by_analysis_type(
         self, analysis_type: AnalysisType
     ) -> List[AnalysisResultDTO]:
         """Get all analysis results of a specific type."""
-        try:
-            stmt = select(AnalysisResultModel).where(
+        stmt = lambda_stmt(
+            lambda: select(AnalysisResultModel).where(
                 AnalysisResultModel.analysis_type == analysis_type
             )
-            result = await self._session.execute(stmt)
-            models = result.scalars().all()
-
-            return [
-                AnalysisResultDTO(
-                    id=model.id,
-                    scraping_result_id=model.scraping_result_id,
-                    analysis_type=model.analysis_type,
-                    keyword=model.keyword,
-                    frequency=model.frequency,
-                    metadata=model.meta_data,
-                    created_at=model.created_at,
-                )
-                for model in models
-            ]
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get analysis results by analysis type",
-                error_code="ANALYSIS_RESULT_GET_BY_TYPE_ERROR",
-                details={
-                    "error": str(e),
-                    "analysis_type": analysis_type.value,
-                },
-            ) from e
+        )
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
 
+        return [
+            AnalysisResultDTO(
+                id=model.id,
+                scraping_result_id=model.scraping_result_id,
+                analysis_type=model.analysis_type,
+                keyword=model.keyword,
+                frequency=model.frequency,
+                metadata=model.meta_data,
+                created_at=model.created_at,
+            )
+            for model in models
+        ]
+
+    @db_errors(
+        "Failed to delete analysis result",
+        "ANALYSIS_RESULT_DELETE_ERROR",
+        "result_id",
+    )
     async def delete(self, result_id: UUID) -> None:
         """Delete an analysis result by ID."""
-        try:
-            stmt = select(AnalysisResultModel).where(
+        stmt = lambda_stmt(
+            lambda: delete(AnalysisResultModel).where(
                 AnalysisResultModel.id == result_id
             )
-            result = await self._session.execute(stmt)
-            model = result.scalar_one_or_none()
-
-            if model:
-                await self._session.delete(model)
-                await self._session.flush()
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to delete analysis result",
-                error_code="ANALYSIS_RESULT_DELETE_ERROR",
-                details={"error": str(e), "result_id": str(result_id)},
-            ) from e
-
+        )
+        await self._session.execute(stmt)
+
+    @db_errors(
+        "Failed to delete analysis results by analysis type",
+        "ANALYSIS_RESULT_DELETE_BY_TYPE_ERROR",
+        "analysis_type",
+    )
+    async def delete_by_analysis_type(self, analysis_type: AnalysisType) -> int:
+        """Delete all analysis results of a specific type in one statement."""
+        stmt = delete(AnalysisResultModel).where(
+            AnalysisResultModel.analysis_type == analysis_type
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    @db_errors("Failed to refresh frequent terms view", "FREQUENT_TERMS_REFRESH_ERROR")
+    async def refresh_frequent_terms_view(self) -> bool:
+        """Refresh the frequent terms materialized view read by the API."""
+        # Same transaction-scoped lock the API's periodic refresher takes
+        acquired = await self._session.scalar(
+            select(func.pg_try_advisory_xact_lock(AdvisoryLocks.FREQUENT_TERMS_REFRESH))
+        )
+        if not acquired:
+            return False
+
+        await self._session.execute(REFRESH_FREQUENT_TERMS_VIEW)
+        return True
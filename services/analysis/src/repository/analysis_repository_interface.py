@@ -1,41 +1,33 @@
 """Repository interface for analysis results."""
 
-from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Protocol
 from uuid import UUID
 
 from shared.errors import DatabaseError
 from shared.types.enums import AnalysisType
 
 
+@dataclass(slots=True, frozen=True)
 class AnalysisResultDTO:
     """Data Transfer Object for analysis results."""
 
-    def __init__(
-        self,
-        id: UUID,
-        scraping_result_id: Optional[UUID],  # None for global aggregations like FREQUENT_TERMS
-        analysis_type: AnalysisType,
-        keyword: Optional[str],
-        frequency: int,
-        metadata: Optional[dict],
-        created_at: datetime,
-    ) -> None:
-        """Initialize analysis result DTO."""
-        self.id = id
-        self.scraping_result_id = scraping_result_id
-        self.analysis_type = analysis_type
-        self.keyword = keyword
-        self.frequency = frequency
-        self.metadata = metadata
-        self.created_at = created_at
-
-
-class AnalysisRepositoryInterface(ABC):
-    """Interface for analysis result repository."""
-
-    @abstractmethod
+    id: UUID
+    scraping_result_id: Optional[UUID]  # None for global aggregations like FREQUENT_TERMS
+    analysis_type: AnalysisType
+    keyword: Optional[str]
+    frequency: int
+    metadata: Optional[dict]
+    created_at: datetime
+
+
+class AnalysisRepositoryInterface(Protocol):
+    """Interface for analysis result repository.
+
+    Structural: implementations conform by shape and need not inherit from it.
+    """
+
     async def create(self, result: AnalysisResultDTO) -> UUID:
         """Create a new analysis result.
 
@@ -48,9 +40,8 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def create_batch(self, results: List[AnalysisResultDTO]) -> List[UUID]:
         """Create multiple analysis results in batch.
 
@@ -63,9 +54,8 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_id(self, result_id: UUID) -> Optional[AnalysisResultDTO]:
         """Get analysis result by ID.
 
@@ -78,9 +68,8 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_scraping_result_id(
         self, scraping_result_id: UUID
     ) -> List[AnalysisResultDTO]:
@@ -95,9 +84,8 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_unprocessed_scraping_ids(
         self, limit: int, analysis_type: AnalysisType
     ) -> List[UUID]:
@@ -113,9 +101,8 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_analysis_type(
         self, analysis_type: AnalysisType
     ) -> List[AnalysisResultDTO]:
@@ -130,9 +117,8 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def delete(self, result_id: UUID) -> None:
         """Delete an analysis result by ID.
 
@@ -142,9 +128,22 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
+
+    async def delete_by_analysis_type(self, analysis_type: AnalysisType) -> int:
+        """Delete all analysis results of a specific type in one statement.
+
+        Args:
+            analysis_type: Type of analysis results to delete
+
+        Returns:
+            Number of deleted results
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
 
-    @abstractmethod
     async def get_most_frequent_terms(
         self, limit: int, analysis_type: Optional[AnalysisType] = None
     ) -> List[dict]:
@@ -160,5 +159,17 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
+
+    async def refresh_frequent_terms_view(self) -> bool:
+        """Refresh the frequent terms materialized view read by the API.
+
+        Skipped if another process is already refreshing it.
 
+        Returns:
+            True if this call refreshed the view
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
@@ -1,10 +1,11 @@
 """Scheduler for analysis service."""
 
 import asyncio
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Callable, Awaitable
 
-from shared.config import settings
+from services.analysis.src.config import ANALYSIS_POLL_INTERVAL
 from shared.logging.logger_interface import LoggerInterface
 
 
@@ -24,12 +25,12 @@ class AnalysisScheduler:
         """
         self._task = task
         self._logger = logger
-        self._interval_seconds = settings.analysis_poll_interval_seconds
+        self._interval_seconds = ANALYSIS_POLL_INTERVAL
         self._running = False
 
     async def start(self) -> None:
         """Start the scheduler."""
-        await self._logger.info(
+        self._logger.info(
             f"Starting analysis scheduler with interval: {self._interval_seconds}s"
         )
 
@@ -46,26 +47,42 @@ class AnalysisScheduler:
 
     async def stop(self) -> None:
         """Stop the scheduler."""
-        await self._logger.info("Stopping analysis scheduler")
+        self._logger.info("Stopping analysis scheduler")
         self._running = False
 
     async def trigger_now(self) -> None:
         """Manually trigger the task immediately."""
-        await self._logger.info("Manual trigger requested")
+        self._logger.info("Manual trigger requested")
         await self._execute_task()
 
     async def _execute_task(self) -> None:
-        """Execute the scheduled task with error handling."""
+        """Execute the scheduled task with error handling.
+
+        Logs one record per run, with its start time and duration.
+        """
+        started_at = datetime.now(timezone.utc).isoformat()
+        start = time.monotonic()
         try:
-            await self._logger.info(
-                f"Executing scheduled analysis task at {datetime.utcnow().isoformat()}"
-            )
             await self._task()
-            await self._logger.info("Scheduled analysis task completed successfully")
         except Exception as e:
-            await self._logger.error(
+            self._logger.error(
                 f"Scheduled analysis task failed: {str(e)}",
-                extra={"error": str(e)},
+                extra={
+                    "started_at": started_at,
+                    "duration_seconds": round(time.monotonic() - start, 3),
+                    "status": "error",
+                    "error": str(e),
+                },
+                exc=e,
             )
             # Don't re-raise - scheduler should continue running
+            return
 
+        self._logger.info(
+            "Scheduled analysis task completed successfully",
+            extra={
+                "started_at": started_at,
+                "duration_seconds": round(time.monotonic() - start, 3),
+                "status": "ok",
+            },
+        )
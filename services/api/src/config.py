@@ -1,10 +1,22 @@
 """Configuration for API service."""
 
+import os
+
 from shared.config import settings
 
 # Service-specific config
 API_HOST = settings.api_host
 API_PORT = settings.api_port
 API_RELOAD = settings.api_reload
-API_WORKERS = settings.api_workers
+API_WORKERS = settings.api_workers or os.cpu_count() or 1
+API_LOOP = settings.api_loop
+API_HTTP = settings.api_http
+# Several workers must not share (and rotate) the same log files
+API_LOG_PER_PROCESS = API_WORKERS > 1 and not API_RELOAD
+API_FREQUENT_TERMS_REFRESH_SECONDS = settings.api_frequent_terms_refresh_seconds
 
+API_CORS_ALLOWED_ORIGINS: frozenset[str] = frozenset(
+    origin.strip()
+    for origin in settings.api_cors_allowed_origins.split(",")
+    if origin.strip()
+)
@@ -5,3 +5,13 @@ from shared.constants import Routes, ErrorMessages
 # Service name for logging
 SERVICE_NAME = "api"
 
+
+# CORS
+CORS_ALLOWED_METHODS = ("GET", "PUT", "DELETE", "OPTIONS")
+CORS_PREFLIGHT_MAX_AGE = 600  # Seconds browsers may cache a preflight response
+
+# HTTP caching
+READ_CACHE_MAX_AGE = 30  # Seconds clients may reuse an ETag-tagged GET response
+
+# Media types
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
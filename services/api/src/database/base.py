@@ -4,6 +4,11 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.orm import DeclarativeBase
 from typing import AsyncGenerator
 
+from services.api.src.database.views import (
+    CREATE_FREQUENT_TERMS_VIEW,
+    CREATE_FREQUENT_TERMS_VIEW_INDEX,
+    CREATE_FREQUENT_TERMS_RANK_INDEX,
+)
 from shared.config import settings
 from shared.database.engine_factory import create_database_engine
 from shared.errors import DatabaseError
@@ -52,7 +57,7 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db() -> None:
-    """Initialize database (create tables).
+    """Initialize database (create tables and materialized views).
 
     Raises:
         DatabaseError: If database initialization fails
@@ -60,6 +65,9 @@ async def init_db() -> None:
     try:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(CREATE_FREQUENT_TERMS_VIEW)
+            await conn.execute(CREATE_FREQUENT_TERMS_VIEW_INDEX)
+            await conn.execute(CREATE_FREQUENT_TERMS_RANK_INDEX)
     except Exception as e:
         import traceback
         error_details = {
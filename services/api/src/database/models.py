@@ -1,14 +1,14 @@
 """SQLAlchemy ORM models."""
 
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, JSON, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Integer, JSON, Enum, func
 from sqlalchemy.dialects.postgresql import UUID
 from typing import Any, Dict
 
 from services.api.src.database.base import Base
 from shared.constants import Tables
 from shared.types.enums import SourceType, AnalysisType
+from shared.utils.ids import uuid7
 
 
 class ScrapingResultModel(Base):
@@ -16,14 +16,28 @@ class ScrapingResultModel(Base):
 
     __tablename__ = Tables.SCRAPING_RESULTS
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     source_type = Column(Enum(SourceType), nullable=False, index=True)
-    external_id = Column(String(255), nullable=False, unique=True, index=True)
+    external_id = Column(String(255), nullable=False)
     title = Column(String(500), nullable=False)
     data = Column(JSON, nullable=False)
     link = Column(String(1000), nullable=False)
     scraped_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
 
+    __table_args__ = (
+        # External IDs are unique per source; also the bulk-insert conflict target
+        Index(
+            "uq_scraping_results_external_id_source_type",
+            external_id,
+            source_type,
+            unique=True,
+        ),
+        # Keyset pagination: newest-first seek on (scraped_at, id)
+        Index("ix_scraping_results_scraped_at_id", scraped_at.desc(), id.desc()),
+        # Same seek/order when filtering by source_type
+        Index("ix_scraping_source_sort", source_type, scraped_at.desc(), id.desc()),
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary.
 
@@ -46,7 +60,7 @@ class AnalysisResultModel(Base):
 
     __tablename__ = Tables.ANALYSIS_RESULTS
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     scraping_result_id = Column(
         UUID(as_uuid=True),
         ForeignKey(f"{Tables.SCRAPING_RESULTS}.id"),
@@ -59,6 +73,30 @@ class AnalysisResultModel(Base):
     meta_data = Column("metadata", JSON, nullable=True)  # Column named 'metadata' in DB, but 'meta_data' in Python (metadata is reserved)
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Keyset pagination: newest-first seek on (created_at, id)
+        Index("ix_analysis_results_created_at_id", created_at.desc(), id.desc()),
+        # Ordered scan for the type + scraping result filter combination
+        Index(
+            "ix_analysis_filter_sort",
+            analysis_type,
+            scraping_result_id,
+            created_at.desc(),
+            id.desc(),
+        ),
+        # Case-insensitive keyword filter: lower(keyword) = :keyword
+        Index("ix_analysis_keyword_lower", func.lower(keyword)),
+        # Frequent terms aggregation (and view refresh): index-only scan
+        # over keyword rows, skipping "processed, no results" markers
+        Index(
+            "ix_analysis_kw_freq",
+            keyword,
+            analysis_type,
+            postgresql_include=["frequency"],
+            postgresql_where=keyword.isnot(None),
+        ),
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary.
 
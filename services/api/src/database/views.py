@@ -0,0 +1,49 @@
+"""Materialized views backing read-heavy aggregate endpoints.
+
+Views are not part of ``Base.metadata`` (``create_all`` would create them as
+tables), so they are exposed as lightweight table clauses for querying and
+their DDL is kept alongside.
+"""
+
+from sqlalchemy import BigInteger, Enum, String, column, table, text
+
+from shared.constants import Tables
+from shared.types.enums import AnalysisType
+
+
+frequent_terms_view = table(
+    Tables.FREQUENT_TERMS,
+    column("keyword", String),
+    column("analysis_type", Enum(AnalysisType)),
+    column("total_frequency", BigInteger),
+    column("document_count", BigInteger),
+)
+
+CREATE_FREQUENT_TERMS_VIEW = text(
+    f"""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS {Tables.FREQUENT_TERMS} AS
+    SELECT keyword,
+           analysis_type,
+           SUM(frequency)::bigint AS total_frequency,
+           COUNT(*)::bigint AS document_count
+    FROM {Tables.ANALYSIS_RESULTS}
+    WHERE keyword IS NOT NULL
+    GROUP BY keyword, analysis_type
+    """
+)
+
+# REFRESH ... CONCURRENTLY requires a unique index covering every row
+CREATE_FREQUENT_TERMS_VIEW_INDEX = text(
+    f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{Tables.FREQUENT_TERMS}_keyword_type "
+    f"ON {Tables.FREQUENT_TERMS} (keyword, analysis_type)"
+)
+
+# Serves the per-type top-k read as an ordered index scan
+CREATE_FREQUENT_TERMS_RANK_INDEX = text(
+    f"CREATE INDEX IF NOT EXISTS ix_{Tables.FREQUENT_TERMS}_type_total "
+    f"ON {Tables.FREQUENT_TERMS} (analysis_type, total_frequency DESC)"
+)
+
+REFRESH_FREQUENT_TERMS_VIEW = text(
+    f"REFRESH MATERIALIZED VIEW CONCURRENTLY {Tables.FREQUENT_TERMS}"
+)
@@ -0,0 +1,40 @@
+"""FastAPI dependencies shared by the API routes.
+
+Dependencies are ``async def`` so FastAPI resolves them on the event loop
+instead of dispatching plain functions to its threadpool.
+"""
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.api.src.database.base import get_db_session
+from services.api.src.handlers.analysis_handler import AnalysisHandler
+from services.api.src.handlers.scraping_handler import ScrapingHandler
+
+
+async def get_analysis_handler(
+    session: AsyncSession = Depends(get_db_session),
+) -> AnalysisHandler:
+    """Provide the request-scoped analysis handler.
+
+    Args:
+        session: Request-scoped database session
+
+    Returns:
+        AnalysisHandler bound to the session
+    """
+    return AnalysisHandler(session)
+
+
+async def get_scraping_handler(
+    session: AsyncSession = Depends(get_db_session),
+) -> ScrapingHandler:
+    """Provide the request-scoped scraping handler.
+
+    Args:
+        session: Request-scoped database session
+
+    Returns:
+        ScrapingHandler bound to the session
+    """
+    return ScrapingHandler(session)
@@ -36,7 +36,8 @@ class APINotFoundError(NotFoundError, APIError):
         details: Optional[dict] = None,
     ) -> None:
         """Initialize API not found error."""
-        super().__init__(message, error_code, details)
+        # Not super(): the MRO would pass error_code as APIError's status_code
+        BaseApplicationError.__init__(self, message, error_code, details)
         self.status_code = 404
 
 
@@ -50,6 +51,7 @@ class APIValidationError(ValidationError, APIError):
         details: Optional[dict] = None,
     ) -> None:
         """Initialize API validation error."""
-        super().__init__(message, error_code, details)
+        # Not super(): the MRO would pass error_code as APIError's status_code
+        BaseApplicationError.__init__(self, message, error_code, details)
         self.status_code = 400
 
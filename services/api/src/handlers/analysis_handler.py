@@ -1,24 +1,51 @@
 """Handlers for analysis result operations."""
 
 from uuid import UUID
-from typing import Optional
+from typing import AsyncIterator, Optional
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.api.src.handlers.base_handler import BaseHandler
+from services.api.src.handlers.pagination import (
+    decode_cursor,
+    encode_cursor,
+    encode_page,
+)
 from shared.types.enums import AnalysisType
 from services.api.src.models.analysis_schema import (
     AnalysisResultResponse,
-    AnalysisResultListResponse,
     AnalysisResultUpdateRequest,
     AnalysisResultQueryParams,
     MostFrequentTermsResponse,
     MostFrequentTermResponse,
 )
 from services.api.src.repository.analysis_repository import AnalysisRepository
+from services.api.src.repository.analysis_repository_interface import (
+    AnalysisRepositoryInterface,
+    AnalysisResultDTO,
+)
 from services.api.src.errors.api_errors import APINotFoundError
 from shared.constants import ErrorMessages
 
 
+def _to_response(result: AnalysisResultDTO) -> AnalysisResultResponse:
+    """Build a response from a repository DTO.
+
+    Values were already typed by the database driver, so pydantic validation
+    is skipped via ``model_construct``.
+    """
+    return AnalysisResultResponse.model_construct(
+        id=result.id,
+        scraping_result_id=result.scraping_result_id,
+        analysis_type=result.analysis_type,
+        keyword=result.keyword,
+        frequency=result.frequency,
+        metadata=result.metadata,
+        created_at=result.created_at,
+    )
+
+
 class AnalysisHandler(BaseHandler):
     """Handler for analysis result operations."""
 
@@ -29,7 +56,7 @@ class AnalysisHandler(BaseHandler):
             session: Database session
         """
         super().__init__(session)
-        self._repository = AnalysisRepository(session)
+        self._repository: AnalysisRepositoryInterface = AnalysisRepository(session)
 
     async def get_by_id(self, result_id: UUID) -> AnalysisResultResponse:
         """Get analysis result by ID.
@@ -52,62 +79,65 @@ class AnalysisHandler(BaseHandler):
                 details={"result_id": str(result_id)},
             )
 
-        return AnalysisResultResponse(
-            id=result.id,
-            scraping_result_id=result.scraping_result_id,
-            analysis_type=result.analysis_type,
-            keyword=result.keyword,
-            frequency=result.frequency,
-            metadata=result.metadata,
-            created_at=result.created_at,
-        )
+        return _to_response(result)
 
-    async def list_all(
-        self, query_params: AnalysisResultQueryParams
-    ) -> AnalysisResultListResponse:
+    async def list_all(self, query_params: AnalysisResultQueryParams) -> bytes:
         """List analysis results with pagination.
 
         Args:
             query_params: Query parameters for filtering and pagination
 
         Returns:
-            AnalysisResultListResponse
+            JSON-encoded AnalysisResultListResponse body
         """
-        results = await self._repository.list_all(
+        after_created_at, after_id = (
+            decode_cursor(query_params.cursor) if query_params.cursor else (None, None)
+        )
+        results, total = await self._repository.list_all_with_count(
             limit=query_params.limit,
             offset=query_params.offset,
             analysis_type=query_params.analysis_type,
             scraping_result_id=query_params.scraping_result_id,
             keyword=query_params.keyword,
+            after_created_at=after_created_at,
+            after_id=after_id,
         )
 
-        # Convert to response models
-        items = [
-            AnalysisResultResponse(
-                id=result.id,
-                scraping_result_id=result.scraping_result_id,
-                analysis_type=result.analysis_type,
-                keyword=result.keyword,
-                frequency=result.frequency,
-                metadata=result.metadata,
-                created_at=result.created_at,
-            )
-            for result in results
-        ]
+        # A short page is the last one; otherwise continue after its last row
+        next_cursor = (
+            encode_cursor(results[-1].created_at, results[-1].id)
+            if len(results) == query_params.limit
+            else None
+        )
 
-        # Get total count for proper pagination
-        total = await self._repository.count_all(
-            analysis_type=query_params.analysis_type,
-            scraping_result_id=query_params.scraping_result_id,
-            keyword=query_params.keyword,
+        return encode_page(
+            results, total, query_params.limit, query_params.offset, next_cursor
         )
 
-        return AnalysisResultListResponse(
-            items=items,
-            total=total,
+    async def stream_ndjson(
+        self, query_params: AnalysisResultQueryParams
+    ) -> AsyncIterator[bytes]:
+        """Stream analysis results as newline-delimited JSON.
+
+        Args:
+            query_params: Query parameters for filtering and pagination
+
+        Yields:
+            One JSON-encoded analysis result per line
+        """
+        after_created_at, after_id = (
+            decode_cursor(query_params.cursor) if query_params.cursor else (None, None)
+        )
+        async for result in self._repository.list_all(
             limit=query_params.limit,
             offset=query_params.offset,
-        )
+            analysis_type=query_params.analysis_type,
+            scraping_result_id=query_params.scraping_result_id,
+            keyword=query_params.keyword,
+            after_created_at=after_created_at,
+            after_id=after_id,
+        ):
+            yield orjson.dumps(result, option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE)
 
     async def update(
         self, result_id: UUID, updates: AnalysisResultUpdateRequest
@@ -124,12 +154,8 @@ class AnalysisHandler(BaseHandler):
         Raises:
             APINotFoundError: If result not found
         """
-        # Build update dict
-        update_dict = {}
-        if updates.frequency is not None:
-            update_dict["frequency"] = updates.frequency
-        if updates.metadata is not None:
-            update_dict["metadata"] = updates.metadata
+        # Only fields the client sent (keys match the table's column names)
+        update_dict = updates.model_dump(exclude_unset=True, exclude_none=True)
 
         if not update_dict:
             # No updates provided, return existing
@@ -137,15 +163,7 @@ class AnalysisHandler(BaseHandler):
 
         result = await self._repository.update(result_id, update_dict)
 
-        return AnalysisResultResponse(
-            id=result.id,
-            scraping_result_id=result.scraping_result_id,
-            analysis_type=result.analysis_type,
-            keyword=result.keyword,
-            frequency=result.frequency,
-            metadata=result.metadata,
-            created_at=result.created_at,
-        )
+        return _to_response(result)
 
     async def delete(self, result_id: UUID) -> None:
         """Delete an analysis result.
@@ -162,12 +180,14 @@ class AnalysisHandler(BaseHandler):
         self,
         limit: int,
         analysis_type: Optional[AnalysisType] = None,
+        stale_ok: bool = True,
     ) -> MostFrequentTermsResponse:
         """Get most frequent terms across all analysis results.
 
         Args:
             limit: Maximum number of terms to return
             analysis_type: Optional filter by analysis type
+            stale_ok: Whether precomputed (periodically refreshed) results are acceptable
 
         Returns:
             MostFrequentTermsResponse with list of most frequent terms
@@ -175,10 +195,12 @@ class AnalysisHandler(BaseHandler):
         results = await self._repository.get_most_frequent_terms(
             limit=limit,
             analysis_type=analysis_type,
+            stale_ok=stale_ok,
         )
 
+        # Aggregates come straight from the database; skip re-validation
         items = [
-            MostFrequentTermResponse(
+            MostFrequentTermResponse.model_construct(
                 keyword=result["keyword"],
                 total_frequency=result["total_frequency"],
                 document_count=result["document_count"],
@@ -186,5 +208,5 @@ class AnalysisHandler(BaseHandler):
             for result in results
         ]
 
-        return MostFrequentTermsResponse(items=items, limit=limit)
+        return MostFrequentTermsResponse.model_construct(items=items, limit=limit)
 
@@ -0,0 +1,86 @@
+"""Opaque cursors for keyset pagination and list response encoding."""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+import orjson
+
+from services.api.src.errors.api_errors import APIValidationError
+
+_SEPARATOR = "|"
+
+
+def encode_cursor(sort_value: datetime, result_id: UUID) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor.
+
+    Args:
+        sort_value: Timestamp of the last result on the page
+        result_id: ID of the last result on the page
+
+    Returns:
+        Cursor string for the next page
+    """
+    raw = f"{sort_value.isoformat()}{_SEPARATOR}{result_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (timestamp, result ID) to continue after
+
+    Raises:
+        APIValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        sort_value, result_id = raw.split(_SEPARATOR)
+        return datetime.fromisoformat(sort_value), UUID(result_id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise APIValidationError(
+            message="Invalid pagination cursor",
+            error_code="INVALID_CURSOR",
+            details={"cursor": cursor},
+        ) from e
+
+
+def encode_page(
+    items: Sequence[Any],
+    total: int,
+    limit: int,
+    offset: int,
+    next_cursor: Optional[str],
+) -> bytes:
+    """Encode a list response body straight from repository DTOs.
+
+    The DTOs are dataclasses whose fields match the response schema, so
+    orjson serializes them (with their UUIDs, enums and datetimes) without
+    building a pydantic model per row.
+
+    Args:
+        items: Repository DTOs for the page
+        total: Total number of matching results
+        limit: Page size
+        offset: Page offset
+        next_cursor: Cursor for the next page, if any
+
+    Returns:
+        JSON-encoded list response
+    """
+    return orjson.dumps(
+        {
+            "items": items,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+        },
+        option=orjson.OPT_UTC_Z,
+    )
@@ -1,21 +1,48 @@
 """Handlers for scraping result operations."""
 
+from typing import AsyncIterator
 from uuid import UUID
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.api.src.handlers.base_handler import BaseHandler
+from services.api.src.handlers.pagination import (
+    decode_cursor,
+    encode_cursor,
+    encode_page,
+)
 from services.api.src.models.scraping_schema import (
     ScrapingResultResponse,
-    ScrapingResultListResponse,
     ScrapingResultUpdateRequest,
     ScrapingResultQueryParams,
 )
 from services.api.src.repository.scraping_repository import ScrapingRepository
+from services.api.src.repository.scraping_repository_interface import (
+    ScrapingRepositoryInterface,
+    ScrapingResultDTO,
+)
 from services.api.src.errors.api_errors import APINotFoundError
 from shared.constants import ErrorMessages
 from shared.types.enums import SourceType
 
 
+def _to_response(result: ScrapingResultDTO) -> ScrapingResultResponse:
+    """Build a response from a repository DTO.
+
+    Values were already typed by the database driver, so pydantic validation
+    is skipped via ``model_construct``.
+    """
+    return ScrapingResultResponse.model_construct(
+        id=result.id,
+        source_type=result.source_type,
+        external_id=result.external_id,
+        title=result.title,
+        data=result.data,
+        link=result.link,
+        scraped_at=result.scraped_at,
+    )
+
+
 class ScrapingHandler(BaseHandler):
     """Handler for scraping result operations."""
 
@@ -26,7 +53,7 @@ class ScrapingHandler(BaseHandler):
             session: Database session
         """
         super().__init__(session)
-        self._repository = ScrapingRepository(session)
+        self._repository: ScrapingRepositoryInterface = ScrapingRepository(session)
 
     async def get_by_id(self, result_id: UUID) -> ScrapingResultResponse:
         """Get scraping result by ID.
@@ -49,57 +76,63 @@ class ScrapingHandler(BaseHandler):
                 details={"result_id": str(result_id)},
             )
 
-        return ScrapingResultResponse(
-            id=result.id,
-            source_type=result.source_type,
-            external_id=result.external_id,
-            title=result.title,
-            data=result.data,
-            link=result.link,
-            scraped_at=result.scraped_at,
-        )
+        return _to_response(result)
 
-    async def list_all(
-        self, query_params: ScrapingResultQueryParams
-    ) -> ScrapingResultListResponse:
+    async def list_all(self, query_params: ScrapingResultQueryParams) -> bytes:
         """List scraping results with pagination.
 
         Args:
             query_params: Query parameters for filtering and pagination
 
         Returns:
-            ScrapingResultListResponse
+            JSON-encoded ScrapingResultListResponse body
         """
-        results = await self._repository.list_all(
+        after_scraped_at, after_id = (
+            decode_cursor(query_params.cursor) if query_params.cursor else (None, None)
+        )
+        results, total = await self._repository.list_all_with_count(
             limit=query_params.limit,
             offset=query_params.offset,
             source_type=query_params.source_type,
+            after_scraped_at=after_scraped_at,
+            after_id=after_id,
+            include_data=query_params.include_data,
         )
 
-        # Convert to response models
-        items = [
-            ScrapingResultResponse(
-                id=result.id,
-                source_type=result.source_type,
-                external_id=result.external_id,
-                title=result.title,
-                data=result.data,
-                link=result.link,
-                scraped_at=result.scraped_at,
-            )
-            for result in results
-        ]
+        # A short page is the last one; otherwise continue after its last row
+        next_cursor = (
+            encode_cursor(results[-1].scraped_at, results[-1].id)
+            if len(results) == query_params.limit
+            else None
+        )
 
-        # TODO: Get total count for proper pagination
-        # For now, use length of items as total
-        total = len(items)
+        return encode_page(
+            results, total, query_params.limit, query_params.offset, next_cursor
+        )
 
-        return ScrapingResultListResponse(
-            items=items,
-            total=total,
+    async def stream_ndjson(
+        self, query_params: ScrapingResultQueryParams
+    ) -> AsyncIterator[bytes]:
+        """Stream scraping results as newline-delimited JSON.
+
+        Args:
+            query_params: Query parameters for filtering and pagination
+
+        Yields:
+            One JSON-encoded scraping result per line
+        """
+        after_scraped_at, after_id = (
+            decode_cursor(query_params.cursor) if query_params.cursor else (None, None)
+        )
+        async for row in self._repository.stream(
             limit=query_params.limit,
             offset=query_params.offset,
-        )
+            source_type=query_params.source_type,
+            after_scraped_at=after_scraped_at,
+            after_id=after_id,
+            include_data=query_params.include_data,
+        ):
+            yield orjson.dumps(row, option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE)
 
     async def update(
         self, result_id: UUID, updates: ScrapingResultUpdateRequest
@@ -116,12 +149,9 @@ class ScrapingHandler(BaseHandler):
         Raises:
             APINotFoundError: If result not found
         """
-        # Build update dict (only include non-None values)
-        update_dict = {}
-        if updates.title is not None:
-            update_dict["title"] = updates.title
-        if updates.data is not None:
-            update_dict["data"] = updates.data
+        # Only fields the client sent; explicit nulls are ignored because the
+        # backing columns are NOT NULL
+        update_dict = updates.model_dump(exclude_unset=True, exclude_none=True)
 
         if not update_dict:
             # No updates provided, return existing
@@ -129,15 +159,7 @@ class ScrapingHandler(BaseHandler):
 
         result = await self._repository.update(result_id, update_dict)
 
-        return ScrapingResultResponse(
-            id=result.id,
-            source_type=result.source_type,
-            external_id=result.external_id,
-            title=result.title,
-            data=result.data,
-            link=result.link,
-            scraped_at=result.scraped_at,
-        )
+        return _to_response(result)
 
     async def delete(self, result_id: UUID) -> None:
         """Delete a scraping result.
@@ -1,17 +1,39 @@
 """Main FastAPI application."""
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-
-from services.api.src.config import API_HOST, API_PORT
-from services.api.src.constants import SERVICE_NAME
-from services.api.src.database.base import init_db, close_db
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import HTMLResponse
+
+from services.api.src.config import (
+    API_CORS_ALLOWED_ORIGINS,
+    API_FREQUENT_TERMS_REFRESH_SECONDS,
+    API_HOST,
+    API_HTTP,
+    API_LOG_PER_PROCESS,
+    API_LOOP,
+    API_PORT,
+    API_RELOAD,
+    API_WORKERS,
+)
+from services.api.src.constants import (
+    CORS_ALLOWED_METHODS,
+    CORS_PREFLIGHT_MAX_AGE,
+    READ_CACHE_MAX_AGE,
+    SERVICE_NAME,
+)
+from services.api.src.database.base import AsyncSessionLocal, init_db, close_db
+from services.api.src.middleware.conditional_get import ConditionalGetMiddleware
+from services.api.src.middleware.cors_preflight import CORSPreflightMiddleware
 from services.api.src.middleware.error_handler import ErrorHandlerMiddleware
 from services.api.src.middleware.logging_middleware import LoggingMiddleware
 from services.api.src.routes import scraping_router, analysis_router
 from services.api.src.routes.health_routes import router as health_router
+from services.api.src.tasks.frequent_terms_refresher import FrequentTermsRefresher
 from shared.config import settings
+from shared.constants import Routes
 from shared.logging.logger_factory import LoggerFactory
 
 
@@ -26,46 +48,75 @@ async def lifespan(app: FastAPI):
         None
     """
     # Startup
-    logger = LoggerFactory.create_logger(SERVICE_NAME)
-    await logger.info("Starting API service")
+    logger = LoggerFactory.create_logger(SERVICE_NAME, per_process=API_LOG_PER_PROCESS)
+    logger.info("Starting API service")
 
     # Initialize database
     try:
         await init_db()
-        await logger.info("Database initialized")
+        logger.info("Database initialized")
     except Exception as e:
-        await logger.error(f"Failed to initialize database: {str(e)}", extra={"error": str(e)})
+        logger.error(f"Failed to initialize database: {str(e)}", extra={"error": str(e)})
         raise
 
+    refresher = FrequentTermsRefresher(
+        session_factory=AsyncSessionLocal,
+        logger=logger,
+        interval_seconds=API_FREQUENT_TERMS_REFRESH_SECONDS,
+    )
+    refresher.start()
+
     yield
 
     # Shutdown
-    await logger.info("Shutting down API service")
+    logger.info("Shutting down API service")
+    await refresher.stop()
     await close_db()
-    await logger.info("API service stopped")
+    logger.info("API service stopped")
 
 
-# Create FastAPI app
+# Create FastAPI app (OpenAPI/docs routes are served below from the cached schema)
 app = FastAPI(
     title="Protego Health Backend API",
     description="API for accessing scraped FDA drug labels and clinical trials data",
     version=settings.app_version,
     lifespan=lifespan,
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
 )
 
-# Add CORS middleware
+# Add CORS middleware (explicit allowlist; a wildcard origin is invalid with credentials)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=list(API_CORS_ALLOWED_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=list(CORS_ALLOWED_METHODS),
     allow_headers=["*"],
+    max_age=CORS_PREFLIGHT_MAX_AGE,
+)
+
+# Tag read responses with ETags so polling clients can revalidate with a 304
+app.add_middleware(
+    ConditionalGetMiddleware,
+    path_prefixes=(Routes.SCRAPING, Routes.ANALYSIS),
+    no_store_prefixes=(Routes.HEALTH,),
+    max_age=READ_CACHE_MAX_AGE,
 )
 
 # Add logging middleware
-logger = LoggerFactory.create_logger(SERVICE_NAME)
+logger = LoggerFactory.create_logger(SERVICE_NAME, per_process=API_LOG_PER_PROCESS)
 app.add_middleware(LoggingMiddleware, logger=logger)
 
+# Answer preflights for known routes before any other middleware runs
+app.add_middleware(
+    CORSPreflightMiddleware,
+    allowed_origins=API_CORS_ALLOWED_ORIGINS,
+    path_prefixes=(Routes.SCRAPING, Routes.ANALYSIS, Routes.HEALTH),
+    allow_methods=CORS_ALLOWED_METHODS,
+    max_age=CORS_PREFLIGHT_MAX_AGE,
+)
+
 # Add error handlers
 handler = ErrorHandlerMiddleware()
 app.add_exception_handler(Exception, handler.handle_error)
@@ -76,6 +127,45 @@ app.include_router(scraping_router)
 app.include_router(analysis_router)
 
 
+@app.get(Routes.OPENAPI, include_in_schema=False)
+async def openapi_schema(request: Request) -> Response:
+    """Serve the OpenAPI schema, encoded on the first request and reused.
+
+    Args:
+        request: FastAPI request
+
+    Returns:
+        Pre-encoded OpenAPI JSON
+    """
+    state = request.app.state
+    # Routers are all included by the time requests arrive; the schema only
+    # changes on restart. Encoded lazily so it does not depend on lifespan.
+    openapi_bytes = getattr(state, "openapi_bytes", None)
+    if openapi_bytes is None:
+        openapi_bytes = state.openapi_bytes = orjson.dumps(request.app.openapi())
+    return Response(content=openapi_bytes, media_type="application/json")
+
+
+@app.get(Routes.DOCS, include_in_schema=False)
+async def swagger_ui() -> HTMLResponse:
+    """Serve Swagger UI backed by the cached OpenAPI schema.
+
+    Returns:
+        Swagger UI page
+    """
+    return get_swagger_ui_html(openapi_url=Routes.OPENAPI, title=f"{app.title} - Swagger UI")
+
+
+@app.get(Routes.REDOC, include_in_schema=False)
+async def redoc() -> HTMLResponse:
+    """Serve ReDoc backed by the cached OpenAPI schema.
+
+    Returns:
+        ReDoc page
+    """
+    return get_redoc_html(openapi_url=Routes.OPENAPI, title=f"{app.title} - ReDoc")
+
+
 @app.get("/")
 async def root() -> dict:
     """Root endpoint.
@@ -86,7 +176,7 @@ async def root() -> dict:
     return {
         "service": "Protego Health Backend API",
         "version": settings.app_version,
-        "docs": "/docs",
+        "docs": Routes.DOCS,
     }
 
 
@@ -98,5 +188,9 @@ if __name__ == "__main__":
         host=API_HOST,
         port=API_PORT,
         reload=API_RELOAD,
+        # Reload mode supervises a single process; production fans out per core
+        workers=1 if API_RELOAD else API_WORKERS,
+        loop=API_LOOP,
+        http=API_HTTP,
     )
 
@@ -0,0 +1,140 @@
+"""ETag / If-None-Match middleware for read routes."""
+
+import hashlib
+from typing import Iterable, List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ConditionalGetMiddleware:
+    """Tag JSON GET responses with a strong ETag and answer revalidations.
+
+    The ETag is a hash of the encoded body, so it changes whenever the
+    representation does. A request whose ``If-None-Match`` matches gets a
+    bodiless 304 instead of the full payload. Streaming (non-JSON) responses
+    pass through untouched. Paths under ``no_store_prefixes`` are marked
+    ``Cache-Control: no-store`` instead of being tagged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefixes: Iterable[str],
+        no_store_prefixes: Iterable[str],
+        max_age: int,
+    ) -> None:
+        """Initialize conditional GET middleware.
+
+        Args:
+            app: Downstream ASGI application
+            path_prefixes: Route prefixes whose GET responses get an ETag
+            no_store_prefixes: Route prefixes that must never be cached
+            max_age: Seconds clients may reuse a tagged response
+        """
+        self._app = app
+        self._path_prefixes = tuple(path_prefixes)
+        self._no_store_prefixes = tuple(no_store_prefixes)
+        self._cache_control = f"private, max-age={max_age}".encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self._app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path.startswith(self._no_store_prefixes):
+            await self._app(scope, receive, self._no_store(send))
+            return
+        if not path.startswith(self._path_prefixes):
+            await self._app(scope, receive, send)
+            return
+
+        if_none_match = b""
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value
+                break
+
+        start: Message = {}
+        body: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                if message["status"] != 200 or not _is_json(message["headers"]):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            content = b"".join(body)
+            digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+            etag = f'"{digest}"'.encode("latin-1")
+            headers = [
+                (name, value)
+                for name, value in start["headers"]
+                if name not in (b"etag", b"cache-control")
+            ]
+            headers.append((b"etag", etag))
+            headers.append((b"cache-control", self._cache_control))
+
+            if _etag_matches(if_none_match, etag):
+                headers = [(name, value) for name, value in headers if name != b"content-length"]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": content})
+
+        await self._app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _no_store(send: Send) -> Send:
+        """Wrap ``send`` so the response start carries ``no-store``."""
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value)
+                    for name, value in message["headers"]
+                    if name != b"cache-control"
+                ]
+                headers.append((b"cache-control", b"no-store"))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        return send_wrapper
+
+
+def _is_json(headers: Iterable[Tuple[bytes, bytes]]) -> bool:
+    """Return True if the response headers declare a JSON body."""
+    for name, value in headers:
+        if name == b"content-type":
+            return value.startswith(b"application/json")
+    return False
+
+
+def _etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """Return True if an If-None-Match header value covers ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(b",")]
+    return b"*" in candidates or etag in candidates or b"W/" + etag in candidates
@@ -0,0 +1,82 @@
+"""Fast-path CORS preflight middleware."""
+
+from typing import Iterable, List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class CORSPreflightMiddleware:
+    """Answer CORS preflight requests for known routes without routing them.
+
+    Preflights for an allowlisted origin on a known path prefix get a 204
+    with headers built once at startup. Anything else is passed through
+    untouched, so ``CORSMiddleware`` still handles rejected origins and
+    actual (non-preflight) requests.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allowed_origins: Iterable[str],
+        path_prefixes: Iterable[str],
+        allow_methods: Iterable[str],
+        max_age: int,
+    ) -> None:
+        """Initialize preflight middleware.
+
+        Args:
+            app: Downstream ASGI application
+            allowed_origins: Origins allowed to make cross-origin requests
+            path_prefixes: Route prefixes answered by the fast path
+            allow_methods: Methods advertised in the preflight response
+            max_age: Seconds browsers may cache the preflight result
+        """
+        self._app = app
+        self._allowed_origins = frozenset(allowed_origins)
+        self._path_prefixes = tuple(path_prefixes)
+        self._static_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"vary", b"Origin"),
+            (b"content-length", b"0"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "OPTIONS"
+            or not scope["path"].startswith(self._path_prefixes)
+        ):
+            await self._app(scope, receive, send)
+            return
+
+        origin = b""
+        request_method = b""
+        request_headers = b""
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if not request_method or origin.decode("latin-1") not in self._allowed_origins:
+            await self._app(scope, receive, send)
+            return
+
+        headers = [(b"access-control-allow-origin", origin), *self._static_headers]
+        if request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        start: Message = {"type": "http.response.start", "status": 204, "headers": headers}
+        await send(start)
+        await send({"type": "http.response.body", "body": b""})
@@ -1,6 +1,7 @@
 """Error handling middleware for FastAPI."""
 
-from typing import Callable
+from typing import Any, Callable
+import orjson
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
@@ -20,6 +21,19 @@ from services.api.src.errors.api_errors import (
 from shared.constants import ErrorMessages
 
 
+class _ErrorResponse(JSONResponse):
+    """JSON error response encoded with orjson.
+
+    Error bodies are built by hand, so they never take FastAPI's Pydantic
+    serialization path; orjson also copes with UUIDs and datetimes in
+    error details.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode the error body."""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 class ErrorHandlerMiddleware:
     """Middleware for handling and mapping errors."""
 
@@ -35,7 +49,7 @@ class ErrorHandlerMiddleware:
             JSONResponse with error details
         """
         if isinstance(exc, APINotFoundError):
-            return JSONResponse(
+            return _ErrorResponse(
                 status_code=exc.status_code,
                 content={
                     "error": {
@@ -47,7 +61,7 @@ class ErrorHandlerMiddleware:
             )
 
         if isinstance(exc, APIValidationError):
-            return JSONResponse(
+            return _ErrorResponse(
                 status_code=exc.status_code,
                 content={
                     "error": {
@@ -59,7 +73,7 @@ class ErrorHandlerMiddleware:
             )
 
         if isinstance(exc, APIError):
-            return JSONResponse(
+            return _ErrorResponse(
                 status_code=exc.status_code,
                 content={
                     "error": {
@@ -71,7 +85,7 @@ class ErrorHandlerMiddleware:
             )
 
         if isinstance(exc, NotFoundError):
-            return JSONResponse(
+            return _ErrorResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={
                     "error": {
@@ -83,7 +97,7 @@ class ErrorHandlerMiddleware:
             )
 
         if isinstance(exc, ValidationError):
-            return JSONResponse(
+            return _ErrorResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={
                     "error": {
@@ -95,7 +109,7 @@ class ErrorHandlerMiddleware:
             )
 
         if isinstance(exc, DatabaseError):
-            return JSONResponse(
+            return _ErrorResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": {
@@ -107,7 +121,7 @@ class ErrorHandlerMiddleware:
             )
 
         if isinstance(exc, RequestValidationError):
-            return JSONResponse(
+            return _ErrorResponse(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 content={
                     "error": {
@@ -119,7 +133,7 @@ class ErrorHandlerMiddleware:
             )
 
         if isinstance(exc, HTTPException):
-            return JSONResponse(
+            return _ErrorResponse(
                 status_code=exc.status_code,
                 content={
                     "error": {
@@ -131,7 +145,7 @@ class ErrorHandlerMiddleware:
             )
 
         # Generic error handler
-        return JSONResponse(
+        return _ErrorResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": {
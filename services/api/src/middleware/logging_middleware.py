@@ -38,7 +38,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         # Log request
         start_time = time.time()
-        await self._logger.audit(
+        self._logger.audit(
             f"Request: {request.method} {request.url.path}",
             correlation_id=correlation_id,
             extra={
@@ -58,7 +58,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             process_time = time.time() - start_time
 
             # Log response
-            await self._logger.audit(
+            self._logger.audit(
                 f"Response: {request.method} {request.url.path} - {response.status_code}",
                 correlation_id=correlation_id,
                 extra={
@@ -77,7 +77,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             process_time = time.time() - start_time
 
-            await self._logger.error(
+            self._logger.error(
                 f"Request failed: {request.method} {request.url.path} - {str(e)}",
                 correlation_id=correlation_id,
                 extra={
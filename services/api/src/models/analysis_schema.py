@@ -23,52 +23,13 @@ class AnalysisResultResponse(BaseModel):
         json_schema_extra={
             "examples": [
                 {
-                    "summary": "KEYWORD_FREQUENCY example (single word)",
-                    "value": {
-                        "id": "123e4567-e89b-12d3-a456-426614174000",
-                        "scraping_result_id": "223e4567-e89b-12d3-a456-426614174000",
-                        "analysis_type": "KEYWORD_FREQUENCY",
-                        "keyword": "treatment",
-                        "frequency": 10,
-                        "metadata": {"source_type": "CLINICAL_TRIALS", "title": "Clinical Trial Study"},
-                        "created_at": "2024-01-01T00:00:00Z",
-                    }
-                },
-                {
-                    "summary": "KEYWORD_FREQUENCY example (phrase)",
-                    "value": {
-                        "id": "123e4567-e89b-12d3-a456-426614174001",
-                        "scraping_result_id": "223e4567-e89b-12d3-a456-426614174000",
-                        "analysis_type": "KEYWORD_FREQUENCY",
-                        "keyword": "drug is safe to use",
-                        "frequency": 5,
-                        "metadata": {"source_type": "FDA_DRUG_LABELS", "title": "Drug Safety Label"},
-                        "created_at": "2024-01-01T00:00:00Z",
-                    }
-                },
-                {
-                    "summary": "FREQUENT_TERMS example (global aggregation)",
-                    "value": {
-                        "id": "123e4567-e89b-12d3-a456-426614174002",
-                        "scraping_result_id": None,
-                        "analysis_type": "FREQUENT_TERMS",
-                        "keyword": "drug is safe to use",
-                        "frequency": 150,
-                        "metadata": {"document_count": 45, "rank": 1, "aggregated_from": "KEYWORD_FREQUENCY"},
-                        "created_at": "2024-01-01T00:00:00Z",
-                    }
-                },
-                {
-                    "summary": "CONDITION_GROUPING example",
-                    "value": {
-                        "id": "123e4567-e89b-12d3-a456-426614174003",
-                        "scraping_result_id": "223e4567-e89b-12d3-a456-426614174000",
-                        "analysis_type": "CONDITION_GROUPING",
-                        "keyword": "Diabetes Mellitus",
-                        "frequency": 1,
-                        "metadata": {"source_type": "CLINICAL_TRIALS", "grouped_by": "condition"},
-                        "created_at": "2024-01-01T00:00:00Z",
-                    }
+                    "id": "123e4567-e89b-12d3-a456-426614174000",
+                    "scraping_result_id": "223e4567-e89b-12d3-a456-426614174000",
+                    "analysis_type": "KEYWORD_FREQUENCY",
+                    "keyword": "drug is safe to use",
+                    "frequency": 5,
+                    "metadata": {"source_type": "FDA_DRUG_LABELS"},
+                    "created_at": "2024-01-01T00:00:00Z",
                 }
             ]
         }
@@ -79,37 +40,37 @@ class AnalysisResultListResponse(BaseModel):
     """Response schema for list of analysis results."""
 
     items: list[AnalysisResultResponse]
-    total: int
+    total: int = Field(
+        ...,
+        description="Total matching results (from the cursor onward when paging with a cursor)",
+    )
     limit: int
     offset: int
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page; null on the last page"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
-            "example": {
-                "items": [
-                    {
-                        "id": "123e4567-e89b-12d3-a456-426614174000",
-                        "scraping_result_id": "223e4567-e89b-12d3-a456-426614174000",
-                        "analysis_type": "KEYWORD_FREQUENCY",
-                        "keyword": "drug is safe to use",
-                        "frequency": 15,
-                        "metadata": {"source_type": "FDA_DRUG_LABELS"},
-                        "created_at": "2024-01-01T00:00:00Z",
-                    },
-                    {
-                        "id": "123e4567-e89b-12d3-a456-426614174001",
-                        "scraping_result_id": "223e4567-e89b-12d3-a456-426614174000",
-                        "analysis_type": "KEYWORD_FREQUENCY",
-                        "keyword": "treatment",
-                        "frequency": 10,
-                        "metadata": {"source_type": "CLINICAL_TRIALS"},
-                        "created_at": "2024-01-01T00:00:00Z",
-                    }
-                ],
-                "total": 1250,
-                "limit": 50,
-                "offset": 0,
-            }
+            "examples": [
+                {
+                    "items": [
+                        {
+                            "id": "123e4567-e89b-12d3-a456-426614174000",
+                            "scraping_result_id": "223e4567-e89b-12d3-a456-426614174000",
+                            "analysis_type": "KEYWORD_FREQUENCY",
+                            "keyword": "treatment",
+                            "frequency": 10,
+                            "metadata": {"source_type": "CLINICAL_TRIALS"},
+                            "created_at": "2024-01-01T00:00:00Z",
+                        }
+                    ],
+                    "total": 1250,
+                    "limit": 50,
+                    "offset": 0,
+                    "next_cursor": "MjAyNC0wMS0wMVQwMDowMDowMCswMDowMHwxMjNlNDU2Ny1lODliLTEyZDMtYTQ1Ni00MjY2MTQxNzQwMDA=",
+                }
+            ]
         }
     )
 
@@ -142,6 +103,7 @@ class AnalysisResultQueryParams(BaseModel):
     analysis_type: Optional[AnalysisType] = None
     scraping_result_id: Optional[UUID] = None
     keyword: Optional[str] = Field(None, max_length=255, description="Filter by keyword (case-insensitive partial match)")
+    cursor: Optional[str] = None
 
 
 class MostFrequentTermResponse(BaseModel):
@@ -154,22 +116,7 @@ class MostFrequentTermResponse(BaseModel):
     model_config = ConfigDict(
         json_schema_extra={
             "examples": [
-                {
-                    "summary": "Single word example",
-                    "value": {
-                        "keyword": "treatment",
-                        "total_frequency": 1250,
-                        "document_count": 45,
-                    }
-                },
-                {
-                    "summary": "Multi-word phrase example",
-                    "value": {
-                        "keyword": "drug is safe to use",
-                        "total_frequency": 890,
-                        "document_count": 32,
-                    }
-                }
+                {"keyword": "drug is safe to use", "total_frequency": 890, "document_count": 32}
             ]
         }
     )
@@ -183,36 +130,13 @@ class MostFrequentTermsResponse(BaseModel):
 
     model_config = ConfigDict(
         json_schema_extra={
-            "example": {
-                "items": [
-                    {
-                        "keyword": "drug is safe to use",
-                        "total_frequency": 890,
-                        "document_count": 32,
-                    },
-                    {
-                        "keyword": "participants",
-                        "total_frequency": 750,
-                        "document_count": 28,
-                    },
-                    {
-                        "keyword": "clinical trials",
-                        "total_frequency": 650,
-                        "document_count": 45,
-                    },
-                    {
-                        "keyword": "safety assessment",
-                        "total_frequency": 540,
-                        "document_count": 22,
-                    },
-                    {
-                        "keyword": "treatment",
-                        "total_frequency": 520,
-                        "document_count": 38,
-                    }
-                ],
-                "limit": 10,
-            }
+            "examples": [
+                {
+                    "items": [
+                        {"keyword": "drug is safe to use", "total_frequency": 890, "document_count": 32}
+                    ],
+                    "limit": 10,
+                }
+            ]
         }
     )
-
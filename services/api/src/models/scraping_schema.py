@@ -15,7 +15,9 @@ class ScrapingResultResponse(BaseModel):
     source_type: SourceType
     external_id: str = Field(..., min_length=1, max_length=255)
     title: str = Field(..., min_length=1, max_length=500)
-    data: Dict[str, Any]
+    data: Optional[Dict[str, Any]] = Field(
+        ..., description="Scraped payload; null in lists requested with include_data=false"
+    )
     link: str = Field(..., min_length=1, max_length=1000)
     scraped_at: datetime
 
@@ -39,9 +41,15 @@ class ScrapingResultListResponse(BaseModel):
     """Response schema for list of scraping results."""
 
     items: list[ScrapingResultResponse]
-    total: int
+    total: int = Field(
+        ...,
+        description="Total matching results (from the cursor onward when paging with a cursor)",
+    )
     limit: int
     offset: int
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page; null on the last page"
+    )
 
 
 class ScrapingResultUpdateRequest(BaseModel):
@@ -65,4 +73,6 @@ class ScrapingResultQueryParams(BaseModel):
     limit: int = Field(default=50, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
     source_type: Optional[SourceType] = None
+    cursor: Optional[str] = None
+    include_data: bool = True
 
@@ -1,20 +1,165 @@
 """Repository implementation for analysis results (API service)."""
 
-from typing import Optional, List
+from datetime import datetime
+from typing import AsyncIterator, Dict, Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_
+from sqlalchemy import Row, Select, delete, func, lambda_stmt, select, tuple_, update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from services.api.src.database.models import AnalysisResultModel
+from services.api.src.database.views import (
+    REFRESH_FREQUENT_TERMS_VIEW,
+    frequent_terms_view,
+)
 from services.api.src.repository.analysis_repository_interface import (
-    AnalysisRepositoryInterface,
     AnalysisResultDTO,
 )
-from shared.errors import DatabaseError, NotFoundError
+from shared.constants import AdvisoryLocks, Caching, Limits
+from shared.errors import NotFoundError, db_errors
 from shared.types.enums import AnalysisType
+from shared.utils.ttl_cache import TTLCache
+
+
+# Read paths select plain columns so rows come back as Core tuples and never
+# go through ORM instance materialization or the session identity map.
+_RESULT_COLUMNS = (
+    AnalysisResultModel.id,
+    AnalysisResultModel.scraping_result_id,
+    AnalysisResultModel.analysis_type,
+    AnalysisResultModel.keyword,
+    AnalysisResultModel.frequency,
+    AnalysisResultModel.meta_data,
+    AnalysisResultModel.created_at,
+)
 
-
-class AnalysisRepository(AnalysisRepositoryInterface):
+# Read-aside caches shared by every repository instance in this process.
+# Writes through this repository invalidate the affected entries; the TTL
+# bounds staleness for writes made by other workers or services.
+_result_cache = TTLCache(Caching.MAX_ENTRIES, Caching.RESULT_TTL_SECONDS)
+_frequent_terms_cache = TTLCache(Caching.MAX_ENTRIES, Caching.FREQUENT_TERMS_TTL_SECONDS)
+
+
+def _to_dto(row: Row) -> AnalysisResultDTO:
+    """Build a DTO from a Core row selected with ``_RESULT_COLUMNS``."""
+    return AnalysisResultDTO(
+        id=row[0],
+        scraping_result_id=row[1],
+        analysis_type=row[2],
+        keyword=row[3],
+        frequency=row[4],
+        metadata=row[5],
+        created_at=row[6],
+    )
+
+
+def _filter(
+    stmt: StatementLambdaElement,
+    analysis_type: Optional[AnalysisType],
+    scraping_result_id: Optional[UUID],
+    keyword: Optional[str],
+) -> StatementLambdaElement:
+    """Add WHERE criteria for the list/count filters.
+
+    Each filter is a separate lambda, so every combination of filters maps to
+    its own cached compiled statement and only the bound values change
+    between calls.
+    """
+    if analysis_type:
+        stmt += lambda s: s.where(AnalysisResultModel.analysis_type == analysis_type)
+
+    if scraping_result_id:
+        stmt += lambda s: s.where(
+            AnalysisResultModel.scraping_result_id == scraping_result_id
+        )
+
+    if keyword:
+        # Use case-insensitive exact match for better precision; the value is
+        # lowered outside the lambda so it is tracked as a plain bound value
+        keyword_lower = keyword.lower()
+        stmt += lambda s: s.where(func.lower(AnalysisResultModel.keyword) == keyword_lower)
+
+    return stmt
+
+
+def _paginate(
+    stmt: StatementLambdaElement,
+    limit: int,
+    offset: int,
+    after_created_at: Optional[datetime],
+    after_id: Optional[UUID],
+) -> StatementLambdaElement:
+    """Apply newest-first ordering and pagination to a filtered statement.
+
+    When a keyset position is given the page starts right after it (an index
+    range scan on ``(created_at, id)``); otherwise ``offset`` is used.
+    """
+    if after_created_at is not None and after_id is not None:
+        stmt += lambda s: s.where(
+            tuple_(AnalysisResultModel.created_at, AnalysisResultModel.id)
+            < tuple_(after_created_at, after_id)
+        )
+    else:
+        stmt += lambda s: s.offset(offset)
+
+    stmt += lambda s: s.order_by(
+        AnalysisResultModel.created_at.desc(), AnalysisResultModel.id.desc()
+    ).limit(limit)
+    return stmt
+
+
+def _frequent_terms_from_view(
+    limit: int, analysis_type: Optional[AnalysisType]
+) -> Select:
+    """Read the top terms from the frequent terms materialized view."""
+    view = frequent_terms_view
+
+    if analysis_type:
+        # One view row per (keyword, analysis_type): an index scan on
+        # (analysis_type, total_frequency DESC) that stops after ``limit`` rows
+        return (
+            select(view.c.keyword, view.c.total_frequency, view.c.document_count)
+            .where(view.c.analysis_type == analysis_type)
+            .order_by(view.c.total_frequency.desc())
+            .limit(limit)
+        )
+
+    # Fold the per-type rows together; the view is far smaller than
+    # analysis_results, so this stays cheap
+    total_frequency = func.sum(view.c.total_frequency)
+    return (
+        select(
+            view.c.keyword,
+            total_frequency.label("total_frequency"),
+            func.sum(view.c.document_count).label("document_count"),
+        )
+        .group_by(view.c.keyword)
+        .order_by(total_frequency.desc())
+        .limit(limit)
+    )
+
+
+def _frequent_terms_live(
+    limit: int, analysis_type: Optional[AnalysisType]
+) -> Select:
+    """Aggregate the top terms directly from analysis_results."""
+    stmt = select(
+        AnalysisResultModel.keyword,
+        func.sum(AnalysisResultModel.frequency).label("total_frequency"),
+        func.count(AnalysisResultModel.id).label("document_count"),
+    ).where(AnalysisResultModel.keyword.isnot(None))
+
+    if analysis_type:
+        stmt = stmt.where(AnalysisResultModel.analysis_type == analysis_type)
+
+    return (
+        stmt.group_by(AnalysisResultModel.keyword)
+        .order_by(func.sum(AnalysisResultModel.frequency).desc())
+        .limit(limit)
+    )
+
+
+class AnalysisRepository:
     """SQLAlchemy implementation of analysis repository for API."""
 
     def __init__(self, session: AsyncSession) -> None:
@@ -25,35 +170,50 @@ class AnalysisRepository(AnalysisRepositoryInterface):
         """
         self._session = session
 
+    @db_errors(
+        "Failed to get analysis result by ID",
+        "ANALYSIS_RESULT_GET_ERROR",
+        "result_id",
+    )
     async def get_by_id(self, result_id: UUID) -> Optional[AnalysisResultDTO]:
         """Get analysis result by ID."""
-        try:
-            stmt = select(AnalysisResultModel).where(
-                AnalysisResultModel.id == result_id
-            )
-            result = await self._session.execute(stmt)
-            model = result.scalar_one_or_none()
-
-            if not model:
-                return None
-
-            return AnalysisResultDTO(
-                id=model.id,
-                scraping_result_id=model.scraping_result_id,
-                analysis_type=model.analysis_type,
-                keyword=model.keyword,
-                frequency=model.frequency,
-                metadata=model.meta_data,
-                created_at=model.created_at.isoformat() if model.created_at else "",
-            )
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get analysis result by ID",
-                error_code="ANALYSIS_RESULT_GET_ERROR",
-                details={"error": str(e), "result_id": str(result_id)},
-            ) from e
-
+        cached = _result_cache.get(result_id)
+        if cached is not None:
+            return cached
+
+        stmt = lambda_stmt(
+            lambda: select(*_RESULT_COLUMNS).where(AnalysisResultModel.id == result_id)
+        )
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if not row:
+            return None
+
+        dto = _to_dto(row)
+        _result_cache.set(result_id, dto)
+        return dto
+
+    @db_errors(
+        "Failed to get analysis results by IDs",
+        "ANALYSIS_RESULT_GET_MANY_ERROR",
+        "result_ids",
+    )
+    async def get_by_ids(self, result_ids: List[UUID]) -> Dict[UUID, AnalysisResultDTO]:
+        """Get several analysis results by ID in a single query."""
+        if not result_ids:
+            return {}
+
+        stmt = select(*_RESULT_COLUMNS).where(AnalysisResultModel.id.in_(result_ids))
+        result = await self._session.execute(stmt)
+
+        return {row[0]: _to_dto(row) for row in result}
+
+    @db_errors(
+        "Failed to list analysis results",
+        "ANALYSIS_RESULT_LIST_ERROR",
+        "limit",
+        "offset",
+    )
     async def list_all(
         self,
         limit: int,
@@ -61,56 +221,68 @@ class AnalysisRepository(AnalysisRepositoryInterface):
         analysis_type: Optional[AnalysisType] = None,
         scraping_result_id: Optional[UUID] = None,
         keyword: Optional[str] = None,
-    ) -> List[AnalysisResultDTO]:
-        """List analysis results with pagination."""
-        try:
-            conditions = []
-
-            if analysis_type:
-                conditions.append(AnalysisResultModel.analysis_type == analysis_type)
-
-            if scraping_result_id:
-                conditions.append(
-                    AnalysisResultModel.scraping_result_id == scraping_result_id
-                )
-
-            if keyword:
-                # Use case-insensitive exact match for better precision
-                conditions.append(
-                    func.lower(AnalysisResultModel.keyword) == keyword.lower()
-                )
-
-            stmt = select(AnalysisResultModel)
-            if conditions:
-                stmt = stmt.where(and_(*conditions))
-
-            stmt = stmt.order_by(AnalysisResultModel.created_at.desc()).limit(limit).offset(offset)
-
-            result = await self._session.execute(stmt)
-            models = result.scalars().all()
-
-            return [
-                AnalysisResultDTO(
-                    id=model.id,
-                    scraping_result_id=model.scraping_result_id,
-                    analysis_type=model.analysis_type,
-                    keyword=model.keyword,
-                    frequency=model.frequency,
-                    metadata=model.meta_data,
-                    created_at=model.created_at.isoformat()
-                    if model.created_at
-                    else "",
-                )
-                for model in models
-            ]
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to list analysis results",
-                error_code="ANALYSIS_RESULT_LIST_ERROR",
-                details={"error": str(e), "limit": limit, "offset": offset},
-            ) from e
-
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+    ) -> AsyncIterator[AnalysisResultDTO]:
+        """Stream analysis results with pagination from a server-side cursor."""
+        stmt = _paginate(
+            _filter(
+                lambda_stmt(lambda: select(*_RESULT_COLUMNS)),
+                analysis_type, scraping_result_id, keyword,
+            ),
+            limit, offset, after_created_at, after_id,
+        )
+
+        result = await self._session.stream(
+            stmt, execution_options={"yield_per": Limits.DB_STREAM_BATCH_SIZE}
+        )
+        async for row in result:
+            yield _to_dto(row)
+
+    @db_errors(
+        "Failed to list analysis results",
+        "ANALYSIS_RESULT_LIST_ERROR",
+        "limit",
+        "offset",
+    )
+    async def list_all_with_count(
+        self,
+        limit: int,
+        offset: int,
+        analysis_type: Optional[AnalysisType] = None,
+        scraping_result_id: Optional[UUID] = None,
+        keyword: Optional[str] = None,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+    ) -> Tuple[List[AnalysisResultDTO], int]:
+        """List a page of analysis results together with the total match count."""
+        stmt = _paginate(
+            _filter(
+                lambda_stmt(
+                    lambda: select(*_RESULT_COLUMNS, func.count().over().label("total"))
+                ),
+                analysis_type, scraping_result_id, keyword,
+            ),
+            limit, offset, after_created_at, after_id,
+        )
+
+        result = await self._session.execute(stmt)
+        rows = result.all()
+
+        # The window total is repeated on every row. An empty page past the
+        # end carries no total, so count separately to keep reporting the
+        # real number of matches (a keyset page's total counts onward, so
+        # an empty one is correctly 0).
+        if rows:
+            total = rows[0].total
+        elif offset > 0 and (after_created_at is None or after_id is None):
+            total = await self.count_all(analysis_type, scraping_result_id, keyword)
+        else:
+            total = 0
+
+        return [_to_dto(row) for row in rows], total
+
+    @db_errors("Failed to count analysis results", "ANALYSIS_RESULT_COUNT_ERROR")
     async def count_all(
         self,
         analysis_type: Optional[AnalysisType] = None,
@@ -118,147 +290,114 @@ class AnalysisRepository(AnalysisRepositoryInterface):
         keyword: Optional[str] = None,
     ) -> int:
         """Count total analysis results matching filters."""
-        try:
-            conditions = []
-
-            if analysis_type:
-                conditions.append(AnalysisResultModel.analysis_type == analysis_type)
-
-            if scraping_result_id:
-                conditions.append(
-                    AnalysisResultModel.scraping_result_id == scraping_result_id
-                )
-
-            if keyword:
-                # Use case-insensitive exact match for better precision
-                conditions.append(
-                    func.lower(AnalysisResultModel.keyword) == keyword.lower()
-                )
-
-            stmt = select(func.count(AnalysisResultModel.id))
-            if conditions:
-                stmt = stmt.where(and_(*conditions))
-
-            result = await self._session.execute(stmt)
-            return result.scalar() or 0
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to count analysis results",
-                error_code="ANALYSIS_RESULT_COUNT_ERROR",
-                details={"error": str(e)},
-            ) from e
-
+        stmt = _filter(
+            lambda_stmt(lambda: select(func.count(AnalysisResultModel.id))),
+            analysis_type, scraping_result_id, keyword,
+        )
+
+        result = await self._session.execute(stmt)
+        return result.scalar() or 0
+
+    @db_errors(
+        "Failed to get most frequent terms",
+        "ANALYSIS_RESULT_MOST_FREQUENT_ERROR",
+        "limit",
+    )
     async def get_most_frequent_terms(
         self,
         limit: int,
         analysis_type: Optional[AnalysisType] = None,
+        stale_ok: bool = True,
     ) -> List[dict]:
         """Get most frequent terms across all analysis results."""
-        try:
-            conditions = [
-                AnalysisResultModel.keyword.isnot(None),
-            ]
-
-            if analysis_type:
-                conditions.append(AnalysisResultModel.analysis_type == analysis_type)
-
-            stmt = (
-                select(
-                    AnalysisResultModel.keyword,
-                    func.sum(AnalysisResultModel.frequency).label("total_frequency"),
-                    func.count(AnalysisResultModel.id).label("document_count"),
-                )
-                .where(and_(*conditions))
-                .group_by(AnalysisResultModel.keyword)
-                .order_by(func.sum(AnalysisResultModel.frequency).desc())
-                .limit(limit)
-            )
-
-            result = await self._session.execute(stmt)
-            rows = result.all()
-
-            return [
-                {
-                    "keyword": row.keyword,
-                    "total_frequency": int(row.total_frequency),
-                    "document_count": int(row.document_count),
-                }
-                for row in rows
-            ]
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get most frequent terms",
-                error_code="ANALYSIS_RESULT_MOST_FREQUENT_ERROR",
-                details={"error": str(e), "limit": limit},
-            ) from e
-
+        cache_key = (analysis_type, limit)
+        if stale_ok:
+            cached = _frequent_terms_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if stale_ok:
+            stmt = _frequent_terms_from_view(limit, analysis_type)
+        else:
+            stmt = _frequent_terms_live(limit, analysis_type)
+
+        result = await self._session.execute(stmt)
+        rows = result.all()
+
+        terms = [
+            {
+                "keyword": row.keyword,
+                "total_frequency": int(row.total_frequency),
+                "document_count": int(row.document_count),
+            }
+            for row in rows
+        ]
+        if stale_ok:
+            _frequent_terms_cache.set(cache_key, terms)
+        return terms
+
+    @db_errors("Failed to refresh frequent terms view", "FREQUENT_TERMS_REFRESH_ERROR")
+    async def refresh_frequent_terms(self) -> bool:
+        """Refresh the frequent terms materialized view."""
+        # Transaction-scoped lock: released on commit/rollback, and keeps
+        # every API worker from rebuilding the view at the same time
+        acquired = await self._session.scalar(
+            select(func.pg_try_advisory_xact_lock(AdvisoryLocks.FREQUENT_TERMS_REFRESH))
+        )
+        if not acquired:
+            return False
+
+        await self._session.execute(REFRESH_FREQUENT_TERMS_VIEW)
+        _frequent_terms_cache.clear()
+        return True
+
+    @db_errors(
+        "Failed to update analysis result",
+        "ANALYSIS_RESULT_UPDATE_ERROR",
+        "result_id",
+    )
     async def update(self, result_id: UUID, updates: dict) -> AnalysisResultDTO:
         """Update an analysis result."""
-        try:
-            # Check if exists first
-            existing = await self.get_by_id(result_id)
-            if not existing:
-                raise NotFoundError(
-                    message="Analysis result not found",
-                    error_code="ANALYSIS_RESULT_NOT_FOUND",
-                    details={"result_id": str(result_id)},
-                )
-
-            stmt = (
-                update(AnalysisResultModel)
-                .where(AnalysisResultModel.id == result_id)
-                .values(**updates)
+        _result_cache.pop(result_id)
+        stmt = (
+            update(AnalysisResultModel)
+            .where(AnalysisResultModel.id == result_id)
+            .values(**updates)
+            .returning(*_RESULT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+
+        if not row:
+            raise NotFoundError(
+                message="Analysis result not found",
+                error_code="ANALYSIS_RESULT_NOT_FOUND",
+                details={"result_id": str(result_id)},
             )
 
-            await self._session.execute(stmt)
-            await self._session.flush()
-
-            # Return updated entity
-            updated = await self.get_by_id(result_id)
-            if not updated:
-                raise NotFoundError(
-                    message="Analysis result not found after update",
-                    error_code="ANALYSIS_RESULT_NOT_FOUND",
-                    details={"result_id": str(result_id)},
-                )
-
-            return updated
-
-        except NotFoundError:
-            raise
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to update analysis result",
-                error_code="ANALYSIS_RESULT_UPDATE_ERROR",
-                details={"error": str(e), "result_id": str(result_id)},
-            ) from e
+        return _to_dto(row)
 
+    @db_errors(
+        "Failed to delete analysis result",
+        "ANALYSIS_RESULT_DELETE_ERROR",
+        "result_id",
+    )
     async def delete(self, result_id: UUID) -> None:
         """Delete an analysis result."""
-        try:
-            # Check if exists first
-            existing = await self.get_by_id(result_id)
-            if not existing:
-                raise NotFoundError(
-                    message="Analysis result not found",
-                    error_code="ANALYSIS_RESULT_NOT_FOUND",
-                    details={"result_id": str(result_id)},
-                )
-
-            stmt = delete(AnalysisResultModel).where(
-                AnalysisResultModel.id == result_id
+        _result_cache.pop(result_id)
+        stmt = lambda_stmt(
+            lambda: delete(AnalysisResultModel)
+            .where(AnalysisResultModel.id == result_id)
+            .returning(AnalysisResultModel.id)
+        )
+        result = await self._session.execute(stmt)
+
+        if result.scalar_one_or_none() is None:
+            raise NotFoundError(
+                message="Analysis result not found",
+                error_code="ANALYSIS_RESULT_NOT_FOUND",
+                details={"result_id": str(result_id)},
             )
-            await self._session.execute(stmt)
-            await self._session.flush()
-
-        except NotFoundError:
-            raise
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to delete analysis result",
-                error_code="ANALYSIS_RESULT_DELETE_ERROR",
-                details={"error": str(e), "result_id": str(result_id)},
-            ) from e
 
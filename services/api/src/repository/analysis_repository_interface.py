@@ -1,40 +1,33 @@
 """Repository interface for analysis results (API service)."""
 
-from abc import ABC, abstractmethod
-from typing import Optional, List
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Dict, Optional, List, Tuple, Protocol
 from uuid import UUID
 
 from shared.errors import DatabaseError, NotFoundError
 from shared.types.enums import AnalysisType
 
 
+@dataclass(slots=True, frozen=True)
 class AnalysisResultDTO:
     """Data Transfer Object for analysis results."""
 
-    def __init__(
-        self,
-        id: UUID,
-        scraping_result_id: UUID,
-        analysis_type: AnalysisType,
-        keyword: Optional[str],
-        frequency: int,
-        metadata: Optional[dict],
-        created_at: str,
-    ) -> None:
-        """Initialize analysis result DTO."""
-        self.id = id
-        self.scraping_result_id = scraping_result_id
-        self.analysis_type = analysis_type
-        self.keyword = keyword
-        self.frequency = frequency
-        self.metadata = metadata
-        self.created_at = created_at
-
-
-class AnalysisRepositoryInterface(ABC):
-    """Interface for analysis result repository."""
-
-    @abstractmethod
+    id: UUID
+    scraping_result_id: UUID
+    analysis_type: AnalysisType
+    keyword: Optional[str]
+    frequency: int
+    metadata: Optional[dict]
+    created_at: datetime
+
+
+class AnalysisRepositoryInterface(Protocol):
+    """Interface for analysis result repository.
+
+    Structural: implementations conform by shape and need not inherit from it.
+    """
+
     async def get_by_id(self, result_id: UUID) -> Optional[AnalysisResultDTO]:
         """Get analysis result by ID.
 
@@ -47,35 +40,92 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
+
+    async def get_by_ids(self, result_ids: List[UUID]) -> Dict[UUID, AnalysisResultDTO]:
+        """Get several analysis results by ID in a single query.
 
-    @abstractmethod
-    async def list_all(
+        Args:
+            result_ids: UUIDs of the results
+
+        Returns:
+            Mapping of ID to AnalysisResultDTO for the results that exist; missing
+            IDs are simply absent
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
+
+    def list_all(
         self,
         limit: int,
         offset: int,
         analysis_type: Optional[AnalysisType] = None,
         scraping_result_id: Optional[UUID] = None,
         keyword: Optional[str] = None,
-    ) -> List[AnalysisResultDTO]:
-        """List analysis results with pagination.
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+    ) -> AsyncIterator[AnalysisResultDTO]:
+        """Stream analysis results with pagination.
+
+        Rows are fetched from a server-side cursor in batches, so memory use
+        stays flat regardless of ``limit``.
 
         Args:
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (ignored when a keyset
+                position is given)
             analysis_type: Optional filter by analysis type
             scraping_result_id: Optional filter by scraping result ID
             keyword: Optional filter by keyword (case-insensitive partial match)
+            after_created_at: Keyset position; return results older than
+                this (together with after_id)
+            after_id: Keyset tie-breaker for results sharing after_created_at
+
+        Yields:
+            Analysis result DTOs, newest first
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
+
+    async def list_all_with_count(
+        self,
+        limit: int,
+        offset: int,
+        analysis_type: Optional[AnalysisType] = None,
+        scraping_result_id: Optional[UUID] = None,
+        keyword: Optional[str] = None,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+    ) -> Tuple[List[AnalysisResultDTO], int]:
+        """List analysis results with pagination and the total match count.
+
+        The page and the total are fetched in a single statement using a
+        ``COUNT(*) OVER ()`` window. With a keyset position the total counts
+        the results from that position onward.
+
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip (ignored when a keyset
+                position is given)
+            analysis_type: Optional filter by analysis type
+            scraping_result_id: Optional filter by scraping result ID
+            keyword: Optional filter by keyword (case-insensitive exact match)
+            after_created_at: Keyset position; return results older than
+                this (together with after_id)
+            after_id: Keyset tie-breaker for results sharing after_created_at
 
         Returns:
-            List of analysis result DTOs
+            Tuple of (page of analysis result DTOs, total matching results)
 
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def count_all(
         self,
         analysis_type: Optional[AnalysisType] = None,
@@ -95,30 +145,50 @@ class AnalysisRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_most_frequent_terms(
         self,
         limit: int,
         analysis_type: Optional[AnalysisType] = None,
+        stale_ok: bool = True,
     ) -> List[dict]:
         """Get most frequent terms across all analysis results.
 
+        By default reads the periodically refreshed frequent terms
+        materialized view, so results may lag recent writes by up to one
+        refresh interval.
+
         Args:
             limit: Maximum number of terms to return
             analysis_type: Optional filter by analysis type
+            stale_ok: If False, aggregate analysis_results directly for
+                up-to-date (but slower) results
+
+        Returns:
+            List of dictionaries with 'keyword', 'total_frequency' and
+            'document_count' keys, ordered by total frequency descending
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
+
+    async def refresh_frequent_terms(self) -> bool:
+        """Refresh the frequent terms materialized view.
+
+        Only one refresh runs at a time across processes; callers that lose
+        the race return immediately.
 
         Returns:
-            List of dictionaries with 'keyword' and 'total_frequency' keys,
-            ordered by total frequency descending
+            True if this call performed the refresh, False if another
+            process held the refresh lock
 
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def update(self, result_id: UUID, updates: dict) -> AnalysisResultDTO:
         """Update an analysis result.
 
@@ -133,9 +203,8 @@ class AnalysisRepositoryInterface(ABC):
             NotFoundError: If result not found
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def delete(self, result_id: UUID) -> None:
         """Delete an analysis result.
 
@@ -146,5 +215,5 @@ class AnalysisRepositoryInterface(ABC):
             NotFoundError: If result not found
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
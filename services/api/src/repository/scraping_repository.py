@@ -1,21 +1,87 @@
 """Repository implementation for scraping results (API service)."""
 
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, func, lambda_stmt, null, select, tuple_, update
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from services.api.src.database.models import ScrapingResultModel
 from services.api.src.repository.scraping_repository_interface import (
-    ScrapingRepositoryInterface,
     ScrapingResultDTO,
 )
-from shared.errors import DatabaseError, NotFoundError
+from shared.constants import Caching
+from shared.errors import NotFoundError, db_errors
 from shared.types.enums import SourceType
+from shared.utils.ttl_cache import TTLCache
 
 
-class ScrapingRepository(ScrapingRepositoryInterface):
+# Read paths select plain columns so rows come back as Core mappings and never
+# go through ORM instance materialization or the session identity map.
+_RESULT_COLUMNS = (
+    ScrapingResultModel.id,
+    ScrapingResultModel.source_type,
+    ScrapingResultModel.external_id,
+    ScrapingResultModel.title,
+    ScrapingResultModel.data,
+    ScrapingResultModel.link,
+    ScrapingResultModel.scraped_at,
+)
+_RESULT_KEYS = tuple(column.key for column in _RESULT_COLUMNS)
+# Same shape for list views that skip the (large) data payload: Postgres
+# returns NULL in its place, so the JSON blob is never read or sent
+_SUMMARY_COLUMNS = tuple(
+    null().label("data") if column.key == "data" else column for column in _RESULT_COLUMNS
+)
+
+# Read-aside cache shared by every repository instance in this process.
+# Writes through this repository invalidate the affected entry; the TTL
+# bounds staleness for writes made by other workers or services.
+_result_cache = TTLCache(Caching.MAX_ENTRIES, Caching.RESULT_TTL_SECONDS)
+
+
+def _to_dto(row: RowMapping | dict) -> ScrapingResultDTO:
+    """Build a DTO from a Core row mapping keyed by column name."""
+    return ScrapingResultDTO(**row)
+
+
+def _paginate(
+    stmt: StatementLambdaElement,
+    limit: int,
+    offset: int,
+    source_type: Optional[SourceType],
+    after_scraped_at: Optional[datetime],
+    after_id: Optional[UUID],
+) -> StatementLambdaElement:
+    """Apply filtering, newest-first ordering and pagination to a statement.
+
+    When a keyset position is given the page starts right after it (an index
+    range scan on ``(scraped_at, id)``); otherwise ``offset`` is used.
+
+    Each criterion is a separate lambda, so every combination of filters maps
+    to its own cached compiled statement and only the bound values change
+    between calls.
+    """
+    if source_type:
+        stmt += lambda s: s.where(ScrapingResultModel.source_type == source_type)
+
+    if after_scraped_at is not None and after_id is not None:
+        stmt += lambda s: s.where(
+            tuple_(ScrapingResultModel.scraped_at, ScrapingResultModel.id)
+            < tuple_(after_scraped_at, after_id)
+        )
+    else:
+        stmt += lambda s: s.offset(offset)
+
+    stmt += lambda s: s.order_by(
+        ScrapingResultModel.scraped_at.desc(), ScrapingResultModel.id.desc()
+    ).limit(limit)
+    return stmt
+
+
+class ScrapingRepository:
     """SQLAlchemy implementation of scraping repository for API."""
 
     def __init__(self, session: AsyncSession) -> None:
@@ -26,135 +92,191 @@ class ScrapingRepository(ScrapingRepositoryInterface):
         """
         self._session = session
 
+    @db_errors(
+        "Failed to get scraping result by ID",
+        "SCRAPING_RESULT_GET_ERROR",
+        "result_id",
+    )
     async def get_by_id(self, result_id: UUID) -> Optional[ScrapingResultDTO]:
         """Get scraping result by ID."""
-        try:
-            stmt = select(ScrapingResultModel).where(ScrapingResultModel.id == result_id)
-            result = await self._session.execute(stmt)
-            model = result.scalar_one_or_none()
-
-            if not model:
-                return None
-
-            return ScrapingResultDTO(
-                id=model.id,
-                source_type=model.source_type,
-                external_id=model.external_id,
-                title=model.title,
-                data=model.data,
-                link=model.link,
-                scraped_at=model.scraped_at.isoformat() if model.scraped_at else "",
-            )
+        cached = _result_cache.get(result_id)
+        if cached is not None:
+            return cached
+
+        stmt = lambda_stmt(
+            lambda: select(*_RESULT_COLUMNS).where(ScrapingResultModel.id == result_id)
+        )
+        result = await self._session.execute(stmt)
+        row = result.mappings().one_or_none()
+        if not row:
+            return None
 
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get scraping result by ID",
-                error_code="SCRAPING_RESULT_GET_ERROR",
-                details={"error": str(e), "result_id": str(result_id)},
-            ) from e
+        dto = _to_dto(row)
+        _result_cache.set(result_id, dto)
+        return dto
 
+    @db_errors(
+        "Failed to get scraping results by IDs",
+        "SCRAPING_RESULT_GET_MANY_ERROR",
+        "result_ids",
+    )
+    async def get_by_ids(self, result_ids: List[UUID]) -> Dict[UUID, ScrapingResultDTO]:
+        """Get several scraping results by ID in a single query."""
+        if not result_ids:
+            return {}
+
+        stmt = select(*_RESULT_COLUMNS).where(ScrapingResultModel.id.in_(result_ids))
+        result = await self._session.execute(stmt)
+
+        return {row["id"]: _to_dto(row) for row in result.mappings()}
+
+    @db_errors(
+        "Failed to list scraping results",
+        "SCRAPING_RESULT_LIST_ERROR",
+        "limit",
+        "offset",
+    )
     async def list_all(
-        self, limit: int, offset: int, source_type: Optional[SourceType] = None
+        self,
+        limit: int,
+        offset: int,
+        source_type: Optional[SourceType] = None,
+        after_scraped_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
     ) -> List[ScrapingResultDTO]:
         """List scraping results with pagination."""
-        try:
-            stmt = select(ScrapingResultModel).limit(limit).offset(offset)
+        stmt = _paginate(
+            lambda_stmt(lambda: select(*_RESULT_COLUMNS)),
+            limit, offset, source_type, after_scraped_at, after_id,
+        )
+
+        result = await self._session.execute(stmt)
+
+        return [_to_dto(row) for row in result.mappings()]
+
+    @db_errors(
+        "Failed to list scraping results",
+        "SCRAPING_RESULT_LIST_ERROR",
+        "limit",
+        "offset",
+    )
+    async def list_all_with_count(
+        self,
+        limit: int,
+        offset: int,
+        source_type: Optional[SourceType] = None,
+        after_scraped_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        include_data: bool = True,
+    ) -> Tuple[List[ScrapingResultDTO], int]:
+        """List a page of scraping results together with the total match count."""
+        base = (
+            lambda_stmt(
+                lambda: select(*_RESULT_COLUMNS, func.count().over().label("total"))
+            )
+            if include_data
+            else lambda_stmt(
+                lambda: select(*_SUMMARY_COLUMNS, func.count().over().label("total"))
+            )
+        )
+        stmt = _paginate(base, limit, offset, source_type, after_scraped_at, after_id)
 
+        result = await self._session.execute(stmt)
+        rows = result.mappings().all()
+
+        # The window total is repeated on every row. An empty page past the
+        # end carries no total, so count separately to keep reporting the
+        # real number of matches (a keyset page's total counts onward, so
+        # an empty one is correctly 0).
+        if rows:
+            total = rows[0]["total"]
+        elif offset > 0 and (after_scraped_at is None or after_id is None):
+            count_stmt = lambda_stmt(lambda: select(func.count(ScrapingResultModel.id)))
             if source_type:
-                stmt = stmt.where(ScrapingResultModel.source_type == source_type)
-
-            stmt = stmt.order_by(ScrapingResultModel.scraped_at.desc())
-
-            result = await self._session.execute(stmt)
-            models = result.scalars().all()
-
-            return [
-                ScrapingResultDTO(
-                    id=model.id,
-                    source_type=model.source_type,
-                    external_id=model.external_id,
-                    title=model.title,
-                    data=model.data,
-                    link=model.link,
-                    scraped_at=model.scraped_at.isoformat()
-                    if model.scraped_at
-                    else "",
-                )
-                for model in models
-            ]
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to list scraping results",
-                error_code="SCRAPING_RESULT_LIST_ERROR",
-                details={"error": str(e), "limit": limit, "offset": offset},
-            ) from e
+                count_stmt += lambda s: s.where(ScrapingResultModel.source_type == source_type)
+            total = (await self._session.execute(count_stmt)).scalar() or 0
+        else:
+            total = 0
+        items = [
+            _to_dto({key: row[key] for key in _RESULT_KEYS}) for row in rows
+        ]
+
+        return items, total
+
+    @db_errors(
+        "Failed to stream scraping results",
+        "SCRAPING_RESULT_STREAM_ERROR",
+        "limit",
+        "offset",
+    )
+    async def stream(
+        self,
+        limit: int,
+        offset: int,
+        source_type: Optional[SourceType] = None,
+        after_scraped_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        include_data: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream scraping results row by row from a server-side cursor."""
+        base = (
+            lambda_stmt(lambda: select(*_RESULT_COLUMNS))
+            if include_data
+            else lambda_stmt(lambda: select(*_SUMMARY_COLUMNS))
+        )
+        stmt = _paginate(base, limit, offset, source_type, after_scraped_at, after_id)
+
+        result = await self._session.stream(stmt)
+        async for row in result.mappings():
+            yield dict(row)
 
+    @db_errors(
+        "Failed to update scraping result",
+        "SCRAPING_RESULT_UPDATE_ERROR",
+        "result_id",
+    )
     async def update(self, result_id: UUID, updates: dict) -> ScrapingResultDTO:
         """Update a scraping result."""
-        try:
-            # Check if exists first
-            existing = await self.get_by_id(result_id)
-            if not existing:
-                raise NotFoundError(
-                    message="Scraping result not found",
-                    error_code="SCRAPING_RESULT_NOT_FOUND",
-                    details={"result_id": str(result_id)},
-                )
-
-            stmt = (
-                update(ScrapingResultModel)
-                .where(ScrapingResultModel.id == result_id)
-                .values(**updates)
+        _result_cache.pop(result_id)
+        stmt = (
+            update(ScrapingResultModel)
+            .where(ScrapingResultModel.id == result_id)
+            .values(**updates)
+            .returning(*_RESULT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self._session.execute(stmt)
+        row = result.mappings().one_or_none()
+
+        if not row:
+            raise NotFoundError(
+                message="Scraping result not found",
+                error_code="SCRAPING_RESULT_NOT_FOUND",
+                details={"result_id": str(result_id)},
             )
 
-            await self._session.execute(stmt)
-            await self._session.flush()
-
-            # Return updated entity
-            updated = await self.get_by_id(result_id)
-            if not updated:
-                raise NotFoundError(
-                    message="Scraping result not found after update",
-                    error_code="SCRAPING_RESULT_NOT_FOUND",
-                    details={"result_id": str(result_id)},
-                )
-
-            return updated
-
-        except NotFoundError:
-            raise
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to update scraping result",
-                error_code="SCRAPING_RESULT_UPDATE_ERROR",
-                details={"error": str(e), "result_id": str(result_id)},
-            ) from e
+        return _to_dto(row)
 
+    @db_errors(
+        "Failed to delete scraping result",
+        "SCRAPING_RESULT_DELETE_ERROR",
+        "result_id",
+    )
     async def delete(self, result_id: UUID) -> None:
         """Delete a scraping result."""
-        try:
-            # Check if exists first
-            existing = await self.get_by_id(result_id)
-            if not existing:
-                raise NotFoundError(
-                    message="Scraping result not found",
-                    error_code="SCRAPING_RESULT_NOT_FOUND",
-                    details={"result_id": str(result_id)},
-                )
-
-            stmt = delete(ScrapingResultModel).where(
-                ScrapingResultModel.id == result_id
+        _result_cache.pop(result_id)
+        stmt = lambda_stmt(
+            lambda: delete(ScrapingResultModel)
+            .where(ScrapingResultModel.id == result_id)
+            .returning(ScrapingResultModel.id)
+        )
+        result = await self._session.execute(stmt)
+
+        if result.scalar_one_or_none() is None:
+            raise NotFoundError(
+                message="Scraping result not found",
+                error_code="SCRAPING_RESULT_NOT_FOUND",
+                details={"result_id": str(result_id)},
             )
-            await self._session.execute(stmt)
-            await self._session.flush()
-
-        except NotFoundError:
-            raise
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to delete scraping result",
-                error_code="SCRAPING_RESULT_DELETE_ERROR",
-                details={"error": str(e), "result_id": str(result_id)},
-            ) from e
 
@@ -1,40 +1,33 @@
 """Repository interface for scraping results (API service)."""
 
-from abc import ABC, abstractmethod
-from typing import Optional, List
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple, Protocol
 from uuid import UUID
 
 from shared.errors import DatabaseError, NotFoundError
 from shared.types.enums import SourceType
 
 
+@dataclass(slots=True, frozen=True)
 class ScrapingResultDTO:
     """Data Transfer Object for scraping results."""
 
-    def __init__(
-        self,
-        id: UUID,
-        source_type: SourceType,
-        external_id: str,
-        title: str,
-        data: dict,
-        link: str,
-        scraped_at: str,
-    ) -> None:
-        """Initialize scraping result DTO."""
-        self.id = id
-        self.source_type = source_type
-        self.external_id = external_id
-        self.title = title
-        self.data = data
-        self.link = link
-        self.scraped_at = scraped_at
-
-
-class ScrapingRepositoryInterface(ABC):
-    """Interface for scraping result repository."""
-
-    @abstractmethod
+    id: UUID
+    source_type: SourceType
+    external_id: str
+    title: str
+    data: Optional[dict]  # None when listed without the payload
+    link: str
+    scraped_at: datetime
+
+
+class ScrapingRepositoryInterface(Protocol):
+    """Interface for scraping result repository.
+
+    Structural: implementations conform by shape and need not inherit from it.
+    """
+
     async def get_by_id(self, result_id: UUID) -> Optional[ScrapingResultDTO]:
         """Get scraping result by ID.
 
@@ -47,18 +40,41 @@ class ScrapingRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
+
+    async def get_by_ids(self, result_ids: List[UUID]) -> Dict[UUID, ScrapingResultDTO]:
+        """Get several scraping results by ID in a single query.
+
+        Args:
+            result_ids: UUIDs of the results
+
+        Returns:
+            Mapping of ID to ScrapingResultDTO for the results that exist; missing
+            IDs are simply absent
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
 
-    @abstractmethod
     async def list_all(
-        self, limit: int, offset: int, source_type: Optional[SourceType] = None
+        self,
+        limit: int,
+        offset: int,
+        source_type: Optional[SourceType] = None,
+        after_scraped_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
     ) -> List[ScrapingResultDTO]:
         """List scraping results with pagination.
 
         Args:
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (ignored when a keyset
+                position is given)
             source_type: Optional filter by source type
+            after_scraped_at: Keyset position; return results older than
+                this (together with after_id)
+            after_id: Keyset tie-breaker for results sharing after_scraped_at
 
         Returns:
             List of scraping result DTOs
@@ -66,9 +82,70 @@ class ScrapingRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
+
+    async def list_all_with_count(
+        self,
+        limit: int,
+        offset: int,
+        source_type: Optional[SourceType] = None,
+        after_scraped_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        include_data: bool = True,
+    ) -> Tuple[List[ScrapingResultDTO], int]:
+        """List scraping results with pagination and the total match count.
+
+        The page and the total are fetched in a single statement using a
+        ``COUNT(*) OVER ()`` window. With a keyset position the total counts
+        the results from that position onward.
+
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip (ignored when a keyset
+                position is given)
+            source_type: Optional filter by source type
+            after_scraped_at: Keyset position; return results older than
+                this (together with after_id)
+            after_id: Keyset tie-breaker for results sharing after_scraped_at
+            include_data: Whether to load the data payload (None otherwise)
+
+        Returns:
+            Tuple of (page of scraping result DTOs, total matching results)
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
+
+    def stream(
+        self,
+        limit: int,
+        offset: int,
+        source_type: Optional[SourceType] = None,
+        after_scraped_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        include_data: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream scraping results row by row from a server-side cursor.
+
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip (ignored when a keyset
+                position is given)
+            source_type: Optional filter by source type
+            after_scraped_at: Keyset position; return results older than
+                this (together with after_id)
+            after_id: Keyset tie-breaker for results sharing after_scraped_at
+            include_data: Whether to load the data payload (None otherwise)
+
+        Yields:
+            One column-name-to-value dictionary per scraping result
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
 
-    @abstractmethod
     async def update(self, result_id: UUID, updates: dict) -> ScrapingResultDTO:
         """Update a scraping result.
 
@@ -83,9 +160,8 @@ class ScrapingRepositoryInterface(ABC):
             NotFoundError: If result not found
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def delete(self, result_id: UUID) -> None:
         """Delete a scraping result.
 
@@ -96,5 +172,5 @@ class ScrapingRepositoryInterface(ABC):
             NotFoundError: If result not found
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
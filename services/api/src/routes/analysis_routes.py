@@ -1,11 +1,15 @@
 """Routes for analysis result operations."""
 
+from typing import AsyncIterator
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
-from services.api.src.database.base import get_db_session
+from services.api.src.constants import NDJSON_MEDIA_TYPE
+from services.api.src.database.base import AsyncSessionLocal
+from services.api.src.dependencies import get_analysis_handler
 from services.api.src.handlers.analysis_handler import AnalysisHandler
+from services.api.src.handlers.pagination import decode_cursor
 from services.api.src.models.analysis_schema import (
     AnalysisResultResponse,
     AnalysisResultListResponse,
@@ -20,57 +24,45 @@ from shared.types.enums import AnalysisType
 router = APIRouter(prefix=Routes.ANALYSIS, tags=["analysis"])
 
 
+async def _stream_analysis_results(
+    query_params: AnalysisResultQueryParams,
+) -> AsyncIterator[bytes]:
+    """Stream NDJSON lines using a session owned by the response body.
+
+    The request-scoped session may be closed before a streaming body is
+    fully sent, so the stream opens and closes its own.
+    """
+    async with AsyncSessionLocal() as session:
+        handler = AnalysisHandler(session)
+        async for line in handler.stream_ndjson(query_params):
+            yield line
+
+
 @router.get(
     "/most-frequent",
     response_model=MostFrequentTermsResponse,
-    summary="Get most frequent terms (on-demand aggregation)",
+    summary="Get most frequent terms",
     description=(
         "Get the most frequently occurring keywords across all analysis results. "
-        "This endpoint performs on-demand aggregation of KEYWORD_FREQUENCY records. "
+        "Results come from a periodically refreshed aggregate of KEYWORD_FREQUENCY records; "
+        "pass `stale_ok=false` to aggregate on demand for up-to-date (but slower) results. "
         "Returns aggregated statistics including total frequency across all documents "
         "and the number of documents containing each keyword. "
         "Results are ordered by total frequency (descending).\n\n"
         "Note: For pre-computed global frequent terms stored in the database, "
         "query the list endpoint with `analysis_type=FREQUENT_TERMS`."
     ),
-    responses={
-        200: {
-            "description": "List of most frequent terms",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "items": [
-                            {
-                                "keyword": "drug is safe to use",
-                                "total_frequency": 890,
-                                "document_count": 32,
-                            },
-                            {
-                                "keyword": "participants",
-                                "total_frequency": 750,
-                                "document_count": 28,
-                            },
-                            {
-                                "keyword": "clinical trials",
-                                "total_frequency": 650,
-                                "document_count": 45,
-                            },
-                        ],
-                        "limit": 10,
-                    }
-                }
-            },
-        }
-    },
 )
 async def get_most_frequent_terms(
     limit: int = Query(default=10, ge=1, le=100, description="Number of top terms to return (1-100). Returns the N most frequent keywords."),
     analysis_type: AnalysisType | None = Query(default=None, description="Optional filter by analysis type. Typically use KEYWORD_FREQUENCY (default) to aggregate per-document keyword/phrase counts. Note: Filtering by FREQUENT_TERMS is not recommended as those are already aggregated results."),
-    session: AsyncSession = Depends(get_db_session),
+    stale_ok: bool = Query(default=True, description="Allow precomputed results that may lag recent writes by up to one refresh interval. Set to false to aggregate on demand."),
+    handler: AnalysisHandler = Depends(get_analysis_handler),
 ) -> MostFrequentTermsResponse:
-    """Get most frequent terms across all analysis results with aggregated statistics (on-demand)."""
-    handler = AnalysisHandler(session)
-    return await handler.get_most_frequent_terms(limit=limit, analysis_type=analysis_type)
+    """Get most frequent terms across all analysis results with aggregated statistics."""
+    return await handler.get_most_frequent_terms(
+        limit=limit, analysis_type=analysis_type, stale_ok=stale_ok
+    )
 
 
 @router.get(
@@ -84,102 +76,40 @@ async def get_most_frequent_terms(
         "- **KEYWORD_FREQUENCY**: Per-document keyword frequency counts\n"
         "- **FREQUENT_TERMS**: Globally aggregated most frequent terms (pre-computed)\n"
         "- **CONDITION_GROUPING**: Medical conditions extracted from documents\n"
-        "- **CATEGORY_GROUPING**: Categories (phase, study type, etc.) extracted from documents"
+        "- **CATEGORY_GROUPING**: Categories (phase, study type, etc.) extracted from documents\n\n"
+        f"Send 'Accept: {NDJSON_MEDIA_TYPE}' to stream one result per line."
     ),
-    responses={
-        200: {
-            "description": "List of analysis results",
-            "content": {
-                "application/json": {
-                    "examples": {
-                        "keyword_frequency": {
-                            "summary": "KEYWORD_FREQUENCY results (with phrases)",
-                            "value": {
-                                "items": [
-                                    {
-                                        "id": "123e4567-e89b-12d3-a456-426614174000",
-                                        "scraping_result_id": "223e4567-e89b-12d3-a456-426614174000",
-                                        "analysis_type": "KEYWORD_FREQUENCY",
-                                        "keyword": "drug is safe to use",
-                                        "frequency": 15,
-                                        "metadata": {"source_type": "FDA_DRUG_LABELS"},
-                                        "created_at": "2024-01-01T00:00:00Z",
-                                    },
-                                    {
-                                        "id": "123e4567-e89b-12d3-a456-426614174001",
-                                        "scraping_result_id": "223e4567-e89b-12d3-a456-426614174000",
-                                        "analysis_type": "KEYWORD_FREQUENCY",
-                                        "keyword": "treatment",
-                                        "frequency": 10,
-                                        "metadata": {"source_type": "CLINICAL_TRIALS"},
-                                        "created_at": "2024-01-01T00:00:00Z",
-                                    }
-                                ],
-                                "total": 1250,
-                                "limit": 50,
-                                "offset": 0,
-                            }
-                        },
-                        "frequent_terms": {
-                            "summary": "FREQUENT_TERMS results (global aggregation)",
-                            "value": {
-                                "items": [
-                                    {
-                                        "id": "123e4567-e89b-12d3-a456-426614174002",
-                                        "scraping_result_id": None,
-                                        "analysis_type": "FREQUENT_TERMS",
-                                        "keyword": "drug is safe to use",
-                                        "frequency": 890,
-                                        "metadata": {
-                                            "document_count": 32,
-                                            "rank": 1,
-                                            "aggregated_from": "KEYWORD_FREQUENCY"
-                                        },
-                                        "created_at": "2024-01-01T00:00:00Z",
-                                    },
-                                    {
-                                        "id": "123e4567-e89b-12d3-a456-426614174003",
-                                        "scraping_result_id": None,
-                                        "analysis_type": "FREQUENT_TERMS",
-                                        "keyword": "participants",
-                                        "frequency": 750,
-                                        "metadata": {
-                                            "document_count": 28,
-                                            "rank": 2,
-                                            "aggregated_from": "KEYWORD_FREQUENCY"
-                                        },
-                                        "created_at": "2024-01-01T00:00:00Z",
-                                    }
-                                ],
-                                "total": 50,
-                                "limit": 50,
-                                "offset": 0,
-                            }
-                        }
-                    }
-                }
-            },
-        }
-    },
 )
 async def list_analysis_results(
+    request: Request,
     limit: int = Query(default=50, ge=1, le=100, description="Maximum number of results per page (1-100)"),
-    offset: int = Query(default=0, ge=0, description="Number of results to skip for pagination"),
+    offset: int = Query(default=0, ge=0, deprecated=True, description="Number of results to skip for pagination. Deprecated: use cursor, which does not rescan skipped rows."),
     analysis_type: AnalysisType | None = Query(default=None, description="Filter by analysis type: KEYWORD_FREQUENCY (per-document counts), FREQUENT_TERMS (global aggregation), CONDITION_GROUPING, or CATEGORY_GROUPING"),
     scraping_result_id: UUID | None = Query(default=None, description="Filter by scraping result UUID. Note: FREQUENT_TERMS results have null scraping_result_id as they are global aggregations."),
     keyword: str | None = Query(default=None, description="Filter by keyword (case-insensitive exact match). Returns all entries where the keyword exactly matches this value."),
-    session: AsyncSession = Depends(get_db_session),
-) -> AnalysisResultListResponse:
+    cursor: str | None = Query(default=None, description="Cursor from a previous page's next_cursor. Takes precedence over offset."),
+    handler: AnalysisHandler = Depends(get_analysis_handler),
+) -> Response:
     """List analysis results with pagination and filtering options."""
-    handler = AnalysisHandler(session)
     query_params = AnalysisResultQueryParams(
         limit=limit,
         offset=offset,
         analysis_type=analysis_type,
         scraping_result_id=scraping_result_id,
         keyword=keyword,
+        cursor=cursor,
+    )
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        if cursor:
+            # Reject a bad cursor with a 400 before the streamed 200 starts
+            decode_cursor(cursor)
+        return StreamingResponse(
+            _stream_analysis_results(query_params), media_type=NDJSON_MEDIA_TYPE
+        )
+
+    return Response(
+        content=await handler.list_all(query_params), media_type="application/json"
     )
-    return await handler.list_all(query_params)
 
 
 @router.put(
@@ -191,10 +121,9 @@ async def list_analysis_results(
 async def update_analysis_result(
     result_id: UUID,
     updates: AnalysisResultUpdateRequest,
-    session: AsyncSession = Depends(get_db_session),
+    handler: AnalysisHandler = Depends(get_analysis_handler),
 ) -> AnalysisResultResponse:
     """Update analysis result."""
-    handler = AnalysisHandler(session)
     return await handler.update(result_id, updates)
 
 
@@ -206,10 +135,9 @@ async def update_analysis_result(
 )
 async def get_analysis_result(
     result_id: UUID,
-    session: AsyncSession = Depends(get_db_session),
+    handler: AnalysisHandler = Depends(get_analysis_handler),
 ) -> AnalysisResultResponse:
     """Get analysis result by ID."""
-    handler = AnalysisHandler(session)
     return await handler.get_by_id(result_id)
 
 
@@ -221,9 +149,8 @@ async def get_analysis_result(
 )
 async def delete_analysis_result(
     result_id: UUID,
-    session: AsyncSession = Depends(get_db_session),
+    handler: AnalysisHandler = Depends(get_analysis_handler),
 ) -> None:
     """Delete analysis result."""
-    handler = AnalysisHandler(session)
     await handler.delete(result_id)
 
@@ -1,10 +1,14 @@
 """Routes for scraping result operations."""
 
+from typing import AsyncIterator
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
-from services.api.src.database.base import get_db_session
+from services.api.src.constants import NDJSON_MEDIA_TYPE
+from services.api.src.database.base import AsyncSessionLocal
+from services.api.src.dependencies import get_scraping_handler
+from services.api.src.handlers.pagination import decode_cursor
 from services.api.src.handlers.scraping_handler import ScrapingHandler
 from services.api.src.models.scraping_schema import (
     ScrapingResultResponse,
@@ -19,6 +23,20 @@ from shared.types.enums import SourceType
 router = APIRouter(prefix=Routes.SCRAPING, tags=["scraping"])
 
 
+async def _stream_scraping_results(
+    query_params: ScrapingResultQueryParams,
+) -> AsyncIterator[bytes]:
+    """Stream NDJSON lines using a session owned by the response body.
+
+    The request-scoped session may be closed before a streaming body is
+    fully sent, so the stream opens and closes its own.
+    """
+    async with AsyncSessionLocal() as session:
+        handler = ScrapingHandler(session)
+        async for line in handler.stream_ndjson(query_params):
+            yield line
+
+
 @router.get(
     "/{result_id}",
     response_model=ScrapingResultResponse,
@@ -27,10 +45,9 @@ router = APIRouter(prefix=Routes.SCRAPING, tags=["scraping"])
 )
 async def get_scraping_result(
     result_id: UUID,
-    session: AsyncSession = Depends(get_db_session),
+    handler: ScrapingHandler = Depends(get_scraping_handler),
 ) -> ScrapingResultResponse:
     """Get scraping result by ID."""
-    handler = ScrapingHandler(session)
     return await handler.get_by_id(result_id)
 
 
@@ -38,20 +55,50 @@ async def get_scraping_result(
     "",
     response_model=ScrapingResultListResponse,
     summary="List scraping results",
-    description="List scraping results with pagination and optional filtering",
+    description=(
+        "List scraping results with pagination and optional filtering. "
+        f"Send 'Accept: {NDJSON_MEDIA_TYPE}' to stream one result per line."
+    ),
 )
 async def list_scraping_results(
+    request: Request,
     limit: int = Query(default=50, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(
+        default=0,
+        ge=0,
+        deprecated=True,
+        description="Deprecated: use cursor, which does not rescan skipped rows.",
+    ),
     source_type: SourceType | None = Query(default=None),
-    session: AsyncSession = Depends(get_db_session),
-) -> ScrapingResultListResponse:
+    cursor: str | None = Query(
+        default=None,
+        description="Cursor from a previous page's next_cursor. Takes precedence over offset.",
+    ),
+    include_data: bool = Query(
+        default=True,
+        description="Set to false to skip the data payload (returned as null) for lighter listings.",
+    ),
+    handler: ScrapingHandler = Depends(get_scraping_handler),
+) -> Response:
     """List scraping results with pagination."""
-    handler = ScrapingHandler(session)
     query_params = ScrapingResultQueryParams(
-        limit=limit, offset=offset, source_type=source_type
+        limit=limit,
+        offset=offset,
+        source_type=source_type,
+        cursor=cursor,
+        include_data=include_data,
+    )
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        if cursor:
+            # Reject a bad cursor with a 400 before the streamed 200 starts
+            decode_cursor(cursor)
+        return StreamingResponse(
+            _stream_scraping_results(query_params), media_type=NDJSON_MEDIA_TYPE
+        )
+
+    return Response(
+        content=await handler.list_all(query_params), media_type="application/json"
     )
-    return await handler.list_all(query_params)
 
 
 @router.put(
@@ -63,10 +110,9 @@ async def list_scraping_results(
 async def update_scraping_result(
     result_id: UUID,
     updates: ScrapingResultUpdateRequest,
-    session: AsyncSession = Depends(get_db_session),
+    handler: ScrapingHandler = Depends(get_scraping_handler),
 ) -> ScrapingResultResponse:
     """Update scraping result."""
-    handler = ScrapingHandler(session)
     return await handler.update(result_id, updates)
 
 
@@ -78,9 +124,8 @@ async def update_scraping_result(
 )
 async def delete_scraping_result(
     result_id: UUID,
-    session: AsyncSession = Depends(get_db_session),
+    handler: ScrapingHandler = Depends(get_scraping_handler),
 ) -> None:
     """Delete scraping result."""
-    handler = ScrapingHandler(session)
     await handler.delete(result_id)
 
@@ -0,0 +1 @@
+"""Background tasks run inside the API process."""
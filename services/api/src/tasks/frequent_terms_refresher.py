@@ -0,0 +1,69 @@
+"""Periodic refresh of the frequent terms materialized view."""
+
+import asyncio
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from services.api.src.repository.analysis_repository import AnalysisRepository
+from shared.logging.logger_interface import LoggerInterface
+
+
+class FrequentTermsRefresher:
+    """Background task that refreshes the frequent terms view on an interval."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        logger: LoggerInterface,
+        interval_seconds: int,
+    ) -> None:
+        """Initialize refresher.
+
+        Args:
+            session_factory: Factory for database sessions
+            logger: Logger instance
+            interval_seconds: Seconds between refreshes
+        """
+        self._session_factory = session_factory
+        self._logger = logger
+        self._interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """Start refreshing in the background."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Refresh the view every interval until cancelled."""
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            await self._refresh()
+
+    async def _refresh(self) -> None:
+        """Refresh the view once, logging instead of raising on failure."""
+        try:
+            async with self._session_factory() as session:
+                refreshed = await AnalysisRepository(session).refresh_frequent_terms()
+                await session.commit()
+
+            if refreshed:
+                self._logger.debug("Refreshed frequent terms view")
+        except Exception as e:
+            self._logger.error(
+                f"Failed to refresh frequent terms view: {str(e)}",
+                extra={"error": str(e)},
+            )
+            # Don't re-raise - keep refreshing on the next interval
@@ -7,4 +7,17 @@ SCRAPER_ENABLED = settings.scraper_enabled
 SCRAPER_TIMEOUT = settings.scraper_timeout_seconds
 SCRAPER_RETRY_ATTEMPTS = settings.scraper_retry_attempts
 SCRAPER_RETRY_DELAY = settings.scraper_retry_delay_seconds
+SCRAPER_DB_POOL_SIZE = settings.scraper_db_pool_size or settings.db_pool_size
+SCRAPER_SCHEDULE_CRON = settings.scraper_schedule_cron
+
+# Outbound HTTP
+HTTP_MAX_RETRIES = settings.http_max_retries
+HTTP_RETRY_DELAY = settings.http_retry_delay_seconds
+
+# Sources
+DAILYMED_BASE_URL = settings.dailymed_base_url
+CLINICAL_TRIALS_API_BASE_URL = settings.clinical_trials_api_base_url
+CLINICAL_TRIALS_API_TIMEOUT = settings.clinical_trials_api_timeout_seconds
+CLINICAL_TRIALS_PAGE_SIZE = settings.clinical_trials_page_size
+CLINICAL_TRIALS_MAX_PAGES = settings.clinical_trials_max_pages
 
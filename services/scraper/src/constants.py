@@ -11,3 +11,6 @@ from shared.types.enums import SourceType
 # Service name for logging
 SERVICE_NAME = "scraper"
 
+
+# Identifiers of failed items included in a scraper's per-run warning
+FAILED_ITEM_LOG_SAMPLE = 50
@@ -4,14 +4,12 @@ import asyncio
 import signal
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from services.scraper.src.config import SCRAPER_ENABLED
+from services.scraper.src.config import SCRAPER_DB_POOL_SIZE, SCRAPER_ENABLED
 from services.scraper.src.constants import SERVICE_NAME
 from services.scraper.src.scheduler.daily_scheduler import DailyScheduler
+from services.scraper.src.scraper.http_client import create_http_client
 from services.scraper.src.scraper.scraper_factory import ScraperFactory
 from services.scraper.src.repository.scraping_repository import ScrapingRepository
-from services.scraper.src.repository.scraping_repository_interface import (
-    ScrapingResultDTO as RepoScrapingResultDTO,
-)
 from shared.config import settings
 from shared.database.engine_factory import create_database_engine
 from shared.logging.logger_factory import LoggerFactory
@@ -27,7 +25,7 @@ class ScraperService:
         self._logger: LoggerInterface = LoggerFactory.create_logger(SERVICE_NAME)
         self._scheduler: DailyScheduler | None = None
         self._engine = create_database_engine(
-            pool_size=settings.db_pool_size,
+            pool_size=SCRAPER_DB_POOL_SIZE,
             max_overflow=settings.db_max_overflow,
             pool_timeout=settings.db_pool_timeout,
             pool_recycle=settings.db_pool_recycle,
@@ -37,85 +35,79 @@ class ScraperService:
             class_=AsyncSession,
             expire_on_commit=False,
         )
+        # One pooled client for every scraper and run, so connections to
+        # the source APIs are reused between scheduled runs
+        self._http_client = create_http_client()
         self._running = False
 
     async def run_scraping_task(self) -> None:
         """Execute the scraping task for all sources."""
-        await self._logger.info("Starting scraping task")
+        self._logger.info("Starting scraping task")
 
         sources = [SourceType.FDA_DRUG_LABELS, SourceType.CLINICAL_TRIALS]
 
-        for source_type in sources:
-            try:
-                await self._scrape_source(source_type)
-            except Exception as e:
-                await self._logger.error(
-                    f"Failed to scrape {source_type.value}: {str(e)}",
-                    extra={"source_type": source_type.value, "error": str(e)},
+        # Sources share no data, so fetch them concurrently. An AsyncSession
+        # must not be used by two tasks at once, so each source gets its own.
+        outcomes = await asyncio.gather(
+            *(self._scrape_source_in_session(source_type) for source_type in sources),
+            return_exceptions=True,
+        )
+        for source_type, outcome in zip(sources, outcomes):
+            if isinstance(outcome, Exception):
+                # The other sources are unaffected by this failure
+                self._logger.error(
+                    f"Failed to scrape {source_type.value}: {str(outcome)}",
+                    extra={"source_type": source_type.value, "error": str(outcome)},
                 )
-                # Continue with next source even if one fails
 
-        await self._logger.info("Scraping task completed")
+        self._logger.info("Scraping task completed")
 
-    async def _scrape_source(self, source_type: SourceType) -> None:
+    async def _scrape_source_in_session(self, source_type: SourceType) -> None:
+        """Scrape a source using a session of its own.
+
+        Args:
+            source_type: Type of source to scrape
+        """
+        async with self._session_factory() as session:
+            try:
+                await self._scrape_source(source_type, session)
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def _scrape_source(
+        self, source_type: SourceType, session: AsyncSession
+    ) -> None:
         """Scrape data from a specific source.
 
         Args:
             source_type: Type of source to scrape
+            session: Database session owned by this source's scrape
         """
-        await self._logger.info(f"Scraping source: {source_type.value}")
+        self._logger.info(f"Scraping source: {source_type.value}")
 
         # Create scraper
-        scraper = ScraperFactory.create(source_type, self._logger)
+        scraper = ScraperFactory.create(source_type, self._logger, self._http_client)
 
         # Scrape data
         results = await scraper.scrape()
 
-        # Save to database
-        async with self._session_factory() as session:
-            repository = ScrapingRepository(session)
-
-            saved_count = 0
-            skipped_count = 0
-
-            for result in results:
-                try:
-                    # Check if already exists
-                    exists = await repository.exists_by_external_id(
-                        result.external_id, result.source_type
-                    )
-
-                    if exists:
-                        skipped_count += 1
-                        await self._logger.debug(
-                            f"Skipping duplicate: {result.external_id}"
-                        )
-                        continue
-
-                    # Convert to repository DTO
-                    repo_dto = RepoScrapingResultDTO(
-                        id=result.id,
-                        source_type=result.source_type,
-                        external_id=result.external_id,
-                        title=result.title,
-                        data=result.data,
-                        link=result.link,
-                        scraped_at=result.scraped_at,
-                    )
-
-                    await repository.create(repo_dto)
-                    saved_count += 1
-
-                except Exception as e:
-                    await self._logger.error(
-                        f"Failed to save result {result.external_id}: {str(e)}",
-                        extra={"external_id": result.external_id, "error": str(e)},
-                    )
-                    continue
-
-            await session.commit()
-
-        await self._logger.info(
+        # Drop already-stored records up front with one lookup, so their
+        # payloads are never sent; ON CONFLICT in create_many still covers
+        # anything inserted concurrently
+        repository = ScrapingRepository(session)
+        existing = await repository.existing_external_ids(
+            [result.external_id for result in results], source_type
+        )
+        new_results = [result for result in results if result.external_id not in existing]
+
+        inserted_ids = await repository.create_many(new_results)
+        saved_count = len(inserted_ids)
+        skipped_count = len(results) - saved_count
+
+        await session.commit()
+
+        self._logger.info(
             f"Completed scraping {source_type.value}: "
             f"{saved_count} saved, {skipped_count} skipped"
         )
@@ -123,10 +115,16 @@ class ScraperService:
     async def start(self) -> None:
         """Start the scraper service."""
         if not SCRAPER_ENABLED:
-            await self._logger.warning("Scraper service is disabled")
+            self._logger.warning("Scraper service is disabled")
             return
 
-        await self._logger.info("Starting scraper service")
+        self._logger.info(
+            "Starting scraper service",
+            extra={
+                "db_pool_size": SCRAPER_DB_POOL_SIZE,
+                "db_max_overflow": settings.db_max_overflow,
+            },
+        )
 
         self._running = True
 
@@ -142,18 +140,19 @@ class ScraperService:
             while self._running:
                 await asyncio.sleep(60)  # Sleep and check running status
         except KeyboardInterrupt:
-            await self._logger.info("Received shutdown signal")
+            self._logger.info("Received shutdown signal")
 
     async def stop(self) -> None:
         """Stop the scraper service."""
-        await self._logger.info("Stopping scraper service")
+        self._logger.info("Stopping scraper service")
         self._running = False
 
         if self._scheduler:
             await self._scheduler.stop()
 
+        await self._http_client.aclose()
         await self._engine.dispose()
-        await self._logger.info("Scraper service stopped")
+        self._logger.info("Scraper service stopped")
 
 
 async def main() -> None:
@@ -171,7 +170,7 @@ async def main() -> None:
     try:
         await service.start()
     except Exception as e:
-        await service._logger.error(f"Service failed: {str(e)}", extra={"error": str(e)})
+        service._logger.error(f"Service failed: {str(e)}", extra={"error": str(e)})
         raise
     finally:
         await service.stop()
@@ -1,20 +1,33 @@
 """Repository implementation for scraping results."""
 
-from typing import Optional
+from typing import Dict, List, Optional, Set
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import String, any_, bindparam, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 
 from services.api.src.database.models import ScrapingResultModel
-from services.scraper.src.repository.scraping_repository_interface import (
-    ScrapingRepositoryInterface,
-    ScrapingResultDTO,
-)
-from shared.errors import DatabaseError
+from services.scraper.src.models.scraping_result_dto import ScrapingResultDTO
+from shared.errors import db_errors
 from shared.types.enums import SourceType
 
 
-class ScrapingRepository(ScrapingRepositoryInterface):
+# Read paths select plain columns (keyed like the DTO's fields) so rows skip
+# ORM instance materialization and the session identity map. Fixed-shape
+# lookups are wrapped in lambda_stmt so the statement is built once per
+# process and later calls only bind new values.
+_RESULT_COLUMNS = (
+    ScrapingResultModel.id,
+    ScrapingResultModel.source_type,
+    ScrapingResultModel.external_id,
+    ScrapingResultModel.title,
+    ScrapingResultModel.data,
+    ScrapingResultModel.link,
+    ScrapingResultModel.scraped_at,
+)
+
+
+class ScrapingRepository:
     """SQLAlchemy implementation of scraping repository."""
 
     def __init__(self, session: AsyncSession) -> None:
@@ -25,113 +38,149 @@ class ScrapingRepository(ScrapingRepositoryInterface):
         """
         self._session = session
 
+    @db_errors("Failed to create scraping result", "SCRAPING_RESULT_CREATE_ERROR")
     async def create(self, result: ScrapingResultDTO) -> UUID:
         """Create a new scraping result."""
-        try:
-            model = ScrapingResultModel(
-                id=result.id,
-                source_type=result.source_type,
-                external_id=result.external_id,
-                title=result.title,
-                data=result.data,
-                link=result.link,
-                scraped_at=result.scraped_at,
+        model = ScrapingResultModel(
+            id=result.id,
+            source_type=result.source_type,
+            external_id=result.external_id,
+            title=result.title,
+            data=result.data,
+            link=result.link,
+            scraped_at=result.scraped_at,
+        )
+
+        self._session.add(model)
+        await self._session.flush()
+        return model.id
+
+    @db_errors(
+        "Failed to create scraping results in bulk",
+        "SCRAPING_RESULT_BULK_CREATE_ERROR",
+        "results",
+    )
+    async def create_many(self, results: List[ScrapingResultDTO]) -> List[UUID]:
+        """Insert scraping results in bulk, skipping ones that already exist."""
+        if not results:
+            return []
+
+        # Executed as multi-row INSERTs (SQLAlchemy batches the parameter
+        # sets); RETURNING only reports rows that were actually inserted
+        stmt = (
+            insert(ScrapingResultModel)
+            .on_conflict_do_nothing(
+                index_elements=[ScrapingResultModel.external_id, ScrapingResultModel.source_type]
             )
-
-            self._session.add(model)
-            await self._session.flush()
-            return model.id
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to create scraping result",
-                error_code="SCRAPING_RESULT_CREATE_ERROR",
-                details={"error": str(e)},
-            ) from e
-
+            .returning(ScrapingResultModel.id)
+        )
+        result = await self._session.execute(
+            stmt,
+            [
+                {
+                    "id": dto.id,
+                    "source_type": dto.source_type,
+                    "external_id": dto.external_id,
+                    "title": dto.title,
+                    "data": dto.data,
+                    "link": dto.link,
+                    "scraped_at": dto.scraped_at,
+                }
+                for dto in results
+            ],
+        )
+        return list(result.scalars())
+
+    @db_errors(
+        "Failed to get scraping result by ID",
+        "SCRAPING_RESULT_GET_ERROR",
+        "result_id",
+    )
     async def get_by_id(self, result_id: UUID) -> Optional[ScrapingResultDTO]:
         """Get scraping result by ID."""
-        try:
-            stmt = select(ScrapingResultModel).where(ScrapingResultModel.id == result_id)
-            result = await self._session.execute(stmt)
-            model = result.scalar_one_or_none()
-
-            if not model:
-                return None
-
-            return ScrapingResultDTO(
-                id=model.id,
-                source_type=model.source_type,
-                external_id=model.external_id,
-                title=model.title,
-                data=model.data,
-                link=model.link,
-                scraped_at=model.scraped_at,
-            )
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get scraping result by ID",
-                error_code="SCRAPING_RESULT_GET_ERROR",
-                details={"error": str(e), "result_id": str(result_id)},
-            ) from e
-
+        stmt = lambda_stmt(
+            lambda: select(*_RESULT_COLUMNS).where(ScrapingResultModel.id == result_id)
+        )
+        result = await self._session.execute(stmt)
+        row = result.mappings().one_or_none()
+
+        return ScrapingResultDTO(**row) if row else None
+
+    @db_errors(
+        "Failed to get scraping results by IDs",
+        "SCRAPING_RESULT_GET_MANY_ERROR",
+        "result_ids",
+    )
+    async def get_by_ids(self, result_ids: List[UUID]) -> Dict[UUID, ScrapingResultDTO]:
+        """Get several scraping results by ID in a single query."""
+        if not result_ids:
+            return {}
+
+        stmt = select(*_RESULT_COLUMNS).where(ScrapingResultModel.id.in_(result_ids))
+        result = await self._session.execute(stmt)
+
+        return {row["id"]: ScrapingResultDTO(**row) for row in result.mappings()}
+
+    @db_errors(
+        "Failed to get scraping result by external ID",
+        "SCRAPING_RESULT_GET_BY_EXTERNAL_ID_ERROR",
+        "external_id",
+        "source_type",
+    )
     async def get_by_external_id(
         self, external_id: str, source_type: SourceType
     ) -> Optional[ScrapingResultDTO]:
         """Get scraping result by external ID."""
-        try:
-            stmt = select(ScrapingResultModel).where(
+        stmt = lambda_stmt(
+            lambda: select(*_RESULT_COLUMNS).where(
                 ScrapingResultModel.external_id == external_id,
                 ScrapingResultModel.source_type == source_type,
             )
-            result = await self._session.execute(stmt)
-            model = result.scalar_one_or_none()
-
-            if not model:
-                return None
-
-            return ScrapingResultDTO(
-                id=model.id,
-                source_type=model.source_type,
-                external_id=model.external_id,
-                title=model.title,
-                data=model.data,
-                link=model.link,
-                scraped_at=model.scraped_at,
-            )
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to get scraping result by external ID",
-                error_code="SCRAPING_RESULT_GET_BY_EXTERNAL_ID_ERROR",
-                details={
-                    "error": str(e),
-                    "external_id": external_id,
-                    "source_type": source_type.value,
-                },
-            ) from e
-
+        )
+        result = await self._session.execute(stmt)
+        row = result.mappings().one_or_none()
+
+        return ScrapingResultDTO(**row) if row else None
+
+    @db_errors(
+        "Failed to check scraping result existence",
+        "SCRAPING_RESULT_EXISTS_ERROR",
+        "external_id",
+        "source_type",
+    )
     async def exists_by_external_id(
         self, external_id: str, source_type: SourceType
     ) -> bool:
         """Check if scraping result exists."""
-        try:
-            stmt = select(ScrapingResultModel.id).where(
+        stmt = lambda_stmt(
+            lambda: select(ScrapingResultModel.id).where(
                 ScrapingResultModel.external_id == external_id,
                 ScrapingResultModel.source_type == source_type,
             )
-            result = await self._session.execute(stmt)
-            return result.scalar_one_or_none() is not None
-
-        except Exception as e:
-            raise DatabaseError(
-                message="Failed to check scraping result existence",
-                error_code="SCRAPING_RESULT_EXISTS_ERROR",
-                details={
-                    "error": str(e),
-                    "external_id": external_id,
-                    "source_type": source_type.value,
-                },
-            ) from e
-
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    @db_errors(
+        "Failed to check existing external IDs",
+        "SCRAPING_RESULT_EXISTING_IDS_ERROR",
+        "external_ids",
+        "source_type",
+    )
+    async def existing_external_ids(
+        self, external_ids: List[str], source_type: SourceType
+    ) -> Set[str]:
+        """Find which external IDs are already stored, in a single query."""
+        if not external_ids:
+            return set()
+
+        # "= ANY($n::varchar[])" binds the whole list as one array parameter,
+        # so the SQL text (and its prepared statement) is the same for every
+        # batch size, unlike IN, which renders one placeholder per ID
+        stmt = select(ScrapingResultModel.external_id).where(
+            ScrapingResultModel.source_type == source_type,
+            ScrapingResultModel.external_id
+            == any_(bindparam("external_ids", external_ids, type_=ARRAY(String))),
+        )
+        result = await self._session.execute(stmt)
+        return set(result.scalars())
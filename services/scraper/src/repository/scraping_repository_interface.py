@@ -1,41 +1,21 @@
 """Repository interface for scraping results."""
 
-from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Protocol, Set
 from uuid import UUID
 
+from services.scraper.src.models.scraping_result_dto import ScrapingResultDTO
 from shared.errors import DatabaseError, NotFoundError
 from shared.types.enums import SourceType
 
+__all__ = ["ScrapingRepositoryInterface", "ScrapingResultDTO"]
+
+
+class ScrapingRepositoryInterface(Protocol):
+    """Interface for scraping result repository.
+
+    Structural: implementations conform by shape and need not inherit from it.
+    """
 
-class ScrapingResultDTO:
-    """Data Transfer Object for scraping results."""
-
-    def __init__(
-        self,
-        id: UUID,
-        source_type: SourceType,
-        external_id: str,
-        title: str,
-        data: dict,
-        link: str,
-        scraped_at: datetime,
-    ) -> None:
-        """Initialize scraping result DTO."""
-        self.id = id
-        self.source_type = source_type
-        self.external_id = external_id
-        self.title = title
-        self.data = data
-        self.link = link
-        self.scraped_at = scraped_at
-
-
-class ScrapingRepositoryInterface(ABC):
-    """Interface for scraping result repository."""
-
-    @abstractmethod
     async def create(self, result: ScrapingResultDTO) -> UUID:
         """Create a new scraping result.
 
@@ -48,9 +28,23 @@ class ScrapingRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
+
+    async def create_many(self, results: List[ScrapingResultDTO]) -> List[UUID]:
+        """Insert scraping results in bulk, skipping ones that already exist.
+
+        Args:
+            results: Scraping result DTOs
+
+        Returns:
+            UUIDs of the newly inserted results (existing external IDs are
+            skipped and not returned)
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
 
-    @abstractmethod
     async def get_by_id(self, result_id: UUID) -> Optional[ScrapingResultDTO]:
         """Get scraping result by ID.
 
@@ -63,9 +57,23 @@ class ScrapingRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
+
+    async def get_by_ids(self, result_ids: List[UUID]) -> Dict[UUID, ScrapingResultDTO]:
+        """Get several scraping results by ID in a single query.
+
+        Args:
+            result_ids: UUIDs of the results
+
+        Returns:
+            Mapping of ID to ScrapingResultDTO for the results that exist; missing
+            IDs are simply absent
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
 
-    @abstractmethod
     async def get_by_external_id(
         self, external_id: str, source_type: SourceType
     ) -> Optional[ScrapingResultDTO]:
@@ -81,9 +89,8 @@ class ScrapingRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def exists_by_external_id(
         self, external_id: str, source_type: SourceType
     ) -> bool:
@@ -99,5 +106,22 @@ class ScrapingRepositoryInterface(ABC):
         Raises:
             DatabaseError: If database operation fails
         """
-        pass
+        ...
+
+    async def existing_external_ids(
+        self, external_ids: List[str], source_type: SourceType
+    ) -> Set[str]:
+        """Find which external IDs are already stored, in a single query.
+
+        Args:
+            external_ids: External IDs from source system
+            source_type: Type of source
+
+        Returns:
+            Subset of external_ids that already exist
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
 
@@ -0,0 +1,145 @@
+"""Minimal five-field cron expression parser.
+
+Follows the semantics the scheduler had with APScheduler's ``CronTrigger``
+(fields passed as keyword arguments), so existing schedules keep firing at
+the same times: weekday 0 is Monday, weekday and month names (``mon-fri``,
+``jan``) are accepted, and all fields must match, including day-of-month
+and weekday together.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, Optional, Tuple
+
+# Upper bound on days searched for the next fire time; covers leap-day
+# schedules such as "0 0 29 2 *"
+_MAX_SEARCH_DAYS = 366 * 8
+
+_WEEKDAY_NAMES = {
+    name: index for index, name in enumerate(("mon", "tue", "wed", "thu", "fri", "sat", "sun"))
+}
+_MONTH_NAMES = {
+    name: index
+    for index, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+
+
+def _parse_value(text: str, names: Dict[str, int]) -> int:
+    """Parse a field value given as a number or a name (case-insensitive)."""
+    named = names.get(text.lower())
+    return named if named is not None else int(text)
+
+
+def _parse_field(
+    field: str, low: int, high: int, names: Optional[Dict[str, int]] = None
+) -> FrozenSet[int]:
+    """Expand one cron field into the set of values it matches.
+
+    Supports ``*``, single values, ranges (``a-b``), steps (``*/n``,
+    ``a/n``, ``a-b/n``) and comma-separated lists of those.
+
+    Args:
+        field: Cron field text
+        low: Smallest allowed value
+        high: Largest allowed value
+        names: Optional names accepted in place of numbers
+
+    Returns:
+        Matching values
+
+    Raises:
+        ValueError: If the field is malformed or out of range
+    """
+    names = names or {}
+    values = set()
+    for part in field.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Invalid step in cron field: {field}")
+
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start_text, end_text = base.split("-", 1)
+            start, end = _parse_value(start_text, names), _parse_value(end_text, names)
+        else:
+            start = _parse_value(base, names)
+            end = high if step_text else start
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron field out of range: {field}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronExpression:
+    """Parsed ``minute hour day month weekday`` cron expression."""
+
+    def __init__(self, expression: str) -> None:
+        """Parse a cron expression.
+
+        Args:
+            expression: Five-field cron expression (weekday 0 is Monday)
+
+        Raises:
+            ValueError: If the expression is malformed
+        """
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression}")
+
+        minute, hour, day, month, weekday = parts
+        self.expression = expression
+        self._minutes = _parse_field(minute, 0, 59)
+        self._hours = _parse_field(hour, 0, 23)
+        self._days = _parse_field(day, 1, 31)
+        self._months = _parse_field(month, 1, 12, _MONTH_NAMES)
+        self._weekdays = _parse_field(weekday, 0, 6, _WEEKDAY_NAMES)
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first fire time strictly after ``moment``.
+
+        Args:
+            moment: Reference time, in the zone the expression is meant for;
+                its tzinfo is carried to the result
+
+        Returns:
+            Next matching time, at minute resolution
+
+        Raises:
+            ValueError: If the expression never matches (e.g. "0 0 31 2 *")
+        """
+        start = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        for offset in range(_MAX_SEARCH_DAYS):
+            candidate_day = day + timedelta(days=offset)
+            if not self._matches_day(candidate_day):
+                continue
+            time_of_day = self._first_time(
+                (start.hour, start.minute) if offset == 0 else (0, 0)
+            )
+            if time_of_day is not None:
+                hour, minute = time_of_day
+                return candidate_day.replace(hour=hour, minute=minute)
+        raise ValueError(f"Cron expression never fires: {self.expression}")
+
+    def _matches_day(self, moment: datetime) -> bool:
+        """Check the month, day and weekday fields (all must match)."""
+        return (
+            moment.month in self._months
+            and moment.day in self._days
+            and moment.weekday() in self._weekdays
+        )
+
+    def _first_time(self, earliest: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Return the first matching (hour, minute) not before ``earliest``."""
+        earliest_hour, earliest_minute = earliest
+        for hour in sorted(h for h in self._hours if h >= earliest_hour):
+            floor = earliest_minute if hour == earliest_hour else 0
+            minutes = [m for m in self._minutes if m >= floor]
+            if minutes:
+                return hour, min(minutes)
+        return None
@@ -1,12 +1,12 @@
 """Daily scheduler for scraper service."""
 
 import asyncio
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Callable, Awaitable
 
-from shared.config import settings
+from services.scraper.src.scheduler.cron_expression import CronExpression
+from services.scraper.src.config import SCRAPER_SCHEDULE_CRON
 from shared.logging.logger_interface import LoggerInterface
 from shared.constants import ScheduleCron
 
@@ -27,69 +27,100 @@ class DailyScheduler:
         """
         self._task = task
         self._logger = logger
-        self._scheduler = AsyncIOScheduler()
-        self._cron_expression = settings.scraper_schedule_cron
+        self._runner: asyncio.Task | None = None
+        self._cron_expression = SCRAPER_SCHEDULE_CRON or ScheduleCron.DAILY_SCRAPER
+        # Parsed and checked once here (format: "minute hour day month weekday");
+        # a malformed or never-firing expression falls back to the default
+        try:
+            self._cron = CronExpression(self._cron_expression)
+            self._cron.next_after(datetime.now())
+        except ValueError as e:
+            self._logger.warning(
+                f"Invalid cron expression: {self._cron_expression}, using default",
+                extra={"cron": self._cron_expression, "error": str(e)},
+            )
+            self._cron_expression = ScheduleCron.DAILY_SCRAPER
+            self._cron = CronExpression(self._cron_expression)
 
     async def start(self) -> None:
         """Start the scheduler."""
-        await self._logger.info(
+        self._logger.info(
             f"Starting daily scheduler with cron: {self._cron_expression}"
         )
 
-        # Parse cron expression (format: "minute hour day month weekday")
-        parts = self._cron_expression.split()
-        if len(parts) != 5:
-            await self._logger.warning(
-                f"Invalid cron expression: {self._cron_expression}, using default"
-            )
-            parts = ScheduleCron.DAILY_SCRAPER.split()
-
-        minute, hour, day, month, weekday = parts
-
-        trigger = CronTrigger(
-            minute=minute,
-            hour=hour,
-            day=day,
-            month=month,
-            day_of_week=weekday,
-        )
-
-        self._scheduler.add_job(
-            self._execute_task,
-            trigger=trigger,
-            id="daily_scraper",
-            name="Daily Scraper Task",
-        )
-
-        self._scheduler.start()
-        await self._logger.info("Daily scheduler started")
+        self._runner = asyncio.create_task(self._run(), name="daily_scraper")
+        self._logger.info("Daily scheduler started")
 
     async def stop(self) -> None:
-        """Stop the scheduler."""
-        await self._logger.info("Stopping daily scheduler")
-        self._scheduler.shutdown(wait=True)
-        await self._logger.info("Daily scheduler stopped")
+        """Stop the scheduler, cancelling a run in progress."""
+        self._logger.info("Stopping daily scheduler")
+        if self._runner:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        self._logger.info("Daily scheduler stopped")
 
     async def trigger_now(self) -> None:
         """Manually trigger the task immediately.
 
         Useful for testing or manual execution.
         """
-        await self._logger.info("Manual trigger requested")
+        self._logger.info("Manual trigger requested")
         await self._execute_task()
 
-    async def _execute_task(self) -> None:
-        """Execute the scheduled task with error handling."""
+    async def _run(self) -> None:
+        """Sleep until each fire time and run the task.
+
+        Fire times are evaluated in the process's local time zone, as
+        APScheduler's AsyncIOScheduler did (UTC in the service containers).
+        """
         try:
-            await self._logger.info(
-                f"Executing scheduled scraper task at {datetime.utcnow().isoformat()}"
+            while True:
+                next_run = self._cron.next_after(datetime.now())
+                self._logger.debug(
+                    f"Next scheduled scraper run at {next_run.isoformat()}"
+                )
+                # Naive local times: timestamp() applies the local UTC offset
+                await asyncio.sleep(max(0.0, next_run.timestamp() - time.time()))
+                await self._execute_task()
+        except Exception as e:
+            self._logger.error(
+                f"Daily scheduler stopped: {str(e)}",
+                extra={"cron": self._cron_expression, "error": str(e)},
+                exc=e,
             )
+
+    async def _execute_task(self) -> None:
+        """Execute the scheduled task with error handling.
+
+        Logs one record per run, with its start time and duration.
+        """
+        started_at = datetime.now(timezone.utc).isoformat()
+        start = time.monotonic()
+        try:
             await self._task()
-            await self._logger.info("Scheduled scraper task completed successfully")
         except Exception as e:
-            await self._logger.error(
+            self._logger.error(
                 f"Scheduled scraper task failed: {str(e)}",
-                extra={"error": str(e)},
+                extra={
+                    "started_at": started_at,
+                    "duration_seconds": round(time.monotonic() - start, 3),
+                    "status": "error",
+                    "error": str(e),
+                },
+                exc=e,
             )
             # Don't re-raise - scheduler should continue running
-
+            return
+
+        self._logger.info(
+            "Scheduled scraper task completed successfully",
+            extra={
+                "started_at": started_at,
+                "duration_seconds": round(time.monotonic() - start, 3),
+                "status": "ok",
+            },
+        )
@@ -1,36 +1,69 @@
 """Clinical Trials scraper implementation."""
 
-import uuid
 from datetime import datetime, timezone
-from typing import List
+from typing import ClassVar, List, Optional
 import httpx
+import ijson
 
+from services.scraper.src.scraper.http_client import (
+    AdaptiveHttpClient,
+    create_http_client,
+    http_timeout,
+)
 from services.scraper.src.scraper.scraper_interface import ScraperInterface
 from services.scraper.src.models.scraping_result_dto import ScrapingResultDTO
+from services.scraper.src.constants import FAILED_ITEM_LOG_SAMPLE
 from services.scraper.src.errors.scraper_errors import ClinicalTrialsScrapingError
-from shared.config import settings
+from services.scraper.src.config import (
+    CLINICAL_TRIALS_API_BASE_URL,
+    CLINICAL_TRIALS_API_TIMEOUT,
+    CLINICAL_TRIALS_MAX_PAGES,
+    CLINICAL_TRIALS_PAGE_SIZE,
+)
 from shared.constants import Timeouts
 from shared.logging.logger_interface import LoggerInterface
 from shared.types.enums import SourceType
+from shared.utils.ids import uuid7
 
 
 class ClinicalTrialsScraper(ScraperInterface):
     """Scraper for ClinicalTrials.gov using their REST API v2."""
 
-    def __init__(self, logger: LoggerInterface) -> None:
+    _SOURCE_TYPE: ClassVar[SourceType] = SourceType.CLINICAL_TRIALS
+
+    def __init__(
+        self, logger: LoggerInterface, client: AdaptiveHttpClient | None = None
+    ) -> None:
         """Initialize Clinical Trials scraper.
 
         Args:
             logger: Logger instance for logging operations
+            client: Shared HTTP client; when omitted the scraper creates and
+                owns one, released by ``aclose()``
         """
         self._logger = logger
-        self._base_url = settings.clinical_trials_api_base_url
-        self._timeout = settings.clinical_trials_api_timeout_seconds
+        self._owns_client = client is None
+        self._client = client or create_http_client()
+        self._base_url = CLINICAL_TRIALS_API_BASE_URL
+        self._timeout = http_timeout(CLINICAL_TRIALS_API_TIMEOUT)
+        self._page_size = CLINICAL_TRIALS_PAGE_SIZE
+        self._max_pages = CLINICAL_TRIALS_MAX_PAGES
+        # First-page URL with the query string encoded once; later pages
+        # only append their pageToken
+        self._studies_url = httpx.URL(
+            f"{self._base_url}/studies",
+            params={"format": "json", "pageSize": self._page_size},
+        )
 
     async def get_source_name(self) -> str:
         """Get the name of the data source."""
         return "ClinicalTrials.gov"
 
+    async def aclose(self) -> None:
+        """Close the HTTP client if this scraper created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
     async def scrape(self) -> List[ScrapingResultDTO]:
         """Scrape ClinicalTrials.gov studies.
 
@@ -40,46 +73,38 @@ class ClinicalTrialsScraper(ScraperInterface):
         Raises:
             ClinicalTrialsScrapingError: If scraping fails
         """
-        await self._logger.info("Starting ClinicalTrials.gov scraping")
+        self._logger.info("Starting ClinicalTrials.gov scraping")
 
         try:
             results: List[ScrapingResultDTO] = []
 
-            # ClinicalTrials.gov API v2 endpoint for studies
-            # Example: /studies?format=json&pageSize=100
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                url = f"{self._base_url}/studies"
-                params = {"format": "json", "pageSize": 100}
-
-                await self._logger.debug(f"Fetching from URL: {url}")
-
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Process studies
-                studies = data.get("studies", [])
-                for study in studies:
-                    try:
-                        result = await self._process_study(study)
-                        if result:
-                            results.append(result)
-                    except Exception as e:
-                        await self._logger.warning(
-                            f"Failed to process study: {str(e)}",
-                            extra={"study_id": study.get("protocolSection", {}).get("identificationModule", {}).get("nctId")},
-                        )
-                        continue
-
-            await self._logger.info(
+            # Failures are collected and logged once after the loop
+            failed: List[str] = []
+            # One timestamp for the whole batch instead of a clock call per study
+            scraped_at = datetime.now(timezone.utc)
+
+            # Each page's nextPageToken is only known once that page arrives,
+            # so pages are fetched in order, up to the configured limit
+            page_token: Optional[str] = None
+            for _ in range(self._max_pages):
+                page_token = await self._fetch_page(page_token, scraped_at, results, failed)
+                if not page_token:
+                    break
+
+            if failed:
+                self._logger.warning(
+                    f"Failed to process {len(failed)} studies",
+                    extra={"failed_count": len(failed), "study_ids": failed[:FAILED_ITEM_LOG_SAMPLE]},
+                )
+
+            self._logger.info(
                 f"Clinical Trials scraping completed. Scraped {len(results)} studies"
             )
             return results
 
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP error during Clinical Trials scraping: {e.response.status_code}"
-            await self._logger.error(
+            self._logger.error(
                 error_msg, extra={"status_code": e.response.status_code}
             )
             raise ClinicalTrialsScrapingError(
@@ -90,7 +115,7 @@ class ClinicalTrialsScraper(ScraperInterface):
 
         except httpx.TimeoutException as e:
             error_msg = "Timeout during Clinical Trials scraping"
-            await self._logger.error(error_msg)
+            self._logger.error(error_msg)
             raise ClinicalTrialsScrapingError(
                 message=error_msg,
                 error_code="CLINICAL_TRIALS_TIMEOUT_ERROR",
@@ -98,53 +123,126 @@ class ClinicalTrialsScraper(ScraperInterface):
 
         except Exception as e:
             error_msg = f"Unexpected error during Clinical Trials scraping: {str(e)}"
-            await self._logger.error(error_msg)
+            self._logger.error(error_msg)
             raise ClinicalTrialsScrapingError(
                 message=error_msg,
                 error_code="CLINICAL_TRIALS_UNEXPECTED_ERROR",
                 details={"error": str(e)},
             ) from e
 
-    async def _process_study(self, study: dict) -> ScrapingResultDTO | None:
-        """Process a single clinical trial study.
+    async def _fetch_page(
+        self,
+        page_token: Optional[str],
+        scraped_at: datetime,
+        results: List[ScrapingResultDTO],
+        failed: List[str],
+    ) -> Optional[str]:
+        """Fetch one page of studies, processing each as it is parsed.
+
+        The body is parsed incrementally, so only the study being built is
+        held as Python objects rather than the whole decoded page.
 
         Args:
-            study: Study dictionary from API
+            page_token: nextPageToken from the previous page, None for the first
+            scraped_at: Timestamp shared by the batch
+            results: Receives the converted studies
+            failed: Receives the NCT IDs of studies that failed to convert
 
         Returns:
-            ScrapingResultDTO if successful, None otherwise
+            Token for the next page, or None on the last page
+
+        Raises:
+            httpx.HTTPError: If the request fails
         """
+        url = self._studies_url
+        if page_token:
+            url = url.copy_add_param("pageToken", page_token)
+
+        self._logger.debug(f"Fetching from URL: {url}", extra={"page_token": page_token})
+
+        next_page_token: Optional[str] = None
+        builder: Optional[ijson.ObjectBuilder] = None
+        events = ijson.sendable_list()
+        # use_float keeps numbers JSON-serializable for the JSONB column
+        parser = ijson.parse_coro(events, use_float=True)
+
+        def drain_events() -> None:
+            nonlocal builder, next_page_token
+            for prefix, event, value in events:
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == "studies.item" and event == "end_map":
+                        self._collect_study(builder.value, scraped_at, results, failed)
+                        builder = None
+                elif prefix == "studies.item" and event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == "nextPageToken" and event == "string":
+                    next_page_token = value
+            del events[:]
+
+        async with self._client.stream(url, timeout=self._timeout) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                drain_events()
+        parser.close()
+        drain_events()
+
+        return next_page_token
+
+    def _collect_study(
+        self,
+        study: dict,
+        scraped_at: datetime,
+        results: List[ScrapingResultDTO],
+        failed: List[str],
+    ) -> None:
+        """Convert a study and record it as a result or a failure."""
         try:
-            protocol_section = study.get("protocolSection", {})
-            identification = protocol_section.get("identificationModule", {})
-
-            # Extract required fields
-            nct_id = identification.get("nctId") or ""
-            if not nct_id:
-                return None
-
-            brief_title = identification.get("briefTitle") or "Unknown Study"
-            official_title = identification.get("officialTitle") or brief_title
-
-            # Construct link
-            link = f"https://clinicaltrials.gov/study/{nct_id}"
-
-            result = ScrapingResultDTO(
-                id=uuid.uuid4(),
-                source_type=SourceType.CLINICAL_TRIALS,
-                external_id=nct_id,
-                title=official_title,
-                data=study,
-                link=link,
-                scraped_at=datetime.now(timezone.utc),
+            result = self._process_study(study, scraped_at)
+            if result:
+                results.append(result)
+        except Exception:
+            failed.append(
+                str(study.get("protocolSection", {}).get("identificationModule", {}).get("nctId"))
             )
 
-            return result
+    def _process_study(self, study: dict, scraped_at: datetime) -> ScrapingResultDTO | None:
+        """Process a single clinical trial study.
 
-        except Exception as e:
-            await self._logger.warning(
-                f"Error processing study: {str(e)}",
-                extra={"study": study.get("protocolSection", {}).get("identificationModule", {}).get("nctId")},
-            )
+        Args:
+            study: Study dictionary from API
+            scraped_at: Timestamp shared by the batch the study belongs to
+
+        Returns:
+            ScrapingResultDTO, or None if the study has no NCT ID
+
+        Raises:
+            Exception: If the study cannot be converted; the caller records it
+        """
+        protocol_section = study.get("protocolSection", {})
+        identification = protocol_section.get("identificationModule", {})
+
+        # Extract required fields
+        nct_id = identification.get("nctId") or ""
+        if not nct_id:
             return None
 
+        brief_title = identification.get("briefTitle") or "Unknown Study"
+        official_title = identification.get("officialTitle") or brief_title
+
+        # Construct link
+        link = f"https://clinicaltrials.gov/study/{nct_id}"
+
+        result = ScrapingResultDTO(
+            id=uuid7(),
+            source_type=self._SOURCE_TYPE,
+            external_id=nct_id,
+            title=official_title,
+            data=study,
+            link=link,
+            scraped_at=scraped_at,
+        )
+
+        return result
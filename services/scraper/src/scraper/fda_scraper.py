@@ -2,35 +2,57 @@
 
 import uuid
 from datetime import datetime, timezone
-from typing import List
+from typing import ClassVar, List
 import httpx
 
+from services.scraper.src.scraper.http_client import (
+    AdaptiveHttpClient,
+    create_http_client,
+    http_timeout,
+)
 from services.scraper.src.scraper.scraper_interface import ScraperInterface
 from services.scraper.src.models.scraping_result_dto import ScrapingResultDTO
+from services.scraper.src.constants import FAILED_ITEM_LOG_SAMPLE
 from services.scraper.src.errors.scraper_errors import FDAScrapingError
-from shared.config import settings
+from services.scraper.src.config import DAILYMED_BASE_URL
 from shared.constants import Timeouts
 from shared.logging.logger_interface import LoggerInterface
 from shared.types.enums import SourceType
+from shared.utils import json_codec
+from shared.utils.ids import uuid7
 
 
 class FDAScraper(ScraperInterface):
     """Scraper for FDA DailyMed drug labels."""
 
-    def __init__(self, logger: LoggerInterface) -> None:
+    _SOURCE_TYPE: ClassVar[SourceType] = SourceType.FDA_DRUG_LABELS
+
+    def __init__(
+        self, logger: LoggerInterface, client: AdaptiveHttpClient | None = None
+    ) -> None:
         """Initialize FDA scraper.
 
         Args:
             logger: Logger instance for logging operations
+            client: Shared HTTP client; when omitted the scraper creates and
+                owns one, released by ``aclose()``
         """
         self._logger = logger
-        self._base_url = settings.dailymed_base_url
-        self._timeout = Timeouts.HTTP_API
+        self._owns_client = client is None
+        self._client = client or create_http_client()
+        self._base_url = DAILYMED_BASE_URL
+        self._drugnames_url = httpx.URL(f"{self._base_url}/dailymed/services/v2/drugnames.json")
+        self._timeout = http_timeout(Timeouts.HTTP_READ)
 
     async def get_source_name(self) -> str:
         """Get the name of the data source."""
         return "FDA DailyMed"
 
+    async def aclose(self) -> None:
+        """Close the HTTP client if this scraper created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
     async def scrape(self) -> List[ScrapingResultDTO]:
         """Scrape FDA DailyMed drug labels.
 
@@ -40,7 +62,7 @@ class FDAScraper(ScraperInterface):
         Raises:
             FDAScrapingError: If scraping fails
         """
-        await self._logger.info("Starting FDA DailyMed scraping")
+        self._logger.info("Starting FDA DailyMed scraping")
 
         try:
             results: List[ScrapingResultDTO] = []
@@ -48,38 +70,42 @@ class FDAScraper(ScraperInterface):
             # DailyMed uses a REST API-like structure
             # Example: https://dailymed.nlm.nih.gov/dailymed/services/v2/drugnames.json
             # We'll scrape from the drug names endpoint
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                url = f"{self._base_url}/dailymed/services/v2/drugnames.json"
-                
-                await self._logger.debug(f"Fetching from URL: {url}")
-                
-                response = await client.get(url)
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Process the drug names
-                if "data" in data and isinstance(data["data"], list):
-                    for item in data["data"]:
-                        try:
-                            result = await self._process_drug_item(item)
-                            if result:
-                                results.append(result)
-                        except Exception as e:
-                            await self._logger.warning(
-                                f"Failed to process drug item: {str(e)}",
-                                extra={"item": item},
-                            )
-                            continue
-
-            await self._logger.info(
+            
+            self._logger.debug(f"Fetching from URL: {self._drugnames_url}")
+            
+            response = await self._client.get(self._drugnames_url, timeout=self._timeout)
+            response.raise_for_status()
+
+            data = json_codec.loads(response.content)
+
+            # Process the drug names
+            # Failures are collected and logged once after the loop
+            failed: List[str] = []
+            # One timestamp for the whole batch instead of a clock call per item
+            scraped_at = datetime.now(timezone.utc)
+            if "data" in data and isinstance(data["data"], list):
+                for item in data["data"]:
+                    try:
+                        result = self._process_drug_item(item, scraped_at)
+                        if result:
+                            results.append(result)
+                    except Exception:
+                        failed.append(str(item.get("drug_name_id") or item.get("id")))
+
+            if failed:
+                self._logger.warning(
+                    f"Failed to process {len(failed)} drug items",
+                    extra={"failed_count": len(failed), "items": failed[:FAILED_ITEM_LOG_SAMPLE]},
+                )
+
+            self._logger.info(
                 f"FDA scraping completed. Scraped {len(results)} items"
             )
             return results
 
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP error during FDA scraping: {e.response.status_code}"
-            await self._logger.error(error_msg, extra={"status_code": e.response.status_code})
+            self._logger.error(error_msg, extra={"status_code": e.response.status_code})
             raise FDAScrapingError(
                 message=error_msg,
                 error_code="FDA_HTTP_ERROR",
@@ -88,7 +114,7 @@ class FDAScraper(ScraperInterface):
 
         except httpx.TimeoutException as e:
             error_msg = "Timeout during FDA scraping"
-            await self._logger.error(error_msg)
+            self._logger.error(error_msg)
             raise FDAScrapingError(
                 message=error_msg,
                 error_code="FDA_TIMEOUT_ERROR",
@@ -96,47 +122,42 @@ class FDAScraper(ScraperInterface):
 
         except Exception as e:
             error_msg = f"Unexpected error during FDA scraping: {str(e)}"
-            await self._logger.error(error_msg)
+            self._logger.error(error_msg)
             raise FDAScrapingError(
                 message=error_msg,
                 error_code="FDA_UNEXPECTED_ERROR",
                 details={"error": str(e)},
             ) from e
 
-    async def _process_drug_item(self, item: dict) -> ScrapingResultDTO | None:
+    def _process_drug_item(self, item: dict, scraped_at: datetime) -> ScrapingResultDTO:
         """Process a single drug item from the API response.
 
         Args:
             item: Drug item dictionary from API
+            scraped_at: Timestamp shared by the batch the item belongs to
 
         Returns:
-            ScrapingResultDTO if successful, None otherwise
-        """
-        try:
-            # Extract required fields
-            external_id = item.get("drug_name_id") or item.get("id") or str(uuid.uuid4())
-            title = item.get("drug_name") or item.get("name") or "Unknown Drug"
-            
-            # Construct link
-            drug_name_id = item.get("drug_name_id") or item.get("id", "")
-            link = f"{self._base_url}/dailymed/drugInfo.cfm?setid={drug_name_id}" if drug_name_id else self._base_url
-
-            result = ScrapingResultDTO(
-                id=uuid.uuid4(),
-                source_type=SourceType.FDA_DRUG_LABELS,
-                external_id=str(external_id),
-                title=str(title),
-                data=item,
-                link=link,
-                scraped_at=datetime.now(timezone.utc),
-            )
-
-            return result
-
-        except Exception as e:
-            await self._logger.warning(
-                f"Error processing drug item: {str(e)}",
-                extra={"item": item},
-            )
-            return None
+            ScrapingResultDTO for the item
 
+        Raises:
+            Exception: If the item cannot be converted; the caller records it
+        """
+        # Extract required fields
+        item_id = item.get("drug_name_id") or item.get("id")
+        external_id = item_id or str(uuid.uuid4())
+        title = item.get("drug_name") or item.get("name") or "Unknown Drug"
+
+        # Construct link
+        link = f"{self._base_url}/dailymed/drugInfo.cfm?setid={item_id}" if item_id else self._base_url
+
+        result = ScrapingResultDTO(
+            id=uuid7(),
+            source_type=self._SOURCE_TYPE,
+            external_id=str(external_id),
+            title=str(title),
+            data=item,
+            link=link,
+            scraped_at=scraped_at,
+        )
+
+        return result
@@ -0,0 +1,236 @@
+"""Shared outbound HTTP client for scrapers."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+from services.scraper.src.config import HTTP_MAX_RETRIES, HTTP_RETRY_DELAY
+from shared.constants import HttpPool, Timeouts
+
+# Responses that signal overload or a transient upstream failure
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Read a Retry-After header given as seconds or as an HTTP date."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveHttpClient:
+    """httpx client wrapper with AIMD concurrency control and retries.
+
+    At most ``limit`` requests are in flight. Every success raises the limit
+    additively (+``HttpPool.AIMD_INCREASE``); a 429, a 5xx or a transport
+    error halves it, down to ``HttpPool.MIN_CONCURRENCY``. Failed requests
+    are retried with exponential backoff, honouring ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        max_retries: int,
+        retry_delay_seconds: float,
+        min_concurrency: int = HttpPool.MIN_CONCURRENCY,
+        max_concurrency: int = HttpPool.MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize adaptive client.
+
+        Args:
+            client: Underlying pooled httpx client (owned by this wrapper)
+            max_retries: Retries after the first attempt
+            retry_delay_seconds: Base backoff delay, doubled per retry
+            min_concurrency: Floor for the concurrency limit
+            max_concurrency: Ceiling for the concurrency limit
+        """
+        self._client = client
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay_seconds
+        self._min_concurrency = min_concurrency
+        self._max_concurrency = max_concurrency
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._slot_freed = asyncio.Condition()
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    async def get(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request under the concurrency limit, retrying failures.
+
+        Args:
+            url: Request URL
+            **kwargs: Passed through to ``httpx.AsyncClient.get``
+
+        Returns:
+            The final response (callers still check its status)
+
+        Raises:
+            httpx.TransportError: If the last attempt fails at transport level
+        """
+        for attempt in range(self._max_retries + 1):
+            await self._acquire()
+            try:
+                response = await self._client.get(url, **kwargs)
+            except httpx.TransportError:
+                self._decrease()
+                if attempt == self._max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code not in _RETRYABLE_STATUS_CODES:
+                    self._increase()
+                    return response
+                self._decrease()
+                if attempt == self._max_retries:
+                    return response
+                delay = _retry_after_seconds(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                await response.aclose()
+            finally:
+                await self._release()
+
+            await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    @asynccontextmanager
+    async def stream(self, url: httpx.URL | str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Send a GET request and yield the response before its body is read.
+
+        Retries and the concurrency limit apply as in ``get``; the slot is
+        held until the body has been consumed and the context exits.
+
+        Args:
+            url: Request URL
+            **kwargs: Passed through to ``httpx.AsyncClient.build_request``
+
+        Yields:
+            The final response with an unread body (callers still check
+            its status)
+
+        Raises:
+            httpx.TransportError: If the last attempt fails at transport level
+        """
+        request = self._client.build_request("GET", url, **kwargs)
+        for attempt in range(self._max_retries + 1):
+            await self._acquire()
+            try:
+                response = await self._client.send(request, stream=True)
+            except httpx.TransportError:
+                await self._release()
+                self._decrease()
+                if attempt == self._max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            if response.status_code in _RETRYABLE_STATUS_CODES and attempt < self._max_retries:
+                await response.aclose()
+                await self._release()
+                self._decrease()
+                delay = _retry_after_seconds(response)
+                await asyncio.sleep(self._backoff(attempt) if delay is None else delay)
+                continue
+
+            try:
+                if response.status_code in _RETRYABLE_STATUS_CODES:
+                    self._decrease()
+                else:
+                    self._increase()
+                yield response
+            finally:
+                await response.aclose()
+                await self._release()
+            return
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx client."""
+        await self._client.aclose()
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff delay for a retry attempt."""
+        return min(self._retry_delay * (2 ** attempt), HttpPool.MAX_BACKOFF_SECONDS)
+
+    def _increase(self) -> None:
+        """Additive increase after a success."""
+        self._limit = min(self._max_concurrency, self._limit + HttpPool.AIMD_INCREASE)
+
+    def _decrease(self) -> None:
+        """Multiplicative decrease after overload or failure."""
+        self._limit = max(self._min_concurrency, self._limit * HttpPool.AIMD_DECREASE_FACTOR)
+
+    async def _acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    async def _release(self) -> None:
+        """Free a slot and wake waiters (the limit may also have grown)."""
+        async with self._slot_freed:
+            self._in_flight -= 1
+            self._slot_freed.notify_all()
+
+
+def http_timeout(read: float) -> httpx.Timeout:
+    """Build a per-phase timeout with short connect, write and pool limits.
+
+    A stalled connection or an exhausted pool fails within seconds instead
+    of holding a concurrency slot for the full read timeout.
+
+    Args:
+        read: Seconds to wait between received chunks
+
+    Returns:
+        httpx.Timeout for outbound requests
+    """
+    return httpx.Timeout(
+        connect=Timeouts.HTTP_CONNECT,
+        read=read,
+        write=Timeouts.HTTP_WRITE,
+        pool=Timeouts.HTTP_POOL,
+    )
+
+
+def create_http_client() -> AdaptiveHttpClient:
+    """Create a pooled HTTP/2 client to share across scrapers and runs.
+
+    Keeping one client alive reuses TCP/TLS connections between scheduled
+    runs and lets paginated requests to the same host multiplex over HTTP/2.
+    Scrapers pass their own per-request timeouts.
+
+    Returns:
+        Configured AdaptiveHttpClient; the caller must ``aclose()`` it
+    """
+    client = httpx.AsyncClient(
+        http2=True,
+        timeout=http_timeout(Timeouts.HTTP_READ),
+        limits=httpx.Limits(
+            max_connections=HttpPool.MAX_CONNECTIONS,
+            max_keepalive_connections=HttpPool.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HttpPool.KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    return AdaptiveHttpClient(
+        client,
+        max_retries=HTTP_MAX_RETRIES,
+        retry_delay_seconds=HTTP_RETRY_DELAY,
+    )
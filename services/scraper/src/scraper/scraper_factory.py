@@ -1,23 +1,38 @@
 """Factory for creating scraper instances."""
 
+from typing import Dict, Type
+
 from shared.patterns.factory import Factory
+from services.scraper.src.scraper.http_client import AdaptiveHttpClient
 from services.scraper.src.scraper.scraper_interface import ScraperInterface
 from services.scraper.src.scraper.fda_scraper import FDAScraper
 from services.scraper.src.scraper.clinical_trials_scraper import ClinicalTrialsScraper
 from shared.logging.logger_interface import LoggerInterface
 from shared.types.enums import SourceType
 
+# Scraper implementation per source; add new sources here
+_REGISTRY: Dict[SourceType, Type[ScraperInterface]] = {
+    SourceType.FDA_DRUG_LABELS: FDAScraper,
+    SourceType.CLINICAL_TRIALS: ClinicalTrialsScraper,
+}
+
 
 class ScraperFactory(Factory[ScraperInterface]):
     """Factory for creating scraper instances based on source type."""
 
     @staticmethod
-    def create(source_type: SourceType, logger: LoggerInterface) -> ScraperInterface:
+    def create(
+        source_type: SourceType,
+        logger: LoggerInterface,
+        client: AdaptiveHttpClient | None = None,
+    ) -> ScraperInterface:
         """Create a scraper instance for the given source type.
 
         Args:
             source_type: Type of data source to scrape
             logger: Logger instance for the scraper
+            client: Optional shared HTTP client so scrapers reuse one
+                connection pool
 
         Returns:
             ScraperInterface instance
@@ -25,11 +40,9 @@ class ScraperFactory(Factory[ScraperInterface]):
         Raises:
             ValueError: If source type is unknown
         """
-        if source_type == SourceType.FDA_DRUG_LABELS:
-            return FDAScraper(logger=logger)
-
-        if source_type == SourceType.CLINICAL_TRIALS:
-            return ClinicalTrialsScraper(logger=logger)
-
-        raise ValueError(f"Unknown source type: {source_type}")
+        try:
+            scraper_class = _REGISTRY[source_type]
+        except KeyError:
+            raise ValueError(f"Unknown source type: {source_type}") from None
+        return scraper_class(logger=logger, client=client)
 
@@ -1,15 +1,16 @@
 """Interface for scrapers."""
 
-from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Protocol
 
 from services.scraper.src.models.scraping_result_dto import ScrapingResultDTO
 
 
-class ScraperInterface(ABC):
-    """Abstract interface for scrapers."""
+class ScraperInterface(Protocol):
+    """Interface for scrapers.
+
+    Structural: implementations conform by shape and need not inherit from it.
+    """
 
-    @abstractmethod
     async def scrape(self) -> List[ScrapingResultDTO]:
         """Scrape data from the source.
 
@@ -19,14 +20,16 @@ class ScraperInterface(ABC):
         Raises:
             ExternalServiceError: If scraping fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_source_name(self) -> str:
         """Get the name of the data source.
 
         Returns:
             Source name
         """
-        pass
+        ...
 
+    async def aclose(self) -> None:
+        """Release resources held by the scraper."""
+        ...
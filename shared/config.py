@@ -3,6 +3,7 @@
 All configuration values come from environment variables.
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -36,6 +37,9 @@ class Settings(BaseSettings):
     db_max_overflow: int = DatabasePool.DEFAULT_MAX_OVERFLOW
     db_pool_timeout: int = DatabasePool.DEFAULT_TIMEOUT
     db_pool_recycle: int = DatabasePool.DEFAULT_RECYCLE
+    db_statement_timeout_seconds: int = Timeouts.DATABASE_QUERY  # 0 = no limit
+    db_query_cache_size: int = DatabasePool.DEFAULT_QUERY_CACHE_SIZE
+    db_prepared_statement_cache_size: int = DatabasePool.DEFAULT_PREPARED_STATEMENT_CACHE_SIZE  # 0 = off
 
     # Scraper Service
     scraper_schedule_cron: str = ScheduleCron.DAILY_SCRAPER
@@ -43,6 +47,7 @@ class Settings(BaseSettings):
     scraper_timeout_seconds: int = Timeouts.SCRAPER_OPERATION
     scraper_retry_attempts: int = Limits.SCRAPER_RETRY_ATTEMPTS
     scraper_retry_delay_seconds: int = Limits.SCRAPER_RETRY_DELAY
+    scraper_db_pool_size: int = 2  # One session per concurrently scraped source; 0 = use db_pool_size
 
     # Analysis Service
     analysis_enabled: bool = True
@@ -53,7 +58,11 @@ class Settings(BaseSettings):
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     api_reload: bool = False
-    api_workers: int = 4
+    api_workers: int = 4  # 0 = one worker per CPU core
+    api_loop: str = "uvloop"
+    api_http: str = "httptools"
+    api_frequent_terms_refresh_seconds: int = 300
+    api_cors_allowed_origins: str = "http://localhost:3000"  # Comma-separated
 
     # Logging
     log_level: LogLevel = LogLevel.INFO
@@ -74,9 +83,24 @@ class Settings(BaseSettings):
 
     # Clinical Trials API Configuration
     clinical_trials_api_base_url: str = "https://clinicaltrials.gov/api/v2"
-    clinical_trials_api_timeout_seconds: int = Timeouts.HTTP_API
+    clinical_trials_api_timeout_seconds: int = Timeouts.HTTP_API  # Read timeout
+    clinical_trials_page_size: int = Limits.CLINICAL_TRIALS_PAGE_SIZE
+    clinical_trials_max_pages: int = Limits.CLINICAL_TRIALS_MAX_PAGES
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment once.
+
+    Tests can call ``get_settings.cache_clear()`` to reload after changing
+    the environment.
+
+    Returns:
+        Settings instance
+    """
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
@@ -9,6 +9,7 @@ class Tables:
 
     SCRAPING_RESULTS = "scraping_results"
     ANALYSIS_RESULTS = "analysis_results"
+    FREQUENT_TERMS = "frequent_terms"  # Materialized view over analysis_results
 
 
 class Routes:
@@ -17,6 +18,9 @@ class Routes:
     SCRAPING = "/api/v1/scraping"
     ANALYSIS = "/api/v1/analysis"
     HEALTH = "/health"
+    OPENAPI = "/openapi.json"
+    DOCS = "/docs"
+    REDOC = "/redoc"
 
 
 class LogFiles:
@@ -51,6 +55,11 @@ class Timeouts:
 
     HTTP_DEFAULT = 30
     HTTP_API = 60
+    # Per-phase outbound HTTP timeouts; read applies between received chunks
+    HTTP_CONNECT = 5.0
+    HTTP_READ = 30.0
+    HTTP_WRITE = 10.0
+    HTTP_POOL = 5.0
     DATABASE_QUERY = 30
     SCRAPER_OPERATION = 300
 
@@ -67,9 +76,41 @@ class Limits:
     MAX_STOP_WORD_RATIO_IN_NGRAM = 0.5  # Max ratio of stop words allowed in n-grams (0.5 = half)
     SCRAPER_RETRY_ATTEMPTS = 3
     SCRAPER_RETRY_DELAY = 60
+    CLINICAL_TRIALS_PAGE_SIZE = 100  # API maximum is 1000
+    CLINICAL_TRIALS_MAX_PAGES = 1  # Pages followed via nextPageToken per run
+    DB_STREAM_BATCH_SIZE = 500  # Rows fetched per round-trip when streaming results
     LOG_MAX_BYTES = 10485760  # 10 MB
     LOG_BACKUP_COUNT = 5
     LOG_ROTATION_DAYS = 30
+    LOG_DRAIN_BATCH_SIZE = 1000  # Records the log dispatcher writes per wake-up
+    LOG_WRITE_BUFFER_BYTES = 128 * 1024  # Pending per log file before a writev; also written when the queue drains
+
+
+class AdvisoryLocks:
+    """PostgreSQL advisory lock keys shared across services."""
+
+    FREQUENT_TERMS_REFRESH = 7301001
+
+
+class Caching:
+    """In-process read-aside cache settings (per worker process)."""
+
+    MAX_ENTRIES = 1024
+    RESULT_TTL_SECONDS = 5  # Short: other workers cannot invalidate this copy
+    FREQUENT_TERMS_TTL_SECONDS = 60
+
+
+class HttpPool:
+    """Outbound HTTP client connection pool settings."""
+
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY_SECONDS = 15.0
+    MIN_CONCURRENCY = 1  # AIMD floor for in-flight requests
+    MAX_CONCURRENCY = 8  # AIMD ceiling for in-flight requests
+    AIMD_INCREASE = 0.5  # Added to the limit after each success
+    AIMD_DECREASE_FACTOR = 0.5  # Limit multiplier after a 429/5xx/transport error
+    MAX_BACKOFF_SECONDS = 60  # Cap on the exponential retry delay
 
 
 class DatabasePool:
@@ -79,4 +120,6 @@ class DatabasePool:
     DEFAULT_MAX_OVERFLOW = 10
     DEFAULT_TIMEOUT = 30
     DEFAULT_RECYCLE = 3600
+    DEFAULT_QUERY_CACHE_SIZE = 1200  # Compiled SQL strings kept per engine
+    DEFAULT_PREPARED_STATEMENT_CACHE_SIZE = 1024  # asyncpg prepared statements per connection
 
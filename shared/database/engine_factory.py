@@ -6,6 +6,7 @@ from typing import Optional
 
 from shared.config import settings
 from shared.database.url_parser import convert_to_asyncpg_url
+from shared.utils import json_codec
 
 
 def create_database_engine(
@@ -16,6 +17,11 @@ def create_database_engine(
 ) -> AsyncEngine:
     """Create async database engine with proper SSL configuration.
 
+    Connections are pooled, checked for liveness on checkout and subject to
+    the configured server-side statement timeout. Compiled SQL is cached per
+    engine and prepared statements per connection. JSON columns go through
+    orjson.
+
     Args:
         pool_size: Connection pool size
         max_overflow: Maximum overflow connections
@@ -38,12 +44,29 @@ def create_database_engine(
     if ssl_required:
         connect_args["ssl"] = True
 
+    # Prepared statements are cached per connection, so repeated queries
+    # skip the server-side parse/plan step (set to 0 behind poolers that
+    # do not support prepared statements)
+    connect_args["prepared_statement_cache_size"] = settings.db_prepared_statement_cache_size
+
+    # Bound query time server-side so a runaway query cannot hold a pool
+    # connection indefinitely
+    if settings.db_statement_timeout_seconds > 0:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.db_statement_timeout_seconds * 1000),
+        }
+
     engine = create_async_engine(
         asyncpg_url,
         pool_size=pool_size,
         max_overflow=max_overflow,
         pool_timeout=pool_timeout,
         pool_recycle=pool_recycle,
+        pool_pre_ping=True,
+        query_cache_size=settings.db_query_cache_size,
+        # JSON columns (e.g. scraped payloads) are encoded/decoded with orjson
+        json_serializer=json_codec.dumps,
+        json_deserializer=json_codec.loads,
         connect_args=connect_args,
         echo=False,
     )
@@ -7,6 +7,7 @@ from shared.errors.base_errors import (
     NotFoundError,
     ExternalServiceError,
 )
+from shared.errors.decorators import db_errors
 
 __all__ = [
     "BaseApplicationError",
@@ -14,5 +15,6 @@ __all__ = [
     "ValidationError",
     "NotFoundError",
     "ExternalServiceError",
+    "db_errors",
 ]
 
@@ -0,0 +1,84 @@
+"""Decorators that translate low-level failures into application errors."""
+
+import functools
+import inspect
+from enum import Enum
+from typing import Any, Callable, Dict, TypeVar
+from uuid import UUID
+
+from shared.errors.base_errors import BaseApplicationError, DatabaseError
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _detail_value(value: Any) -> Any:
+    """Convert an argument into a JSON-friendly error detail."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return len(value)
+    return value
+
+
+def db_errors(message: str, error_code: str, *detail_args: str) -> Callable[[F], F]:
+    """Wrap a repository method so unexpected failures raise DatabaseError.
+
+    Application errors raised by the method itself (e.g. NotFoundError) pass
+    through unchanged. Works for coroutine functions and async generators.
+
+    Args:
+        message: DatabaseError message
+        error_code: DatabaseError error code
+        *detail_args: Names of method arguments to include in the error
+            details (UUIDs and enums are stringified, collections reduced to
+            their length)
+
+    Returns:
+        Decorator for the repository method
+    """
+
+    def decorator(fn: F) -> F:
+        signature = inspect.signature(fn)
+
+        def _error(e: Exception, args: tuple, kwargs: dict) -> DatabaseError:
+            details: Dict[str, Any] = {"error": str(e)}
+            if detail_args:
+                bound = signature.bind_partial(*args, **kwargs)
+                bound.apply_defaults()
+                for name in detail_args:
+                    details[name] = _detail_value(bound.arguments.get(name))
+            return DatabaseError(message=message, error_code=error_code, details=details)
+
+        if inspect.isasyncgenfunction(fn):
+
+            @functools.wraps(fn)
+            async def gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+                generator = fn(*args, **kwargs)
+                try:
+                    async for item in generator:
+                        yield item
+                except BaseApplicationError:
+                    raise
+                except Exception as e:
+                    raise _error(e, args, kwargs) from e
+                finally:
+                    # Close the inner generator promptly if the consumer stops
+                    # early, so server-side cursors are released
+                    await generator.aclose()
+
+            return gen_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await fn(*args, **kwargs)
+            except BaseApplicationError:
+                raise
+            except Exception as e:
+                raise _error(e, args, kwargs) from e
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
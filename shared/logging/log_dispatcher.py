@@ -0,0 +1,106 @@
+"""Background dispatch of log records to file handlers."""
+
+import logging
+import queue
+import threading
+from typing import List, Optional, Sequence
+
+from shared.constants import Limits
+
+
+class LogDispatcher:
+    """Single consumer thread that owns a service's log handlers.
+
+    Producers only ``submit`` records onto a ``queue.SimpleQueue`` (a C-level
+    queue that takes no Python lock), so emitting never waits on formatting,
+    a handler lock or file I/O. The consumer thread drains records in
+    batches, is the only caller of the handlers, and flushes them whenever
+    the queue runs empty.
+    """
+
+    def __init__(
+        self,
+        handlers: Sequence[logging.Handler],
+        name: str,
+        batch_size: int = Limits.LOG_DRAIN_BATCH_SIZE,
+    ) -> None:
+        """Initialize log dispatcher.
+
+        Args:
+            handlers: Handlers the consumer thread writes to
+            name: Thread name suffix, usually the service name
+            batch_size: Maximum records drained per wake-up
+        """
+        self._handlers = tuple(handlers)
+        self._batch_size = batch_size
+        self._queue: "queue.SimpleQueue[Optional[logging.LogRecord]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name=f"log-dispatcher-{name}", daemon=True
+        )
+        self._stopped = False
+
+    def start(self) -> None:
+        """Start the consumer thread."""
+        self._thread.start()
+
+    def submit(self, record: logging.LogRecord) -> None:
+        """Queue a record for the consumer thread.
+
+        Args:
+            record: Record to write
+        """
+        self._queue.put(record)
+
+    def stop(self) -> None:
+        """Write out queued records, stop the thread and close the handlers.
+
+        Safe to call more than once.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(None)
+        self._thread.join()
+        for handler in self._handlers:
+            handler.close()
+
+    def _run(self) -> None:
+        """Consume records until the stop sentinel arrives."""
+        while True:
+            # Block for the first record, then take whatever else is queued
+            batch: List[Optional[logging.LogRecord]] = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for record in batch:
+                if record is None:
+                    return
+                self._dispatch(record)
+
+            # Handlers buffer their writes; push them to disk once caught up
+            if self._queue.empty():
+                self._flush()
+
+    def _dispatch(self, record: logging.LogRecord) -> None:
+        """Hand a record to every handler whose level accepts it.
+
+        A failing handler is reported through its ``handleError`` so the
+        thread keeps draining; otherwise the queue would grow unbounded.
+        """
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                try:
+                    handler.handle(record)
+                except Exception:
+                    handler.handleError(record)
+
+    def _flush(self) -> None:
+        """Flush every handler, reporting failures instead of raising."""
+        for handler in self._handlers:
+            try:
+                handler.flush()
+            except Exception:
+                handler.handleError(logging.makeLogRecord({"msg": "Log flush failed"}))
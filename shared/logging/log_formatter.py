@@ -1,15 +1,45 @@
 """Log formatter for structured logging."""
 
-import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
 
 from shared.types.common_types import JsonDict
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second
+_second_cache: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a record time as ISO 8601 UTC with microseconds.
+
+    The date/time prefix is formatted once per second and reused; only the
+    microsecond part is rendered per record.
+
+    Args:
+        created: Record creation time (epoch seconds)
+
+    Returns:
+        Timestamp such as "2025-01-01T12:00:00.123456+00:00"
+    """
+    global _second_cache
+    second = int(created)
+    cached_second, prefix = _second_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _second_cache = (second, prefix)
+    microseconds = min(round((created - second) * 1_000_000), 999_999)
+    return f"{prefix}.{microseconds:06d}+00:00"
+
 
 class StructuredFormatter(logging.Formatter):
-    """JSON structured log formatter."""
+    """JSON structured log formatter.
+
+    Expects records built by ServiceLogger, which always sets
+    ``service_name``, ``correlation_id`` and ``extra_data``.
+    """
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
@@ -21,31 +51,37 @@ class StructuredFormatter(logging.Formatter):
             JSON formatted log string
         """
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
-            "service": getattr(record, "service_name", "unknown"),
+            "service": record.service_name,  # type: ignore[attr-defined]
             "message": record.getMessage(),
         }
 
         # Add correlation ID if present
-        correlation_id = getattr(record, "correlation_id", None)
+        correlation_id = record.correlation_id  # type: ignore[attr-defined]
         if correlation_id:
             log_data["correlation_id"] = correlation_id
 
         # Add extra fields
-        extra = getattr(record, "extra_data", {})
+        extra = record.extra_data  # type: ignore[attr-defined]
         if extra:
             log_data["extra"] = extra
 
-        # Add exception info if present
+        # Traceback is rendered here, on the dispatcher thread, and cached
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
 
-        return json.dumps(log_data)
+        # default=str keeps records with unexpected extra values writable
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 class PlainFormatter(logging.Formatter):
-    """Plain text log formatter for development."""
+    """Plain text log formatter for development.
+
+    Expects records built by ServiceLogger (see StructuredFormatter).
+    """
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as plain text.
@@ -56,9 +92,9 @@ class PlainFormatter(logging.Formatter):
         Returns:
             Plain text formatted log string
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
-        service = getattr(record, "service_name", "unknown")
-        correlation_id = getattr(record, "correlation_id", "")
+        timestamp = _format_timestamp(record.created)
+        service = record.service_name  # type: ignore[attr-defined]
+        correlation_id = record.correlation_id  # type: ignore[attr-defined]
         corr_str = f" [corr_id={correlation_id}]" if correlation_id else ""
 
         message = record.getMessage()
@@ -67,7 +103,9 @@ class PlainFormatter(logging.Formatter):
         formatted = f"{timestamp} [{level}] [{service}]{corr_str} {message}"
 
         if record.exc_info:
-            formatted += f"\n{self.formatException(record.exc_info)}"
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            formatted += f"\n{record.exc_text}"
 
         return formatted
 
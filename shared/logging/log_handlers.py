@@ -2,11 +2,178 @@
 
 import logging
 import logging.handlers
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, List, Optional
 
 from shared.constants import LogFiles, Limits
 
+# Most buffers a single writev call accepts
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that batches records into one ``writev`` call.
+
+    Records are formatted and encoded once and kept as pending byte chunks;
+    they reach the file in a single scatter write when ``buffer_size`` bytes
+    are pending or on ``flush()``. The file is opened unbuffered in append
+    mode (``O_APPEND``), so there is no intermediate copy into a Python
+    buffer. The file size is tracked in memory, so the rollover check does
+    not stat the file. Whoever drives the handler calls ``flush()`` when it
+    runs out of records to write.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        buffer_size: int = Limits.LOG_WRITE_BUFFER_BYTES,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize buffered handler.
+
+        Args:
+            *args: Passed to RotatingFileHandler
+            buffer_size: Bytes pending before they are written to the file
+            **kwargs: Passed to RotatingFileHandler
+        """
+        self._buffer_size = buffer_size
+        self._written = 0
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        super().__init__(*args, **kwargs)
+
+    def _open(self) -> BinaryIO:  # type: ignore[override]
+        """Open the log file for unbuffered appends."""
+        stream = open(self.baseFilename, "ab", buffering=0)
+        self._written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a record's bytes, rolling the file over when full.
+
+        Args:
+            record: The log record to write
+        """
+        try:
+            data = (self.format(record) + self.terminator).encode(
+                self.encoding or "utf-8", self.errors or "strict"
+            )
+            if self.maxBytes > 0 and self._written + len(data) >= self.maxBytes:
+                # Pending bytes belong to the file being rotated out
+                self._write_pending()
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+            self._written += len(data)
+            if self._pending_bytes >= self._buffer_size:
+                self._write_pending()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write all pending records to the file."""
+        with self.lock:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Write pending chunks with as few ``writev`` calls as possible.
+
+        A failed write (e.g. a full disk) goes to ``handleError``, as in
+        ``emit``; the pending chunks are dropped rather than retried.
+        """
+        pending = self._pending
+        if not pending or self.stream is None:
+            return
+        self._pending = []
+        self._pending_bytes = 0
+        fd = self.stream.fileno()
+        try:
+            for start in range(0, len(pending), _IOV_MAX):
+                chunk = pending[start:start + _IOV_MAX]
+                written = os.writev(fd, chunk)
+                if written < sum(map(len, chunk)):
+                    # Short write: finish the remainder with plain writes
+                    remainder = memoryview(b"".join(chunk))[written:]
+                    while remainder:
+                        remainder = remainder[os.write(fd, remainder):]
+        except OSError:
+            self.handleError(
+                logging.makeLogRecord({"msg": f"Failed to write {self.baseFilename}"})
+            )
+
+
+class LevelRoutingHandler(logging.Handler):
+    """Route each record to exactly one log file according to its level.
+
+    ERROR and above go to the error handler, WARNING to warning, INFO to
+    info and everything below to debug. Audit records (message prefixed with
+    ``AUDIT_PREFIX``) go to the audit handler only.
+    """
+
+    AUDIT_PREFIX = "[AUDIT]"
+
+    def __init__(
+        self,
+        error: logging.Handler,
+        warning: logging.Handler,
+        info: logging.Handler,
+        debug: logging.Handler,
+        audit: logging.Handler,
+    ) -> None:
+        """Initialize routing handler.
+
+        Args:
+            error: Handler for ERROR and CRITICAL records
+            warning: Handler for WARNING records
+            info: Handler for INFO records
+            debug: Handler for DEBUG records
+            audit: Handler for audit records
+        """
+        super().__init__()
+        self._error = error
+        self._warning = warning
+        self._info = info
+        self._debug = debug
+        self._audit = audit
+        self._targets = (error, warning, info, debug, audit)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Hand the record to the handler for its level.
+
+        Args:
+            record: The log record to route
+        """
+        levelno = record.levelno
+        if levelno >= logging.ERROR:
+            target = self._error
+        elif levelno >= logging.WARNING:
+            target = self._warning
+        elif levelno >= logging.INFO:
+            target = (
+                self._audit
+                if isinstance(record.msg, str) and record.msg.startswith(self.AUDIT_PREFIX)
+                else self._info
+            )
+        else:
+            target = self._debug
+        target.handle(record)
+
+    def flush(self) -> None:
+        """Flush every target handler."""
+        for target in self._targets:
+            target.flush()
+
+    def close(self) -> None:
+        """Close every target handler."""
+        for target in self._targets:
+            target.close()
+        super().close()
+
 
 class FileLogHandlerFactory:
     """Factory for creating file-based log handlers."""
@@ -18,8 +185,8 @@ class FileLogHandlerFactory:
         service_name: str,
         max_bytes: int = Limits.LOG_MAX_BYTES,
         backup_count: int = Limits.LOG_BACKUP_COUNT,
-    ) -> logging.handlers.RotatingFileHandler:
-        """Create a rotating file handler.
+    ) -> BufferedRotatingFileHandler:
+        """Create a buffered rotating file handler.
 
         Args:
             log_file: Name of the log file
@@ -29,13 +196,13 @@ class FileLogHandlerFactory:
             backup_count: Number of backup files to keep
 
         Returns:
-            Configured RotatingFileHandler
+            Configured BufferedRotatingFileHandler
         """
         # Log path is already service-specific from logger_factory
         log_path = Path(log_directory) / log_file
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        handler = logging.handlers.RotatingFileHandler(
+        handler = BufferedRotatingFileHandler(
             filename=str(log_path),
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -1,94 +1,120 @@
 """Logger factory using Factory pattern."""
 
+import atexit
 import logging
-from typing import Optional
+import os
+import threading
+from typing import Dict, Optional
 
 from shared.config import settings
 from shared.constants import LogFiles
+from shared.logging.log_dispatcher import LogDispatcher
 from shared.logging.log_formatter import PlainFormatter, StructuredFormatter
-from shared.logging.log_handlers import FileLogHandlerFactory
+from shared.logging.log_handlers import FileLogHandlerFactory, LevelRoutingHandler
 from shared.logging.logger_interface import LoggerInterface
 from shared.logging.service_logger import ServiceLogger
 from shared.types.enums import LogLevel
 
+# Settings are fixed for the process, so resolve them once at import.
+# Formatters hold no per-service state, so every logger shares one.
+_LEVEL = getattr(logging, settings.log_level.value, logging.INFO)
+_FORMATTER: logging.Formatter = (
+    StructuredFormatter() if settings.log_format.lower() == "json" else PlainFormatter()
+)
+_LOG_FILES = (
+    LogFiles.ERROR,
+    LogFiles.WARNING,
+    LogFiles.INFO,
+    LogFiles.DEBUG,
+    LogFiles.AUDIT,
+)
+
 
 class LoggerFactory:
     """Factory for creating logger instances."""
 
-    @staticmethod
-    def create_logger(service_name: str) -> LoggerInterface:
-        """Create a configured logger instance for a service.
+    # One configured logger per service per process; see create_logger
+    _loggers: Dict[str, LoggerInterface] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def create_logger(cls, service_name: str, per_process: bool = False) -> LoggerInterface:
+        """Get the configured logger instance for a service.
+
+        Handlers are built on the first call for a service name; later calls
+        return the same instance instead of reopening the log files. The
+        handlers are owned by a LogDispatcher thread, which is flushed and
+        stopped at interpreter exit.
 
         Args:
             service_name: Name of the service
+            per_process: Write to files suffixed with the process ID (e.g.
+                ``info.<pid>.log``). Required when several processes of a
+                service log to the same directory: each handler tracks the
+                file size in memory and rotates on its own, so shared files
+                would be renamed under the other processes.
 
         Returns:
             Configured ServiceLogger instance
         """
+        existing = cls._loggers.get(service_name)
+        if existing is not None:
+            return existing
+
+        with cls._lock:
+            existing = cls._loggers.get(service_name)
+            if existing is not None:
+                return existing
+            service_logger = cls._build_logger(service_name, per_process)
+            cls._loggers[service_name] = service_logger
+            return service_logger
+
+    @staticmethod
+    def _build_logger(service_name: str, per_process: bool) -> LoggerInterface:
+        """Open a service's log files and start its dispatcher.
+
+        Args:
+            service_name: Name of the service
+            per_process: Suffix the log file names with the process ID
+
+        Returns:
+            New ServiceLogger instance
+        """
         logger = logging.getLogger(service_name)
-        logger.setLevel(getattr(logging, settings.log_level.value, logging.INFO))
+        logger.setLevel(_LEVEL)
         logger.handlers.clear()
 
-        # Determine formatter based on environment
-        use_json = settings.log_format.lower() == "json"
-        formatter = (
-            StructuredFormatter() if use_json else PlainFormatter()
-        )
-
-        # Create handlers for each log file
+        # One handler per log file; each record goes to exactly one of them
         # Logs go into service-specific directory: services/<service_name>/logs/
         service_log_dir = f"services/{service_name}/logs"
         handler_factory = FileLogHandlerFactory()
 
-        # Error log handler
-        error_handler = handler_factory.create_handler(
-            log_file=LogFiles.ERROR,
-            log_directory=service_log_dir,
-            service_name=service_name,
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(formatter)
-        logger.addHandler(error_handler)
-
-        # Info log handler
-        info_handler = handler_factory.create_handler(
-            log_file=LogFiles.INFO,
-            log_directory=service_log_dir,
-            service_name=service_name,
+        file_handlers: Dict[str, logging.Handler] = {}
+        for log_file in _LOG_FILES:
+            if per_process:
+                stem, extension = os.path.splitext(log_file)
+                file_name = f"{stem}.{os.getpid()}{extension}"
+            else:
+                file_name = log_file
+            handler = handler_factory.create_handler(
+                log_file=file_name,
+                log_directory=service_log_dir,
+                service_name=service_name,
+            )
+            handler.setFormatter(_FORMATTER)
+            file_handlers[log_file] = handler
+
+        routing_handler = LevelRoutingHandler(
+            error=file_handlers[LogFiles.ERROR],
+            warning=file_handlers[LogFiles.WARNING],
+            info=file_handlers[LogFiles.INFO],
+            debug=file_handlers[LogFiles.DEBUG],
+            audit=file_handlers[LogFiles.AUDIT],
         )
-        info_handler.setLevel(logging.INFO)
-        info_handler.setFormatter(formatter)
-        logger.addHandler(info_handler)
-
-        # Debug log handler
-        debug_handler = handler_factory.create_handler(
-            log_file=LogFiles.DEBUG,
-            log_directory=service_log_dir,
-            service_name=service_name,
-        )
-        debug_handler.setLevel(logging.DEBUG)
-        debug_handler.setFormatter(formatter)
-        logger.addHandler(debug_handler)
-
-        # Warning log handler
-        warning_handler = handler_factory.create_handler(
-            log_file=LogFiles.WARNING,
-            log_directory=service_log_dir,
-            service_name=service_name,
-        )
-        warning_handler.setLevel(logging.WARNING)
-        warning_handler.setFormatter(formatter)
-        logger.addHandler(warning_handler)
-
-        # Audit log handler (custom level for audit trail)
-        audit_handler = handler_factory.create_handler(
-            log_file=LogFiles.AUDIT,
-            log_directory=service_log_dir,
-            service_name=service_name,
-        )
-        audit_handler.setLevel(logging.INFO)  # Use INFO level for audit
-        audit_handler.setFormatter(formatter)
-        logger.addHandler(audit_handler)
 
-        return ServiceLogger(logger=logger, service_name=service_name)
+        dispatcher = LogDispatcher([routing_handler], name=service_name)
+        dispatcher.start()
+        atexit.register(dispatcher.stop)
+
+        return ServiceLogger(logger=logger, service_name=service_name, dispatcher=dispatcher)
 
@@ -3,34 +3,51 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from shared.types.common_types import JsonDict
+from shared.types.common_types import LogExtra
 
 
 class LoggerInterface(ABC):
-    """Abstract interface for logging functionality."""
+    """Abstract interface for logging functionality.
 
+    Methods are synchronous: implementations hand records off without doing
+    I/O on the caller's thread, so they are safe to call from coroutines.
+    Records below the configured level are dropped before any work is done;
+    callers building costly messages or extras on hot paths can check
+    ``is_debug_enabled`` first.
+    """
+
+    @property
     @abstractmethod
-    async def error(
+    def is_debug_enabled(self) -> bool:
+        """Whether debug messages are currently written."""
+        pass
+
+    @abstractmethod
+    def error(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
+        exc: Optional[BaseException] = None,
     ) -> None:
         """Log an error message.
 
         Args:
             message: The error message to log
             correlation_id: Optional correlation ID for request tracking
-            extra: Optional additional context as dictionary
+            extra: Optional additional context as dictionary, or a callable
+                returning one (only called if the record is written)
+            exc: Optional exception whose traceback is appended; it is
+                formatted off the caller's thread
         """
         pass
 
     @abstractmethod
-    async def info(
+    def info(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
     ) -> None:
         """Log an info message.
 
@@ -42,11 +59,11 @@ class LoggerInterface(ABC):
         pass
 
     @abstractmethod
-    async def debug(
+    def debug(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
     ) -> None:
         """Log a debug message.
 
@@ -58,11 +75,11 @@ class LoggerInterface(ABC):
         pass
 
     @abstractmethod
-    async def warning(
+    def warning(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
     ) -> None:
         """Log a warning message.
 
@@ -74,11 +91,11 @@ class LoggerInterface(ABC):
         pass
 
     @abstractmethod
-    async def audit(
+    def audit(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
     ) -> None:
         """Log an audit message.
 
@@ -3,96 +3,129 @@
 import logging
 from typing import Optional
 
+from shared.logging.log_dispatcher import LogDispatcher
+from shared.logging.log_handlers import LevelRoutingHandler
 from shared.logging.logger_interface import LoggerInterface
-from shared.types.common_types import JsonDict
+from shared.types.common_types import LogExtra
 
 
 class ServiceLogger(LoggerInterface):
     """Concrete implementation of LoggerInterface."""
 
-    def __init__(self, logger: logging.Logger, service_name: str) -> None:
+    def __init__(
+        self, logger: logging.Logger, service_name: str, dispatcher: LogDispatcher
+    ) -> None:
         """Initialize service logger.
 
         Args:
-            logger: Python logging.Logger instance
+            logger: Python logging.Logger instance, used as the level gate
             service_name: Name of the service
+            dispatcher: Dispatcher whose thread writes the records
         """
         self._logger = logger
         self._service_name = service_name
+        self._dispatcher = dispatcher
+        # Bound once; _log runs on every call site's hot path
+        self._name = logger.name
+        self._is_enabled_for = logger.isEnabledFor
+        self._make_record = logger.makeRecord
+        self._submit = dispatcher.submit
+
+    @property
+    def is_debug_enabled(self) -> bool:
+        """Whether debug messages are currently written."""
+        return self._is_enabled_for(logging.DEBUG)
 
     def _log(
         self,
         level: int,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
+        exc: Optional[BaseException] = None,
     ) -> None:
         """Internal logging method.
 
+        Builds the record directly and queues it for the dispatcher thread,
+        bypassing ``Logger.log`` (caller lookup and handler locks).
+
         Args:
             level: Logging level
             message: Log message
             correlation_id: Optional correlation ID
-            extra: Optional extra data
+            extra: Optional extra data, or a callable returning it
+            exc: Optional exception; the record carries the raw exc_info
+                and the dispatcher thread's formatter renders the traceback
         """
+        if not self._is_enabled_for(level):
+            return
+        if callable(extra):
+            extra = extra()
+
+        # Always set, so formatters can read them as plain attributes
         log_extra = {
             "service_name": self._service_name,
+            "correlation_id": correlation_id or "",
+            "extra_data": extra or None,
         }
 
-        if correlation_id:
-            log_extra["correlation_id"] = correlation_id
-
-        if extra:
-            log_extra["extra_data"] = extra
-
-        self._logger.log(level, message, extra=log_extra)
+        exc_info = (type(exc), exc, exc.__traceback__) if exc is not None else None
+        self._submit(
+            self._make_record(self._name, level, "", 0, message, (), exc_info, extra=log_extra)
+        )
 
-    async def error(
+    def error(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
+        exc: Optional[BaseException] = None,
     ) -> None:
         """Log an error message."""
-        self._log(logging.ERROR, message, correlation_id, extra)
+        self._log(logging.ERROR, message, correlation_id, extra, exc)
 
-    async def info(
+    def info(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
     ) -> None:
         """Log an info message."""
         self._log(logging.INFO, message, correlation_id, extra)
 
-    async def debug(
+    def debug(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
     ) -> None:
         """Log a debug message."""
         self._log(logging.DEBUG, message, correlation_id, extra)
 
-    async def warning(
+    def warning(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
     ) -> None:
         """Log a warning message."""
         self._log(logging.WARNING, message, correlation_id, extra)
 
-    async def audit(
+    def audit(
         self,
         message: str,
         correlation_id: Optional[str] = None,
-        extra: Optional[JsonDict] = None,
+        extra: Optional[LogExtra] = None,
     ) -> None:
         """Log an audit message.
 
-        Audit messages are written to the audit.log file.
+        Audit messages are written to the audit.log file only.
         """
-        # Audit uses INFO level but is handled by audit handler
-        self._log(logging.INFO, f"[AUDIT] {message}", correlation_id, extra)
+        # Checked before the prefixed message is built
+        if not self._is_enabled_for(logging.INFO):
+            return
+        # Audit uses INFO level; the prefix routes it to the audit handler
+        self._log(
+            logging.INFO, f"{LevelRoutingHandler.AUDIT_PREFIX} {message}", correlation_id, extra
+        )
 
@@ -67,10 +67,10 @@ class RegistryFactory(Factory[T]):
         Raises:
             ValueError: If key is not registered
         """
-        if key not in self._registry:
+        implementation = self._registry.get(key)
+        if implementation is None:
             raise ValueError(f"No implementation registered for key: {key}")
 
-        implementation = self._registry[key]
         return implementation(*args, **kwargs)
 
     def get_registered_keys(self) -> list[str]:
@@ -1,11 +1,13 @@
 """Common type definitions for the Protego Health Backend System."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 from uuid import UUID
 
 
 # Type aliases for better readability
 JsonDict = Dict[str, Any]
+# Log context given directly or as a callable evaluated only if the record is written
+LogExtra = Union[JsonDict, Callable[[], JsonDict]]
 OptionalStr = Optional[str]
 OptionalUUID = Optional[UUID]
 OptionalInt = Optional[int]
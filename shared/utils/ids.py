@@ -0,0 +1,26 @@
+"""Primary key generation."""
+
+import os
+import time
+from uuid import UUID
+
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The first 48 bits are the Unix time in milliseconds and the rest is
+    random, so keys generated later sort later. New rows then land at the
+    right edge of the primary key B-tree instead of splitting random pages,
+    as uuid4 keys do.
+
+    Returns:
+        Version 7 UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~_VERSION_MASK) | (0x7 << 76)
+    value = (value & ~_VARIANT_MASK) | (0x2 << 62)
+    return UUID(int=value)
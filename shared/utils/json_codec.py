@@ -0,0 +1,32 @@
+"""Fast JSON encoding/decoding shared by the services (backed by orjson)."""
+
+from typing import Any
+
+import orjson
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: Raw JSON, e.g. an HTTP response body
+
+    Returns:
+        Decoded Python object
+    """
+    return orjson.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode an object as a JSON string.
+
+    UUIDs, datetimes and enums are serialized natively. Returns ``str`` for
+    consumers such as SQLAlchemy's JSON type that expect text.
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        JSON text
+    """
+    return orjson.dumps(obj).decode()
@@ -1,7 +1,7 @@
 """Stop words utility for filtering common words from text analysis."""
 
 # Common English stop words to filter out during keyword extraction
-ENGLISH_STOP_WORDS = {
+ENGLISH_STOP_WORDS: frozenset[str] = frozenset({
     # Articles
     "a", "an", "the",
     # Pronouns
@@ -25,14 +25,14 @@ ENGLISH_STOP_WORDS = {
     "when", "where", "why", "how", "what", "who", "which", "whose", "whom",
     # Numbers (common)
     "one", "two", "three", "first", "second", "third",
-}
+})
 
 
-def get_stop_words() -> set[str]:
+def get_stop_words() -> frozenset[str]:
     """Get the set of English stop words.
 
     Returns:
-        Set of stop words to filter during text analysis
+        Shared immutable set of stop words to filter during text analysis
     """
-    return ENGLISH_STOP_WORDS.copy()
+    return ENGLISH_STOP_WORDS
 
@@ -6,7 +6,7 @@ from typing import List, Any, Dict
 def extract_all_text(data: Any) -> str:
     """Extract all text content from nested data structure.
 
-    Recursively traverses dictionaries, lists, and extracts all string values.
+    Traverses dictionaries and lists and extracts all string values.
 
     Args:
         data: Data structure (dict, list, str, or other types)
@@ -14,30 +14,56 @@ def extract_all_text(data: Any) -> str:
     Returns:
         Combined text content as a single string
     """
+    return " ".join(extract_text_parts(data))
+
+
+def extract_text_parts(data: Any) -> List[str]:
+    """Extract all string values from a nested data structure.
+
+    The list only references the existing strings, so callers that add
+    their own parts can join everything once instead of joining twice.
+
+    Args:
+        data: Data structure (dict, list, str, or other types)
+
+    Returns:
+        String values in document order
+    """
     text_parts: List[str] = []
-    _extract_text_recursive(data, text_parts)
-    return " ".join(text_parts)
+    _collect_text(data, text_parts)
+    return text_parts
+
 
+def _collect_text(value: Any, text_parts: List[str]) -> None:
+    """Collect every string in a nested structure, in document order.
 
-def _extract_text_recursive(value: Any, text_parts: List[str]) -> None:
-    """Recursively extract text from nested structures.
+    Walks an explicit stack instead of recursing, so deeply nested payloads
+    cost no extra Python frames and cannot hit the recursion limit.
 
     Args:
         value: Value to extract text from (dict, list, str, or other)
         text_parts: List to accumulate text parts
     """
-    if isinstance(value, str):
-        # Add string value directly
-        text_parts.append(value)
-    elif isinstance(value, dict):
-        # Recursively process dictionary values
-        for item_value in value.values():
-            _extract_text_recursive(item_value, text_parts)
-    elif isinstance(value, list):
-        # Recursively process list items
-        for item in value:
-            _extract_text_recursive(item, text_parts)
-    # Ignore other types (int, float, bool, None, etc.)
+    stack: List[Any] = [value]
+    while stack:
+        item = stack.pop()
+        # Exact type checks for the JSON-decoded common case, isinstance
+        # for subclasses
+        item_type = type(item)
+        if item_type is str:
+            text_parts.append(item)
+        elif item_type is dict:
+            # Pushed reversed so values pop in their original order
+            stack.extend(reversed(item.values()))
+        elif item_type is list:
+            stack.extend(reversed(item))
+        elif isinstance(item, str):
+            text_parts.append(item)
+        elif isinstance(item, dict):
+            stack.extend(reversed(item.values()))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+        # Ignore other types (int, float, bool, None, etc.)
 
 
 def extract_text_from_dict(data: Dict[str, Any]) -> List[str]:
@@ -52,7 +78,7 @@ def extract_text_from_dict(data: Dict[str, Any]) -> List[str]:
     text_parts: List[str] = []
 
     for value in data.values():
-        _extract_text_recursive(value, text_parts)
+        _collect_text(value, text_parts)
 
     return text_parts
 
@@ -0,0 +1,29 @@
+"""Tests for keyset pagination cursors."""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from services.api.src.errors.api_errors import APIValidationError
+from services.api.src.handlers.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    """A cursor decodes back to the position it was built from."""
+    created_at = datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc)
+    result_id = UUID("01890a5d-ac96-774b-bcce-b302099a8057")
+
+    assert decode_cursor(encode_cursor(created_at, result_id)) == (created_at, result_id)
+
+
+def test_malformed_cursor_raises_validation_error() -> None:
+    """A malformed cursor is a 400 carrying its own error code and details."""
+    with pytest.raises(APIValidationError) as exc_info:
+        decode_cursor("bad")
+
+    error = exc_info.value
+    assert error.message == "Invalid pagination cursor"
+    assert error.error_code == "INVALID_CURSOR"
+    assert error.details == {"cursor": "bad"}
+    assert error.status_code == 400